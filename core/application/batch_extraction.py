@@ -0,0 +1,69 @@
+"""
+Application layer:
+Batch extraction (actions + dates) over many transcripts.
+
+Documents are sent to a process pool in chunks, with a bounded number of
+chunks in flight, and results are yielded in input order. Output depends
+only on the documents and the reference date, so runs are reproducible.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.domain.extraction_service import RuleDateExtractor
+
+ExtractionResult = Tuple[List[str], List[Dict[str, str]]]
+
+_worker_extractor: Optional[RuleDateExtractor] = None
+
+
+def _extract_chunk(texts: List[str], reference_date: date) -> List[ExtractionResult]:
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = RuleDateExtractor()
+    return [_worker_extractor.extract(t, reference_date) for t in texts]
+
+
+def _chunks(documents: Iterable[str], size: int) -> Iterator[List[str]]:
+    it = iter(documents)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def extract_batch(
+    documents: Iterable[str],
+    reference_date: date,
+    workers: Optional[int] = None,
+    chunksize: int = 32,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[ExtractionResult]:
+    """
+    Extract (actions, dates) for every document, yielded in input order.
+
+    ``documents`` is consumed lazily: at most ``max_in_flight`` chunks of
+    ``chunksize`` documents are queued at once (default: 4 per worker).
+    ``workers=1`` runs in-process, without a pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(documents, chunksize)
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from _extract_chunk(chunk, reference_date)
+        return
+
+    max_in_flight = max_in_flight or workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_extract_chunk, chunk, reference_date))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,321 @@
+"""
+Application layer: live recording sessions.
+
+Audio chunks arrive while the meeting is still being recorded. Each
+session feeds them to one streaming decoder and a worker thread that
+- transcribes overlapping windows as soon as they are complete,
+- extracts actions/dates from every finished sentence,
+- summarises every closed chunk (map stage).
+On stop only the tail window, the last chunk and the reduce tree remain.
+"""
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from core.domain.summarisation_service import Chunker, StreamingChunker
+from core.infrastructure.audio_io import LiveDecoder, SilenceTrimmer, rebuffer
+
+logger = logging.getLogger(__name__)
+
+# Whisper models expect 16 kHz input
+LIVE_SAMPLING_RATE = 16000
+# Decoder output is re-cut into blocks of this length (at least the VAD's
+# minimum silence) so the trimmer and ASR windows don't see tiny reads
+LIVE_BLOCK_S = 1.0
+
+
+class SessionLimitError(Exception):
+    """Raised when the maximum number of live sessions is already open."""
+
+
+class LiveSession:
+    STATUS_RECORDING = "recording"
+    STATUS_FINALIZING = "finalizing"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    def __init__(
+        self,
+        models,
+        extractor,
+        min_len: int,
+        max_len: int,
+        on_event: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        max_text_length: Optional[int] = None,
+        max_audio_s: Optional[float] = None,
+    ):
+        self.id = uuid.uuid4().hex
+        self.models = models
+        self.extractor = extractor
+        self.min_len = min_len
+        self.max_len = max_len
+        self.max_text_length = max_text_length
+        self.max_audio_s = max_audio_s
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = [on_event] if on_event else []
+
+        self.status = self.STATUS_RECORDING
+        self.error = ""
+        self.next_seq = 0
+        self.last_active = time.monotonic()
+
+        self.segments: List[Dict[str, Any]] = []
+        self.partials: List[str] = []
+        self.actions: List[str] = []
+        self.dates: List[Dict[str, str]] = []
+        self.result: Optional[Dict[str, Any]] = None
+
+        self._lock = threading.Lock()
+        self._sentence_buf = ""
+        self._seen_dates = set()
+        self._decoder = LiveDecoder(sampling_rate=LIVE_SAMPLING_RATE)
+        self._worker = threading.Thread(target=self._run, name="live-session", daemon=True)
+        self._worker.start()
+
+    # ---------- input ----------
+    def add_chunk(self, seq: int, data: bytes) -> None:
+        with self._lock:
+            if self.status != self.STATUS_RECORDING:
+                raise ValueError("Session is %s, not accepting audio" % self.status)
+            if seq != self.next_seq:
+                raise ValueError("Expected chunk %d, got %d" % (self.next_seq, seq))
+            self.next_seq += 1
+            self.last_active = time.monotonic()
+        self._decoder.feed(data)
+
+    def end_input(self) -> None:
+        """End of recording; processing finishes in the background."""
+        with self._lock:
+            if self.status == self.STATUS_RECORDING:
+                self.status = self.STATUS_FINALIZING
+            self.last_active = time.monotonic()
+        self._decoder.close()
+
+    def stop(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """End of recording: wait for the final summary."""
+        self.end_input()
+        self._worker.join(timeout)
+        return self.snapshot()
+
+    def abort(self) -> None:
+        with self._lock:
+            if self.status in (self.STATUS_RECORDING, self.STATUS_FINALIZING):
+                self.status = self.STATUS_FAILED
+                self.error = "Session aborted."
+        self._decoder.kill()
+
+    # ---------- events ----------
+    def subscribe(self, listener: Callable[[str, Dict[str, Any]], None]) -> Dict[str, Any]:
+        """
+        Call ``listener(kind, data)`` for every future event (from the
+        worker thread) and return the current state to start from. An
+        event racing with the subscription may show up in both.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+        return self.snapshot()
+
+    def unsubscribe(self, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _emit(self, event: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event, data)
+            except Exception:
+                logger.exception("Live session event handler failed")
+
+    # ---------- worker ----------
+    def _extract_finished_sentences(self, text: str, final: bool = False) -> None:
+        buf = (self._sentence_buf + " " + text).strip() if text else self._sentence_buf
+        spans = Chunker.sentence_spans(buf)
+        if not spans:
+            self._sentence_buf = ""
+            return
+        # The last sentence may still be growing unless the stream ended
+        cut = len(buf) if final else spans[-1][0]
+        self._sentence_buf = buf[cut:]
+        if cut == 0:
+            return
+        actions, dates = self.extractor.extract(buf[:cut])
+        dates = [d for d in dates if (d["date"], d["context"]) not in self._seen_dates]
+        self._seen_dates.update((d["date"], d["context"]) for d in dates)
+        if actions or dates:
+            with self._lock:
+                self.actions.extend(actions)
+                self.dates.extend(dates)
+            self._emit("extraction", {"actions": actions, "dates": dates})
+
+    def _summarize_chunks(self, summarizer, chunks: List[str]) -> None:
+        if not chunks:
+            return
+        partials = summarizer.summarize_batch(chunks, min_len=self.min_len, max_len=self.max_len)
+        with self._lock:
+            start = len(self.partials)
+            self.partials.extend(partials)
+        for i, partial in enumerate(partials, start):
+            self._emit("partial_summary", {"index": i, "summary": partial})
+
+    def _audio_blocks(self, trimmer: Optional[SilenceTrimmer]) -> Iterator[np.ndarray]:
+        block_len = int(LIVE_BLOCK_S * LIVE_SAMPLING_RATE)
+        if trimmer is not None:
+            block_len = max(block_len, trimmer.min_silence_frames * trimmer.frame_len)
+        samples = 0
+        for block in rebuffer(self._decoder.blocks(), block_len):
+            samples += len(block)
+            if self.max_audio_s is not None and samples > self.max_audio_s * LIVE_SAMPLING_RATE:
+                raise ValueError(
+                    "Recording too long. Maximum allowed is %d minutes." % (self.max_audio_s // 60)
+                )
+            yield block
+
+    def _run(self) -> None:
+        try:
+            with self.models.use("transcriber") as transcriber, self.models.use("summarizer") as summarizer:
+                trimmer = transcriber.make_trimmer() if transcriber.vad else None
+                chunker = StreamingChunker(summarizer.chunk)
+                length = 0  # of the transcript so far (joined with spaces)
+
+                for seg in transcriber.transcribe_blocks(self._audio_blocks(trimmer), trimmer=trimmer):
+                    length += len(seg["text"]) + 1
+                    if self.max_text_length is not None and length - 1 > self.max_text_length:
+                        raise ValueError(
+                            "Transcript too long. Maximum allowed is %d characters." % self.max_text_length
+                        )
+                    with self._lock:
+                        self.segments.append(seg)
+                    self._emit("segment", seg)
+                    self._extract_finished_sentences(seg["text"])
+                    self._summarize_chunks(summarizer, chunker.feed(seg["text"]))
+
+                with self._lock:
+                    if self.status == self.STATUS_FAILED:
+                        return
+                self._extract_finished_sentences("", final=True)
+                self._summarize_chunks(summarizer, chunker.flush())
+                self._finalize(summarizer)
+        except Exception as e:
+            logger.exception("Live session %s failed: %s", self.id, e)
+            with self._lock:
+                if self.status != self.STATUS_FAILED:
+                    self.status = self.STATUS_FAILED
+                    self.error = str(e)
+            self._decoder.kill()  # no more input is accepted; stop decoding it
+            self._emit("failed", {"error": self.error})
+
+    def _finalize(self, summarizer) -> None:
+        started = time.perf_counter()
+        transcript = " ".join(seg["text"] for seg in self.segments).strip()
+        stats = summarizer.new_stats(self.max_len)
+        stats["chunks"] = len(self.partials)
+        stats["live"] = True
+        if transcript:
+            summary = summarizer.reduce_tree(list(self.partials), stats, self.min_len, self.max_len)
+            # One full pass so the final lists match offline processing
+            actions, dates = self.extractor.extract(transcript)
+        else:
+            summary, actions, dates = "No content provided.", [], []
+        stats["finalize_seconds"] = round(time.perf_counter() - started, 4)
+
+        with self._lock:
+            self.actions, self.dates = actions, dates
+            self.result = {
+                "transcript": transcript,
+                "summary": summary,
+                "actions": actions,
+                "dates": dates,
+                "segments": list(self.segments),
+                "summary_stats": stats,
+            }
+            self.status = self.STATUS_DONE
+        self._emit("done", self.result)
+
+    # ---------- reporting ----------
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            data = {
+                "session_id": self.id,
+                "status": self.status,
+                "chunks_received": self.next_seq,
+                "transcript": " ".join(seg["text"] for seg in self.segments).strip(),
+                "segments": len(self.segments),
+                "partial_summaries": list(self.partials),
+                "actions": list(self.actions),
+                "dates": list(self.dates),
+            }
+            if self.result is not None:
+                data["result"] = self.result
+            if self.error:
+                data["error"] = self.error
+            return data
+
+
+class LiveSessionManager:
+    """
+    Open live sessions by ID. Sessions idle for longer than
+    ``idle_timeout_s`` are aborted and dropped on the next call.
+    """
+
+    def __init__(
+        self,
+        models,
+        extractor,
+        min_len: int,
+        max_len: int,
+        max_sessions: int = 4,
+        idle_timeout_s: float = 600,
+        max_text_length: Optional[int] = None,
+        max_audio_s: Optional[float] = None,
+    ):
+        self.models = models
+        self.extractor = extractor
+        self.min_len = min_len
+        self.max_len = max_len
+        self.max_sessions = max_sessions
+        self.idle_timeout_s = idle_timeout_s
+        self.max_text_length = max_text_length
+        self.max_audio_s = max_audio_s
+        self._sessions: Dict[str, LiveSession] = {}
+        self._lock = threading.Lock()
+
+    def _prune(self) -> None:
+        # Caller holds self._lock
+        now = time.monotonic()
+        for sid, session in list(self._sessions.items()):
+            if session.status == LiveSession.STATUS_FINALIZING:
+                continue  # still working, not abandoned
+            if now - session.last_active > self.idle_timeout_s:
+                session.abort()
+                del self._sessions[sid]
+
+    def start(self, on_event: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> LiveSession:
+        with self._lock:
+            self._prune()
+            active = [s for s in self._sessions.values() if s.status in (LiveSession.STATUS_RECORDING, LiveSession.STATUS_FINALIZING)]
+            if len(active) >= self.max_sessions:
+                raise SessionLimitError("Too many live recordings in progress, please retry shortly.")
+            session = LiveSession(
+                self.models, self.extractor, self.min_len, self.max_len, on_event,
+                max_text_length=self.max_text_length,
+                max_audio_s=self.max_audio_s,
+            )
+            self._sessions[session.id] = session
+            return session
+
+    def get(self, session_id: str) -> LiveSession:
+        with self._lock:
+            self._prune()
+            return self._sessions[session_id]
+
+    def discard(self, session_id: str) -> None:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is not None:
+            session.abort()
@@ -1,63 +1,699 @@
-from typing import List, Dict, Tuple, Optional
+import queue
+import threading
+import time
+from datetime import date
+from typing import BinaryIO, List, Dict, Tuple, Optional, Any, Iterator, Callable
 
 from core.config import (
+    ASR_MODEL_NAME,
+    ASR_VAD_ENABLED,
+    ASR_VAD_THRESHOLD_DB,
+    ASR_VAD_MIN_SILENCE_S,
+    SUMMARIZER_MODEL_NAME,
     SUMMARIZER_MIN_LEN,
     SUMMARIZER_MAX_LEN,
+    CHUNK_MODE,
+    CHUNK_MAX_CHARS,
+    CHUNK_MAX_TOKENS,
     MAX_TEXT_LENGTH,
+    RESULT_CACHE_SIZE,
+    RESULT_CACHE_DIR,
+    RESULT_CACHE_DISK_MAX_MB,
+    EXPORT_CACHE_DIR,
+    EXPORT_CACHE_MAX_MB,
+    SUMMARY_CHUNK_CACHE_SIZE,
+    SUMMARIZER_BATCH_SIZE,
+    EXTRACTIVE_KEEP_RATIO,
+    EXTRACTIVE_METHOD,
+    SUMMARIZER_BACKEND,
+    SUMMARIZER_MICRO_BATCHING,
+    SUMMARIZER_BATCH_WAIT_MS,
+    AUDIO_PIPELINED,
+    MODEL_IDLE_TTL_S,
+    MODEL_WARMUP_ON_START,
+    INFERENCE_WORKERS,
+    INFERENCE_TORCH_THREADS,
+    INFERENCE_MAX_QUEUED,
+    INFERENCE_QUEUE_TIMEOUT_S,
+    INFERENCE_CALL_TIMEOUT_S,
+    ASR_INFERENCE_MODE,
+    SUMMARIZER_INFERENCE_MODE,
+    TORCH_INTRA_OP_THREADS,
+    TORCH_INTER_OP_THREADS,
+    LIVE_MAX_SESSIONS,
+    LIVE_SESSION_IDLE_TIMEOUT_S,
+    LIVE_MAX_AUDIO_S,
+)
+from core.domain.summarisation_service import (
+    BartSummarizer,
+    ExtractiveSummarizer,
+    ProgressCallback,
+    StreamingChunker,
 )
-from core.domain.summarisation_service import BartSummarizer
 from core.domain.extraction_service import RuleDateExtractor
+from core.domain.batching import MicroBatcher
 from core.infrastructure.asr_service import WhisperLocalTranscriber
-from core.infrastructure.export_service import export_meeting_to_pdf
+from core.infrastructure.audio_io import probe_duration
+from core.infrastructure.export_service import export_meeting_to_pdf_file
+from core.infrastructure.exporters import Exporter, get_exporter
+from core.infrastructure.cache_service import (
+    FileCache,
+    ResultCache,
+    hash_file,
+    hash_json,
+    hash_text,
+    make_key,
+)
+from core.infrastructure.model_registry import ModelRegistry
+from core.infrastructure.inference_pool import InferencePool
+from core.infrastructure.inference_modes import apply_inference_mode, configure_torch_threads
+from core.application.live_session import LiveSessionManager
+
+# ML services are registered here and built lazily on first use
+# (can be swapped: maintainability/extensibility)
+_chunk_cache = ResultCache(max_items=SUMMARY_CHUNK_CACHE_SIZE)  # outlives model unloads
+# Off in pool mode: each worker runs one call at a time, so its batcher
+# would never see two callers and only add the wait to every batch
+_batcher = (
+    MicroBatcher(SUMMARIZER_BATCH_SIZE, SUMMARIZER_BATCH_WAIT_MS)
+    if SUMMARIZER_MICRO_BATCHING and INFERENCE_WORKERS <= 0 else None
+)
+
+
+def _load_transcriber() -> WhisperLocalTranscriber:
+    configure_torch_threads(TORCH_INTRA_OP_THREADS, TORCH_INTER_OP_THREADS)
+    transcriber = WhisperLocalTranscriber()
+    transcriber.inference_mode = apply_inference_mode(transcriber.pipe, ASR_INFERENCE_MODE)
+    return transcriber
+
+
+def _load_summarizer() -> BartSummarizer:
+    configure_torch_threads(TORCH_INTRA_OP_THREADS, TORCH_INTER_OP_THREADS)
+    summarizer = BartSummarizer(chunk_cache=_chunk_cache, batcher=_batcher)
+    summarizer.inference_mode = apply_inference_mode(summarizer.pipe, SUMMARIZER_INFERENCE_MODE)
+    return summarizer
+
+
+_models = ModelRegistry(idle_ttl_s=MODEL_IDLE_TTL_S)
+_models.register("transcriber", _load_transcriber, warmup=lambda m: m.warm_up())
+_models.register("summarizer", _load_summarizer, warmup=lambda m: m.warm_up())
 
-# Instantiate ML services once (can be swapped: maintainability/extensibility)
-_transcriber = WhisperLocalTranscriber()
-_summarizer = BartSummarizer()
 _extractor = RuleDateExtractor()
+_extractive = ExtractiveSummarizer()  # model-free, runs in this process
+
+# Live recordings run on this process's models (they keep per-session state)
+_live_sessions = LiveSessionManager(
+    _models,
+    _extractor,
+    SUMMARIZER_MIN_LEN,
+    SUMMARIZER_MAX_LEN,
+    max_sessions=LIVE_MAX_SESSIONS,
+    idle_timeout_s=LIVE_SESSION_IDLE_TIMEOUT_S,
+    max_text_length=MAX_TEXT_LENGTH,
+    max_audio_s=LIVE_MAX_AUDIO_S,
+)
+
+# "bart": abstractive (slow, best quality); "extractive": instant, model-free
+SUMMARIZER_BACKENDS = ("bart", "extractive")
+
+# on_draft(transcript, summary, actions, dates, stats): instant extractive result
+DraftCallback = Callable[[str, str, List[str], List[Dict[str, str]], Dict[str, Any]], None]
+
+_result_cache = ResultCache(
+    max_items=RESULT_CACHE_SIZE,
+    disk_dir=RESULT_CACHE_DIR,
+    disk_max_bytes=RESULT_CACHE_DISK_MAX_MB * 1024 * 1024,
+)
+_export_cache = FileCache(EXPORT_CACHE_DIR, EXPORT_CACHE_MAX_MB * 1024 * 1024, suffix=".pdf")
+
+# With INFERENCE_WORKERS > 0, model calls run in worker processes that each
+# hold their own copy of the models; this process only caches and dispatches.
+_pool: Optional[InferencePool] = None
+_pool_lock = threading.Lock()
+
+
+def _init_inference_worker() -> None:
+    # The pool already set this worker's intra-op budget
+    configure_torch_threads(0, TORCH_INTER_OP_THREADS)
+    if MODEL_WARMUP_ON_START:
+        _models.warm_up()
+
+
+def _get_pool() -> Optional[InferencePool]:
+    global _pool
+    if INFERENCE_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = InferencePool(
+                INFERENCE_WORKERS,
+                max_queued=INFERENCE_MAX_QUEUED,
+                torch_threads=INFERENCE_TORCH_THREADS or None,
+                worker_init=_init_inference_worker,
+                acquire_timeout=INFERENCE_QUEUE_TIMEOUT_S,
+                call_timeout=INFERENCE_CALL_TIMEOUT_S or None,
+            )
+        return _pool
+
+
+def _cache_params() -> List[Any]:
+    # Relative dates ("next Friday") depend on today, so it is part of the key.
+    return [
+        SUMMARIZER_MODEL_NAME,
+        SUMMARIZER_INFERENCE_MODE,
+        SUMMARIZER_MIN_LEN,
+        SUMMARIZER_MAX_LEN,
+        CHUNK_MODE,
+        CHUNK_MAX_CHARS,
+        CHUNK_MAX_TOKENS,
+        EXTRACTIVE_KEEP_RATIO,
+        EXTRACTIVE_METHOD,
+        date.today().isoformat(),
+    ]
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the result cache."""
+    return _result_cache.stats()
+
+
+def export_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the rendered export cache."""
+    return _export_cache.stats()
+
+
+def batching_stats() -> Dict[str, Any]:
+    """Batch fill ratio and queueing delay of the summariser micro-batcher."""
+    return _batcher.stats() if _batcher is not None else {}
+
+
+def warm_up_models(names: Optional[List[str]] = None) -> None:
+    """
+    Load models (default: all) and run a dummy input through each.
+    In pool mode this starts the workers, which warm up their own models.
+    """
+    pool = _get_pool()
+    if pool is not None:
+        pool.start_workers()
+    else:
+        _models.warm_up(names)
+
 
+def model_stats() -> Dict[str, Dict[str, Any]]:
+    """Load time, resident size and usage per registered model (or pool)."""
+    pool = _get_pool()
+    if pool is not None:
+        return {"inference_pool": pool.stats()}
+    return _models.stats()
 
-def summarize_from_text(text: str) -> Tuple[str, List[str], List[Dict[str, str]]]:
+
+def _check_length(text: str) -> None:
+    if len(text) > MAX_TEXT_LENGTH:
+        raise _too_long()
+
+
+def _too_long() -> ValueError:
+    return ValueError(
+        "Text input too long. Maximum allowed is %d characters." % MAX_TEXT_LENGTH
+    )
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    backend = backend or SUMMARIZER_BACKEND
+    if backend not in SUMMARIZER_BACKENDS:
+        raise ValueError("Unknown summarizer backend: %s" % backend)
+    return backend
+
+
+def _run_inference(
+    task: str,
+    arg: str,
+    progress: Optional[ProgressCallback],
+    on_draft: Optional[DraftCallback] = None,
+) -> Any:
+    """Run a model task in the inference pool if enabled, else in-process."""
+    pool = _get_pool()
+    if pool is not None:
+        return pool.run(_inference_task, task, arg, progress=progress, on_draft=on_draft)
+    return _inference_task(task, arg, progress=progress, on_draft=on_draft)
+
+
+def _inference_task(
+    task: str,
+    arg: str,
+    progress: Optional[ProgressCallback] = None,
+    on_draft: Optional[DraftCallback] = None,
+) -> Any:
+    # Module-level so the pool can pickle it by reference
+    if task == "text":
+        return _summarize_text_local(arg, progress)
+    if task == "audio":
+        return _process_audio_local(arg, progress, on_draft)
+    if task == "transcribe":
+        return _transcribe_local(arg, progress)
+    raise ValueError("Unknown inference task: %s" % task)
+
+
+def summarize_from_text_with_stats(
+    text: str,
+    progress: Optional[ProgressCallback] = None,
+    backend: Optional[str] = None,
+    on_draft: Optional[DraftCallback] = None,
+) -> Tuple[str, List[str], List[Dict[str, str]], Dict[str, Any]]:
     """
     Application layer:
-    Text → Summary + Extraction
+    Text → Summary + Extraction, plus reduce-tree stats
+    (chunks, fan-in, depth, per-level timings).
+
+    ``backend`` overrides SUMMARIZER_BACKEND for this call. With "bart",
+    ``on_draft`` first receives the instant extractive result so callers
+    can show it until the abstractive summary is ready.
     """
+    backend = _resolve_backend(backend)
     text = (text or "").strip()
     if not text:
-        return "No content provided.", [], []
+        return "No content provided.", [], [], {}
 
-    if len(text) > MAX_TEXT_LENGTH:
-        raise ValueError(
-            "Text input too long. Maximum allowed is %d characters." % MAX_TEXT_LENGTH
+    _check_length(text)
+
+    key = make_key("text", hash_text(text), _cache_params() + [backend])
+    cached = _result_cache.get(key)
+    if cached is not None:
+        return cached["summary"], cached["actions"], cached["dates"], cached["stats"]
+
+    if backend == "extractive":
+        summary, actions, dates, stats = _summarize_extractive(text)
+    else:
+        if on_draft is not None:
+            on_draft(text, *_summarize_extractive(text))
+        summary, actions, dates, stats = _run_inference("text", text, progress)
+    _result_cache.set(key, {
+        "summary": summary,
+        "actions": actions,
+        "dates": dates,
+        "stats": stats,
+    })
+    return summary, actions, dates, stats
+
+
+def _summarize_text_local(
+    text: str,
+    progress: Optional[ProgressCallback] = None,
+) -> Tuple[str, List[str], List[Dict[str, str]], Dict[str, Any]]:
+    with _models.use("summarizer") as summarizer:
+        summary, stats = summarizer.summarize_tree(
+            text,
+            min_len=SUMMARIZER_MIN_LEN,
+            max_len=SUMMARIZER_MAX_LEN,
+            progress=progress,
         )
+    if progress:
+        progress("extract", 0, 1)
+    actions, dates = _extractor.extract(text)
+    return summary, actions, dates, stats
 
-    summary = _summarizer.summarize(
-        text,
-        min_len=SUMMARIZER_MIN_LEN,
-        max_len=SUMMARIZER_MAX_LEN,
-    )
+
+def _summarize_extractive(text: str) -> Tuple[str, List[str], List[Dict[str, str]], Dict[str, Any]]:
+    summary, stats = _extractive.summarize_tree(text, SUMMARIZER_MIN_LEN, SUMMARIZER_MAX_LEN)
     actions, dates = _extractor.extract(text)
+    return summary, actions, dates, stats
+
+
+def summarize_from_text(
+    text: str,
+    backend: Optional[str] = None,
+) -> Tuple[str, List[str], List[Dict[str, str]]]:
+    """
+    Application layer:
+    Text → Summary + Extraction
+    """
+    summary, actions, dates, _ = summarize_from_text_with_stats(text, backend=backend)
     return summary, actions, dates
 
 
+def process_audio_with_stats(
+    audio_path: str,
+    progress: Optional[ProgressCallback] = None,
+    backend: Optional[str] = None,
+    on_draft: Optional[DraftCallback] = None,
+) -> Tuple[str, str, List[str], List[Dict[str, str]], Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Application layer:
+    Audio → Transcript → Summary + Extraction, plus reduce-tree stats and
+    the transcript's timestamped segments ({"start", "end", "text"})
+
+    With "bart", ``on_draft`` receives the extractive result as soon as the
+    transcript is complete, before the abstractive summary is finished.
+    """
+    backend = _resolve_backend(backend)
+    asr_params = [ASR_MODEL_NAME, ASR_INFERENCE_MODE, ASR_VAD_ENABLED, ASR_VAD_THRESHOLD_DB, ASR_VAD_MIN_SILENCE_S]
+    key = make_key("audio", hash_file(audio_path), asr_params + _cache_params() + [backend])
+    cached = _result_cache.get(key)
+    if cached is not None:
+        return (
+            cached["transcript"],
+            cached["summary"],
+            cached["actions"],
+            cached["dates"],
+            cached["stats"],
+            cached.get("segments", []),
+        )
+
+    if backend == "extractive":
+        transcript, segments, vad = _run_inference("transcribe", audio_path, progress)
+        if not transcript:
+            return transcript, "No content provided.", [], [], {}, []
+        _check_length(transcript)
+        summary, actions, dates, stats = _summarize_extractive(transcript)
+        if vad:
+            stats["vad"] = vad
+    else:
+        transcript, summary, actions, dates, stats, segments = _run_inference(
+            "audio", audio_path, progress, on_draft
+        )
+    _result_cache.set(key, {
+        "transcript": transcript,
+        "summary": summary,
+        "actions": actions,
+        "dates": dates,
+        "stats": stats,
+        "segments": segments,
+    })
+    return transcript, summary, actions, dates, stats, segments
+
+
+def _process_audio_local(
+    audio_path: str,
+    progress: Optional[ProgressCallback] = None,
+    on_draft: Optional[DraftCallback] = None,
+) -> Tuple[str, str, List[str], List[Dict[str, str]], Dict[str, Any], List[Dict[str, Any]]]:
+    if AUDIO_PIPELINED:
+        return _process_audio_pipelined(audio_path, progress, on_draft)
+
+    transcript, segments, vad = _transcribe_local(audio_path, progress)
+    if not transcript:
+        return transcript, "No content provided.", [], [], {}, []
+    _check_length(transcript)
+    if on_draft is not None:
+        on_draft(transcript, *_summarize_extractive(transcript))
+    summary, actions, dates, stats = _summarize_text_local(transcript, progress)
+    if vad:
+        stats["vad"] = vad
+    return transcript, summary, actions, dates, stats, segments
+
+
+def _transcribe_local(
+    audio_path: str,
+    progress: Optional[ProgressCallback] = None,
+) -> Tuple[str, List[Dict[str, Any]], Dict[str, float]]:
+    """Transcript, its segments and the VAD's skipped-audio stats ({} if off)."""
+    if progress:
+        progress("transcribe", 0, 1)
+    with _models.use("transcriber") as transcriber:
+        trimmer = transcriber.make_trimmer() if transcriber.vad else None
+        transcript, segments = transcriber.transcribe_segments(audio_path, trimmer=trimmer)
+    return transcript.strip(), segments, trimmer.stats() if trimmer is not None else {}
+
+
+def stream_transcript(audio_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Application layer:
+    Audio → timestamped transcript segments, yielded as they are decoded
+    """
+    with _models.use("transcriber") as transcriber:
+        yield from transcriber.transcribe_stream(audio_path)
+
+
+def _process_audio_pipelined(
+    audio_path: str,
+    progress: Optional[ProgressCallback] = None,
+    on_draft: Optional[DraftCallback] = None,
+) -> Tuple[str, str, List[str], List[Dict[str, str]], Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Audio → Transcript → Summary with ASR and summarisation overlapped.
+
+    A producer thread streams transcript segments; this thread packs them
+    into chunks as soon as a chunk is complete and summarises them while
+    ASR keeps running. Only the reduce tree (and the extractive draft, if
+    requested) waits for the end of audio.
+    """
+    with _models.use("transcriber") as transcriber, _models.use("summarizer") as summarizer:
+        return _run_audio_pipeline(audio_path, transcriber, summarizer, progress, on_draft)
+
+
+def _run_audio_pipeline(
+    audio_path: str,
+    transcriber: WhisperLocalTranscriber,
+    summarizer: BartSummarizer,
+    progress: Optional[ProgressCallback],
+    on_draft: Optional[DraftCallback] = None,
+) -> Tuple[str, str, List[str], List[Dict[str, str]], Dict[str, Any], List[Dict[str, Any]]]:
+    incoming: "queue.Queue[Any]" = queue.Queue()
+    end_of_audio = object()
+    errors: List[BaseException] = []
+    cancelled = threading.Event()  # set when the transcript is already too long
+
+    trimmer = transcriber.make_trimmer() if transcriber.vad else None
+    # Progress is audio seconds transcribed (and summarised) of the whole
+    # recording; without a probed duration it is reported with no total
+    duration = probe_duration(audio_path) if progress else None
+    total_s = int(round(duration)) if duration else 0
+
+    def produce() -> None:
+        try:
+            for seg in transcriber.transcribe_stream(audio_path, trimmer=trimmer):
+                if cancelled.is_set():
+                    break
+                incoming.put(seg)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            incoming.put(end_of_audio)
+
+    started = time.perf_counter()
+    producer = threading.Thread(target=produce, name="asr-producer", daemon=True)
+    producer.start()
+
+    chunker = StreamingChunker(summarizer.chunk)
+    segments: List[Dict[str, Any]] = []
+    length = 0  # of the transcript so far (joined with spaces)
+    partials: List[str] = []
+    map_seconds = 0.0
+    finished = False
+
+    while not finished:
+        # Block for the next segment, then drain whatever else is queued so
+        # chunks that became ready meanwhile are summarised as one batch.
+        items = [incoming.get()]
+        while True:
+            try:
+                items.append(incoming.get_nowait())
+            except queue.Empty:
+                break
+
+        ready: List[str] = []
+        for item in items:
+            if item is end_of_audio:
+                finished = True
+                continue
+            segments.append(item)
+            length += len(item["text"]) + 1
+            if length - 1 > MAX_TEXT_LENGTH:
+                # Stop ASR after its current window and skip the remaining map work
+                cancelled.set()
+                producer.join()
+                raise _too_long()
+            ready.extend(chunker.feed(item["text"]))
+        if finished:
+            ready.extend(chunker.flush())
+
+        if ready:
+            t0 = time.perf_counter()
+            partials.extend(summarizer.summarize_batch(
+                ready, min_len=SUMMARIZER_MIN_LEN, max_len=SUMMARIZER_MAX_LEN
+            ))
+            map_seconds += time.perf_counter() - t0
+        if progress and segments:
+            done_s = int(segments[-1]["end"])
+            progress("transcribe+summarize", min(done_s, total_s) if total_s else done_s, total_s)
+
+    producer.join()
+    if errors:
+        raise errors[0]
+    asr_seconds = time.perf_counter() - started
+
+    transcript = " ".join(seg["text"] for seg in segments).strip()
+    if not transcript:
+        return "", "No content provided.", [], [], {}, []
+    _check_length(transcript)
+    if on_draft is not None:
+        on_draft(transcript, *_summarize_extractive(transcript))
+
+    stats = summarizer.new_stats(SUMMARIZER_MAX_LEN)
+    stats["chunks"] = len(partials)
+    stats["pipelined"] = True
+    stats["asr_seconds"] = round(asr_seconds, 4)
+    if trimmer is not None:
+        stats["vad"] = trimmer.stats()
+    stats["levels"].append({
+        "level": 0,
+        "inputs": len(partials),
+        "outputs": len(partials),
+        "seconds": round(map_seconds, 4),
+    })
+    summary = summarizer.reduce_tree(
+        partials, stats, SUMMARIZER_MIN_LEN, SUMMARIZER_MAX_LEN, progress
+    )
+
+    if progress:
+        progress("extract", 0, 1)
+    actions, dates = _extractor.extract(transcript)
+    return transcript, summary, actions, dates, stats, segments
+
+
+def start_live_session(
+    on_event: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> str:
+    """
+    Application layer:
+    Live recording → session ID. Audio chunks are then added in order
+    with add_live_chunk; ``on_event(kind, data)`` receives "segment",
+    "extraction", "partial_summary", "done" and "failed" events.
+    """
+    return _live_sessions.start(on_event).id
+
+
+def add_live_chunk(session_id: str, seq: int, data: bytes) -> Dict[str, Any]:
+    """Feed chunk ``seq`` of a live recording; returns the running state."""
+    session = _live_sessions.get(session_id)
+    session.add_chunk(seq, data)
+    return session.snapshot()
+
+
+def live_session_state(session_id: str) -> Dict[str, Any]:
+    """Running transcript, actions, dates and partial summaries."""
+    return _live_sessions.get(session_id).snapshot()
+
+
+def start_live_upload(data: bytes) -> str:
+    """
+    Application layer:
+    Uploaded recording → live session processed in the background, so
+    results can be streamed with subscribe_live_session as they appear.
+    """
+    session = _live_sessions.start()
+    try:
+        session.add_chunk(0, data)
+        session.end_input()
+    except Exception:
+        _live_sessions.discard(session.id)
+        raise
+    return session.id
+
+
+def subscribe_live_session(
+    session_id: str,
+    listener: Callable[[str, Dict[str, Any]], None],
+) -> Dict[str, Any]:
+    """Register ``listener(kind, data)``; returns the current state."""
+    return _live_sessions.get(session_id).subscribe(listener)
+
+
+def unsubscribe_live_session(
+    session_id: str,
+    listener: Callable[[str, Dict[str, Any]], None],
+) -> None:
+    try:
+        _live_sessions.get(session_id).unsubscribe(listener)
+    except KeyError:
+        pass
+
+
+def stop_live_session(session_id: str) -> Dict[str, Any]:
+    """
+    Application layer:
+    End of recording → final summary (tail window + reduce tree only).
+    """
+    return _live_sessions.get(session_id).stop()
+
+
 def process_audio(
     audio_path: str,
+    backend: Optional[str] = None,
 ) -> Tuple[str, str, List[str], List[Dict[str, str]]]:
     """
     Application layer:
     Audio → Transcript → Summary + Extraction
     """
-    transcript = _transcriber.transcribe(audio_path)
-    summary, actions, dates = summarize_from_text(transcript)
+    transcript, summary, actions, dates, _, _ = process_audio_with_stats(audio_path, backend=backend)
     return transcript, summary, actions, dates
 
 
-def generate_pdf_bytes(
+def meeting_content_hash(
     transcript: Optional[str],
     summary: str,
     actions: List[str],
     dates: List[Dict[str, str]],
-) -> bytes:
+    segments: Optional[List[Dict[str, Any]]] = None,
+    source: str = "",
+) -> str:
+    """
+    Identity of a meeting result's content (for export caching). Covers
+    everything an exporter reads: subtitle and JSON exports depend on the
+    segments and on the source.
+    """
+    return hash_json([transcript or "", summary, actions, dates, segments or [], source])
+
+
+def export_key(content_hash: str, fmt: str = "pdf") -> str:
+    """Cache key / ETag of that content exported as ``fmt``."""
+    return make_key(fmt, content_hash, [get_exporter(fmt).version])
+
+
+def export_format(fmt: str) -> Exporter:
+    """Registered exporter (content type, file extension); ValueError if unknown."""
+    return get_exporter(fmt)
+
+
+def stream_export(fmt: str, meeting: Dict[str, Any], block_size: int = 64 * 1024) -> Iterator[bytes]:
     """
-    Application layer → Export Adapter
+    Application layer → Export registry
+    Meeting result → encoded document in blocks of about ``block_size``
+    bytes, generated while it is sent.
     """
-    return export_meeting_to_pdf(transcript, summary, actions, dates)
+    exporter = get_exporter(fmt)
+    pending: List[bytes] = []
+    size = 0
+    for piece in exporter.writer(meeting):
+        data = piece if exporter.binary else piece.encode("utf-8")
+        pending.append(data)
+        size += len(data)
+        if size >= block_size:
+            yield b"".join(pending)
+            pending, size = [], 0
+    if pending:
+        yield b"".join(pending)
+
+
+def cached_pdf_file(
+    content_hash: str,
+    load: Callable[[], Tuple[Optional[str], str, List[str], List[Dict[str, str]]]],
+) -> BinaryIO:
+    """
+    Application layer → Export Adapter (cached)
+    PDF for the content identified by ``content_hash``; ``load()`` returns
+    (transcript, summary, actions, dates) and is only called on a miss.
+    Caller closes the returned file.
+    """
+    key = export_key(content_hash, "pdf")
+    cached = _export_cache.open(key)
+    if cached is not None:
+        return cached
+
+    pdf_file = export_meeting_to_pdf_file(*load())
+    stored = _export_cache.put(key, pdf_file)
+    if stored is None:  # disk cache off or not writable
+        pdf_file.seek(0)
+        return pdf_file
+    pdf_file.close()
+    return stored
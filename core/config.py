@@ -1,14 +1,53 @@
 from django.conf import settings
 
 ASR_MODEL_NAME = settings.ASR_MODEL_NAME
+ASR_STREAM_CHUNK_S = settings.ASR_STREAM_CHUNK_S
+ASR_STREAM_STRIDE_S = settings.ASR_STREAM_STRIDE_S
+ASR_VAD_ENABLED = settings.ASR_VAD_ENABLED
+ASR_VAD_THRESHOLD_DB = settings.ASR_VAD_THRESHOLD_DB
+ASR_VAD_MIN_SILENCE_S = settings.ASR_VAD_MIN_SILENCE_S
+AUDIO_PIPELINED = settings.AUDIO_PIPELINED
 SUMMARIZER_MODEL_NAME = settings.SUMMARIZER_MODEL_NAME
 DATE_ORDER = settings.DATE_ORDER
 
+MODEL_WARMUP_ON_START = settings.MODEL_WARMUP_ON_START
+MODEL_IDLE_TTL_S = settings.MODEL_IDLE_TTL_S
+
+ASR_INFERENCE_MODE = settings.ASR_INFERENCE_MODE
+SUMMARIZER_INFERENCE_MODE = settings.SUMMARIZER_INFERENCE_MODE
+TORCH_INTRA_OP_THREADS = settings.TORCH_INTRA_OP_THREADS
+TORCH_INTER_OP_THREADS = settings.TORCH_INTER_OP_THREADS
+
+LIVE_MAX_SESSIONS = settings.LIVE_MAX_SESSIONS
+LIVE_SESSION_IDLE_TIMEOUT_S = settings.LIVE_SESSION_IDLE_TIMEOUT_S
+LIVE_MAX_AUDIO_S = settings.LIVE_MAX_AUDIO_S
+
+INFERENCE_WORKERS = settings.INFERENCE_WORKERS
+INFERENCE_TORCH_THREADS = settings.INFERENCE_TORCH_THREADS
+INFERENCE_MAX_QUEUED = settings.INFERENCE_MAX_QUEUED
+INFERENCE_QUEUE_TIMEOUT_S = settings.INFERENCE_QUEUE_TIMEOUT_S
+INFERENCE_CALL_TIMEOUT_S = settings.INFERENCE_CALL_TIMEOUT_S
+
 SUMMARIZER_MAX_LEN = settings.SUMMARIZER_MAX_LEN
 SUMMARIZER_MIN_LEN = settings.SUMMARIZER_MIN_LEN
+CHUNK_MODE = settings.CHUNK_MODE
 CHUNK_MAX_CHARS = settings.CHUNK_MAX_CHARS
+CHUNK_MAX_TOKENS = settings.CHUNK_MAX_TOKENS
 TOKENIZER_MODEL_MAX_LENGTH = settings.TOKENIZER_MODEL_MAX_LENGTH
+SUMMARIZER_BATCH_SIZE = settings.SUMMARIZER_BATCH_SIZE
+SUMMARIZER_BACKEND = settings.SUMMARIZER_BACKEND
+EXTRACTIVE_KEEP_RATIO = settings.EXTRACTIVE_KEEP_RATIO
+EXTRACTIVE_METHOD = settings.EXTRACTIVE_METHOD
+SUMMARIZER_MICRO_BATCHING = settings.SUMMARIZER_MICRO_BATCHING
+SUMMARIZER_BATCH_WAIT_MS = settings.SUMMARIZER_BATCH_WAIT_MS
 
 MAX_TEXT_LENGTH = settings.MAX_TEXT_LENGTH
 
+RESULT_CACHE_SIZE = settings.RESULT_CACHE_SIZE
+RESULT_CACHE_DIR = settings.RESULT_CACHE_DIR
+RESULT_CACHE_DISK_MAX_MB = settings.RESULT_CACHE_DISK_MAX_MB
+EXPORT_CACHE_DIR = settings.EXPORT_CACHE_DIR
+EXPORT_CACHE_MAX_MB = settings.EXPORT_CACHE_MAX_MB
+SUMMARY_CHUNK_CACHE_SIZE = settings.SUMMARY_CHUNK_CACHE_SIZE
+
 HF_API_KEY = settings.HF_API_KEY
@@ -0,0 +1,119 @@
+"""
+Domain / Micro-batching:
+
+Coalesces small inference jobs from concurrent callers into one batched
+call. Jobs with the same key (same model and generation parameters) that
+arrive within ``max_wait_ms`` of the oldest pending job are run together,
+up to ``max_batch`` items; each caller gets one Future per item.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Hashable, List, Tuple
+
+
+class _Job:
+    __slots__ = ("item", "future", "enqueued")
+
+    def __init__(self, item: Any):
+        self.item = item
+        self.future: Future = Future()
+        self.enqueued = time.monotonic()
+
+
+class MicroBatcher:
+    def __init__(self, max_batch: int = 4, max_wait_ms: float = 5.0, history: int = 1000):
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait_s = max(0.0, max_wait_ms) / 1000.0
+        # key → (batch function, pending jobs), oldest key first
+        self._pending: "OrderedDict[Hashable, Tuple[Callable[[List[Any]], List[Any]], List[_Job]]]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._worker = None
+
+        # Metrics
+        self.batches = 0
+        self.items = 0
+        self.run_seconds = 0.0
+        self._delays: Deque[float] = deque(maxlen=history)
+
+    def submit(self, key: Hashable, fn: Callable[[List[Any]], List[Any]], items: List[Any]) -> List[Future]:
+        """
+        Queue ``items``; ``fn`` maps a list of items to a list of results
+        in the same order and must be the same for every job with ``key``.
+        """
+        jobs = [_Job(item) for item in items]
+        if not jobs:
+            return []
+        with self._cond:
+            if key in self._pending:
+                self._pending[key][1].extend(jobs)
+            else:
+                self._pending[key] = (fn, jobs)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._loop, name="micro-batcher", daemon=True)
+                self._worker.start()
+            self._cond.notify()
+        return [job.future for job in jobs]
+
+    def _next_batch(self) -> Tuple[Callable[[List[Any]], List[Any]], List[_Job]]:
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            key, (fn, jobs) = next(iter(self._pending.items()))
+            # Give other callers until the oldest job's deadline to join
+            deadline = jobs[0].enqueued + self.max_wait_s
+            while len(jobs) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = jobs[:self.max_batch]
+            del jobs[:self.max_batch]
+            if not jobs:
+                del self._pending[key]
+            return fn, batch
+
+    def _loop(self) -> None:
+        while True:
+            fn, batch = self._next_batch()
+            started = time.monotonic()
+            try:
+                results = fn([job.item for job in batch])
+            except BaseException as e:
+                for job in batch:
+                    job.future.set_exception(e)
+            else:
+                for job, result in zip(batch, results):
+                    job.future.set_result(result)
+            finished = time.monotonic()
+
+            with self._cond:
+                self.batches += 1
+                self.items += len(batch)
+                self.run_seconds += finished - started
+                self._delays.extend(started - job.enqueued for job in batch)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            delays = sorted(self._delays)
+            pending = sum(len(jobs) for _, jobs in self._pending.values())
+            batches, items, run_seconds = self.batches, self.items, self.run_seconds
+
+        def pct(p: float) -> float:
+            if not delays:
+                return 0.0
+            return round(delays[min(len(delays) - 1, int(p * len(delays)))] * 1000.0, 2)
+
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": round(self.max_wait_s * 1000.0, 2),
+            "batches": batches,
+            "items": items,
+            "pending": pending,
+            "avg_batch_size": round(items / batches, 2) if batches else 0.0,
+            "fill_ratio": round(items / (batches * self.max_batch), 4) if batches else 0.0,
+            "queue_delay_ms_p50": pct(0.5),
+            "queue_delay_ms_p95": pct(0.95),
+            "avg_run_ms": round(run_seconds / batches * 1000.0, 2) if batches else 0.0,
+        }
@@ -1,5 +1,6 @@
 import re
 from abc import ABC
+from bisect import bisect_right
 from typing import List, Dict, Tuple, Optional
 from datetime import date, timedelta
 
@@ -64,15 +65,60 @@ MONTH_DAY_REGEX = re.compile(
 )
 
 
+# ------------------------------------------------------------
+# SINGLE-PASS SCANNER
+# ------------------------------------------------------------
+ACTION_WORDS = [
+    "should", "to do", "action", "follow up", "deadline", "assign", "send",
+    "prepare", "review", "meet", "schedule", "email", "submit", "call",
+]
+WEEKDAY_PREFIXES = ["next", "this"]
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """
+    Regex alternation for ``words`` factored as a prefix trie
+    ("a(?:ction|pr(?:il)?|...)"), which the re engine walks far faster
+    than a flat list of alternatives.
+    """
+    trie: Dict[str, dict] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        alts = [re.escape(ch) + build(node[ch]) for ch in sorted(k for k in node if k)]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+# Every word that can start an action / date match, or a digit (day-month).
+_TRIGGER_WORDS = ACTION_WORDS + WEEKDAY_PREFIXES + list(WEEKDAY_TO_INDEX) + list(MONTH_NAME_TO_NUM)
+_TRIGGER = r"\b(?:(?P<word>" + _trie_pattern(_TRIGGER_WORDS) + r")|\d)"
+TRIGGER_REGEX = re.compile(_TRIGGER)  # for pre-lowercased text
+TRIGGER_REGEX_I = re.compile(_TRIGGER, re.IGNORECASE)
+
+_ACTION_SET = frozenset(ACTION_WORDS)
+_WEEKDAY_START_SET = frozenset(WEEKDAY_PREFIXES) | frozenset(WEEKDAY_TO_INDEX)
+_MONTH_SET = frozenset(MONTH_NAME_TO_NUM)
+
+
 # ------------------------------------------------------------
 # HELPERS
 # ------------------------------------------------------------
-def _make_date(day: int, month: int, year: Optional[int]) -> date:
+def _make_date(day: int, month: int, year: Optional[int], today: Optional[date] = None) -> date:
     """
     Explicit year → ALWAYS respected exactly.
     Missing year → use current year, push future if needed.
     """
-    today = date.today()
+    if today is None:
+        today = date.today()
 
     if year is None:
         year = today.year
@@ -85,33 +131,38 @@ def _make_date(day: int, month: int, year: Optional[int]) -> date:
     return date(year, month, day)
 
 
+def _resolve_weekday(prefix: Optional[str], weekday: str, today: date) -> date:
+    target_idx = WEEKDAY_TO_INDEX[weekday]
+    today_idx = today.weekday()
+
+    diff = target_idx - today_idx
+    if prefix == "next":
+        if diff <= 0:
+            diff += 7
+        diff += 7
+    elif prefix == "this":
+        if diff < 0:
+            diff += 7
+    else:
+        if diff < 0:
+            diff += 7
+
+    return today + timedelta(days=diff)
+
+
 # ------------------------------------------------------------
 # DATE PARSERS
 # ------------------------------------------------------------
-def compute_weekday_dates(sentence: str) -> List[Dict[str, str]]:
-    today = date.today()
+def compute_weekday_dates(sentence: str, today: Optional[date] = None) -> List[Dict[str, str]]:
+    if today is None:
+        today = date.today()
     results = []
 
     for m in WEEKDAY_REGEX.finditer(sentence):
         prefix = m.group(1).lower() if m.group(1) else None
         weekday = m.group(2).lower()
 
-        target_idx = WEEKDAY_TO_INDEX[weekday]
-        today_idx = today.weekday()
-
-        diff = target_idx - today_idx
-        if prefix == "next":
-            if diff <= 0:
-                diff += 7
-            diff += 7
-        elif prefix == "this":
-            if diff < 0:
-                diff += 7
-        else:
-            if diff < 0:
-                diff += 7
-
-        d = today + timedelta(days=diff)
+        d = _resolve_weekday(prefix, weekday, today)
         results.append({
             "date": d.strftime("%Y-%m-%d"),
             "context": sentence
@@ -120,7 +171,9 @@ def compute_weekday_dates(sentence: str) -> List[Dict[str, str]]:
     return results
 
 
-def compute_day_month_dates(sentence: str) -> List[Dict[str, str]]:
+def compute_day_month_dates(sentence: str, today: Optional[date] = None) -> List[Dict[str, str]]:
+    if today is None:
+        today = date.today()
     results = []
 
     # Day Month Year
@@ -128,7 +181,7 @@ def compute_day_month_dates(sentence: str) -> List[Dict[str, str]]:
         day = int(day_str)
         month = MONTH_NAME_TO_NUM[month_str.lower()]
         year = int(year_str) if year_str else None
-        d = _make_date(day, month, year)
+        d = _make_date(day, month, year, today)
         results.append({"date": d.strftime("%Y-%m-%d"), "context": sentence})
 
     # Month Day Year
@@ -136,56 +189,151 @@ def compute_day_month_dates(sentence: str) -> List[Dict[str, str]]:
         day = int(day_str)
         month = MONTH_NAME_TO_NUM[month_str.lower()]
         year = int(year_str) if year_str else None
-        d = _make_date(day, month, year)
+        d = _make_date(day, month, year, today)
         results.append({"date": d.strftime("%Y-%m-%d"), "context": sentence})
 
     return results
 
 
+def _merge_by_context(dates: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Merge date hits sharing a context sentence (no duplicates, first-seen order).
+    """
+    merged: Dict[str, List[str]] = {}
+    seen: Dict[str, set] = {}
+
+    for d in dates:
+        ctx = d["context"].strip()
+        dt = d["date"]
+
+        if ctx not in merged:
+            merged[ctx] = []
+            seen[ctx] = set()
+
+        if dt not in seen[ctx]:
+            seen[ctx].add(dt)
+            merged[ctx].append(dt)
+
+    return [
+        {"date": ", ".join(dt_list), "context": ctx}
+        for ctx, dt_list in merged.items()
+    ]
+
+
+def extract_per_sentence(
+    text: str,
+    today: Optional[date] = None,
+) -> Tuple[List[str], List[Dict[str, str]]]:
+    """
+    Reference implementation: every pattern run separately on every
+    sentence. Kept for equivalence checks and benchmarks.
+    """
+    actions = []
+    dates = []
+
+    for sent in Chunker.split_sentences(text):
+        # Action detection
+        if ACTION_PAT.search(sent):
+            actions.append(sent)
+
+        # Date extraction
+        dates.extend(compute_weekday_dates(sent, today))
+        dates.extend(compute_day_month_dates(sent, today))
+        # NO NUMERIC DATES ON PURPOSE
+
+    return actions, _merge_by_context(dates)
+
+
 # ------------------------------------------------------------
 # MAIN EXTRACTOR
 # ------------------------------------------------------------
 class IExtractor(ABC):
-    def extract(self, text: str) -> Tuple[List[str], List[Dict[str, str]]]:
+    def extract(self, text: str, reference_date: Optional[date] = None) -> Tuple[List[str], List[Dict[str, str]]]:
         raise NotImplementedError
 
 
 class RuleDateExtractor(IExtractor):
+    """
+    Single-pass extractor: TRIGGER_REGEX finds every keyword or digit that
+    could start a match in one scan of the whole transcript; each hit is
+    confirmed with the anchored pattern (ACTION_PAT, WEEKDAY_REGEX, ...),
+    mapped back to its sentence, and relative dates are resolved against
+    one reference date (default: today).
+
+    Output matches extract_per_sentence: per sentence, weekday dates come
+    first, then "day month", then "month day". Impossible calendar dates
+    ("31 February") are skipped instead of raising.
+    """
 
-    def extract(self, text: str) -> Tuple[List[str], List[Dict[str, str]]]:
-        actions = []
-        dates = []
-
-        for sent in Chunker.split_sentences(text):
-            # Action detection
-            if ACTION_PAT.search(sent):
-                actions.append(sent)
-
-            # Date extraction
-            dates.extend(compute_weekday_dates(sent))
-            dates.extend(compute_day_month_dates(sent))
-            # NO NUMERIC DATES ON PURPOSE
-
-        # ----------------------------------------------------
-        # MERGE BY CONTEXT (NO DUPLICATES)
-        # ----------------------------------------------------
-        merged = {}
-
-        for d in dates:
-            ctx = d["context"].strip()
-            dt = d["date"]
+    def extract(self, text: str, reference_date: Optional[date] = None) -> Tuple[List[str], List[Dict[str, str]]]:
+        today = reference_date or date.today()
 
-            if ctx not in merged:
-                merged[ctx] = []
+        spans = Chunker.sentence_spans(text)
+        if not spans:
+            return [], []
+        starts = [a for a, _ in spans]
 
-            if dt not in merged[ctx]:
-                merged[ctx].append(dt)
+        # Scan a lowercased copy when offsets are preserved (much faster).
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            hits = TRIGGER_REGEX.finditer(lowered)
+        else:
+            hits = TRIGGER_REGEX_I.finditer(text)
+
+        has_action = [False] * len(spans)
+        # Per sentence: [weekday, day-month, month-day] date strings
+        found: Dict[int, Tuple[List[str], List[str], List[str]]] = {}
+        weekday_end = -1  # "next monday" must not also count as "monday"
+
+        def add(pos: int, slot: int, d: date) -> None:
+            idx = bisect_right(starts, pos) - 1
+            if idx not in found:
+                found[idx] = ([], [], [])
+            found[idx][slot].append(d.strftime("%Y-%m-%d"))
+
+        for hit in hits:
+            pos = hit.start()
+            word = hit.group("word")
+            if word is not None:
+                word = word.lower()
+
+            if word is None:
+                m = DAY_MONTH_REGEX.match(text, pos)
+                if m:
+                    day, month, year = m.groups()
+                    try:
+                        add(pos, 1, _make_date(int(day), MONTH_NAME_TO_NUM[month.lower()], int(year) if year else None, today))
+                    except ValueError:
+                        pass
+
+            elif word in _ACTION_SET:
+                if ACTION_PAT.match(text, pos):
+                    has_action[bisect_right(starts, pos) - 1] = True
+
+            elif word in _WEEKDAY_START_SET:
+                if pos >= weekday_end:
+                    m = WEEKDAY_REGEX.match(text, pos)
+                    if m:
+                        weekday_end = m.end()
+                        prefix = m.group(1).lower() if m.group(1) else None
+                        add(pos, 0, _resolve_weekday(prefix, m.group(2).lower(), today))
+
+            elif word in _MONTH_SET:
+                m = MONTH_DAY_REGEX.match(text, pos)
+                if m:
+                    month, day, year = m.groups()
+                    try:
+                        add(pos, 2, _make_date(int(day), MONTH_NAME_TO_NUM[month.lower()], int(year) if year else None, today))
+                    except ValueError:
+                        pass
+
+        actions = [text[a:b] for (a, b), hit in zip(spans, has_action) if hit]
 
-        final_dates = []
-        for ctx, dt_list in merged.items():
-            final_dates.append({
-                "date": ", ".join(dt_list),
-                "context": ctx
-            })
+        dates = []
+        for idx in sorted(found):
+            a, b = spans[idx]
+            ctx = text[a:b]
+            for group in found[idx]:
+                dates.extend({"date": dt, "context": ctx} for dt in group)
 
-        return actions, final_dates
+        return actions, _merge_by_context(dates)
@@ -1,74 +1,603 @@
+import hashlib
+import math
 import re
+import time
+from bisect import bisect_left
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Dict, Tuple, Any, Callable, Optional
 
+import numpy as np
 from transformers import pipeline
 
 from core.config import (
     SUMMARIZER_MAX_LEN,
     SUMMARIZER_MIN_LEN,
+    CHUNK_MODE,
     CHUNK_MAX_CHARS,
+    CHUNK_MAX_TOKENS,
     SUMMARIZER_MODEL_NAME,
     TOKENIZER_MODEL_MAX_LENGTH,
+    SUMMARIZER_BATCH_SIZE,
+    EXTRACTIVE_KEEP_RATIO,
+    EXTRACTIVE_METHOD,
 )
 
 
+# progress(stage, done, total)
+ProgressCallback = Callable[[str, int, int], None]
+
+
 class ISummarizer(ABC):
     def summarize(self, text: str, min_len: int, max_len: int) -> str:
         raise NotImplementedError
 
 
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
 class Chunker:
     @staticmethod
     def split_sentences(text: str) -> List[str]:
-        return [s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()]
+        return [s.strip() for s in SENTENCE_BOUNDARY.split(text) if s.strip()]
 
     @staticmethod
-    def chunk(text: str, max_chars: int = CHUNK_MAX_CHARS) -> List[str]:
+    def sentence_spans(text: str) -> List[Tuple[int, int]]:
+        """
+        Character spans (start, end) of the sentences returned by
+        split_sentences, with surrounding whitespace excluded.
+        """
+        spans = []
+        start = 0
+        for m in SENTENCE_BOUNDARY.finditer(text):
+            spans.append((start, m.start()))
+            start = m.end()
+        spans.append((start, len(text)))
+
+        result = []
+        for a, b in spans:
+            seg = text[a:b]
+            stripped = seg.strip()
+            if stripped:
+                a += len(seg) - len(seg.lstrip())
+                result.append((a, a + len(stripped)))
+        return result
+
+    # Content-defined boundaries: once a chunk is MIN_FILL full, it ends
+    # after any sentence whose hash marks it as a breakpoint (on average
+    # every BREAK_EVERY of the budget), or when the next sentence would
+    # overflow. A cut depends on the sentences since the previous cut,
+    # not on their offset in the transcript, so after an edit the chunks
+    # resynchronise at the next common breakpoint and the chunk memo
+    # keeps hitting for the rest of the text. Chunks average about 80%
+    # of the budget instead of nearly full (about 1/4 more chunks).
+    MIN_FILL = 0.7
+    BREAK_EVERY = 0.12
+
+    @staticmethod
+    def is_breakpoint(sentence: str, size: int, budget: int) -> bool:
+        """Hash-based: more likely for longer sentences, same for equal text."""
+        h = int.from_bytes(hashlib.blake2b(sentence.encode("utf-8"), digest_size=8).digest(), "big")
+        return h < size * float(1 << 64) / max(1.0, budget * Chunker.BREAK_EVERY)
+
+    @staticmethod
+    def pack(sentences: List[str], sizes: List[int], budget: int) -> List[str]:
+        """Join sentences into chunks of at most ``budget`` (sum of sizes)."""
         parts = []
-        buf = ""
-        for sent in Chunker.split_sentences(text):
-            if len(buf) + len(sent) + 1 <= max_chars:
-                buf += (" " if buf else "") + sent
-            else:
-                parts.append(buf)
-                buf = sent
+        buf: List[str] = []
+        used = 0
+        for sent, n in zip(sentences, sizes):
+            if buf and used + n > budget:
+                parts.append(" ".join(buf))
+                buf, used = [], 0
+            buf.append(sent)
+            used += n
+            if used >= budget * Chunker.MIN_FILL and Chunker.is_breakpoint(sent, n, budget):
+                parts.append(" ".join(buf))
+                buf, used = [], 0
         if buf:
-            parts.append(buf)
+            parts.append(" ".join(buf))
         return parts
 
+    @staticmethod
+    def chunk(text: str, max_chars: int = CHUNK_MAX_CHARS) -> List[str]:
+        sentences = Chunker.split_sentences(text)
+        # +1 for the joining space
+        return Chunker.pack(sentences, [len(s) + 1 for s in sentences], max_chars + 1)
+
+    @staticmethod
+    def sentence_token_counts(text: str, spans: List[Tuple[int, int]], tokenizer) -> List[int]:
+        """
+        Token count of each sentence span.
+
+        Fast tokenizers: tokenize the whole text once and count token start
+        offsets falling inside each span. Otherwise fall back to encoding
+        each sentence on its own.
+        """
+        if getattr(tokenizer, "is_fast", False):
+            enc = tokenizer(
+                text,
+                add_special_tokens=False,
+                return_offsets_mapping=True,
+                verbose=False,
+            )
+            starts = [a for a, b in enc["offset_mapping"] if b > a]
+            return [
+                bisect_left(starts, b) - bisect_left(starts, a)
+                for a, b in spans
+            ]
+
+        return [
+            len(tokenizer.encode(text[a:b], add_special_tokens=False))
+            for a, b in spans
+        ]
+
+    @staticmethod
+    def chunk_tokens(text: str, tokenizer, max_tokens: int = CHUNK_MAX_TOKENS) -> List[str]:
+        """
+        Pack whole sentences into chunks of at most ``max_tokens`` tokens
+        (measured with the summariser's own tokenizer), cut at
+        content-defined breakpoints (see pack). A single sentence longer
+        than the budget becomes its own chunk.
+        """
+        spans = Chunker.sentence_spans(text)
+        counts = Chunker.sentence_token_counts(text, spans, tokenizer)
+        return Chunker.pack([text[a:b] for a, b in spans], counts, max_tokens)
+
+
+class StreamingChunker:
+    """
+    Incremental chunking for text that arrives in pieces (e.g. ASR
+    segments). feed() returns chunks that can no longer grow; the last,
+    still-open chunk (and any unfinished sentence) stays buffered until
+    more text arrives or flush() is called.
+    """
+
+    def __init__(self, chunk_fn: Callable[[str], List[str]]):
+        self.chunk_fn = chunk_fn
+        self.buffer = ""
+
+    def feed(self, text: str) -> List[str]:
+        text = text.strip()
+        if not text:
+            return []
+        self.buffer = (self.buffer + " " + text) if self.buffer else text
+        parts = [p for p in self.chunk_fn(self.buffer) if p]
+        if len(parts) <= 1:
+            return []
+        self.buffer = parts[-1]
+        return parts[:-1]
+
+    def flush(self) -> List[str]:
+        parts = [p for p in self.chunk_fn(self.buffer) if p]
+        self.buffer = ""
+        return parts
+
+
+TERM = re.compile(r"\w+")
+
+
+class SentenceRanker:
+    """
+    Sentence centrality over a sparse TF-IDF sentence × term matrix.
+
+    The matrix is kept as COO arrays (rows, cols, vals) and every product
+    is a pair of np.bincount calls, so cost is linear in the number of
+    non-zeros and no sentence × sentence matrix is ever materialised.
+    - "tfidf":    degree centrality, sum of cosine similarity to all others.
+    - "textrank": PageRank over the same similarity graph.
+    """
+
+    METHODS = ("tfidf", "textrank")
+
+    @staticmethod
+    def term_matrix(sentences: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[int, int]]:
+        """L2-normalised TF-IDF rows as COO arrays plus the matrix shape."""
+        vocab: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        for i, sent in enumerate(sentences):
+            ids = [vocab.setdefault(w, len(vocab)) for w in TERM.findall(sent.lower())]
+            cols.extend(ids)
+            rows.extend([i] * len(ids))
+
+        n, v = len(sentences), max(1, len(vocab))
+        if not cols:
+            empty = np.zeros(0)
+            return empty.astype(np.int64), empty.astype(np.int64), empty, (n, v)
+
+        keys, tf = np.unique(np.asarray(rows, dtype=np.int64) * v + np.asarray(cols, dtype=np.int64), return_counts=True)
+        r, c = keys // v, keys % v
+        df = np.bincount(c, minlength=v)
+        idf = np.log((1.0 + n) / (1.0 + df)) + 1.0
+        vals = (1.0 + np.log(tf)) * idf[c]
+        norms = np.sqrt(np.bincount(r, weights=vals * vals, minlength=n))
+        vals = vals / norms[r]
+        return r, c, vals, (n, v)
+
+    @staticmethod
+    def _similarity_dot(r, c, vals, shape, x: np.ndarray, self_sim: np.ndarray) -> np.ndarray:
+        # (X Xᵀ - diag) x without forming X Xᵀ
+        n, v = shape
+        u = np.bincount(c, weights=vals * x[r], minlength=v)
+        return np.bincount(r, weights=vals * u[c], minlength=n) - self_sim * x
+
+    @staticmethod
+    def scores(
+        sentences: List[str],
+        method: str = "textrank",
+        damping: float = 0.85,
+        max_iter: int = 50,
+        matrix: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[int, int]]] = None,
+    ) -> np.ndarray:
+        """Centrality per sentence; pass ``matrix`` if term_matrix was already built."""
+        if method not in SentenceRanker.METHODS:
+            raise ValueError("Unknown ranking method %r" % method)
+        n = len(sentences)
+        if n == 0:
+            return np.zeros(0)
+
+        r, c, vals, shape = matrix if matrix is not None else SentenceRanker.term_matrix(sentences)
+        self_sim = np.bincount(r, weights=vals * vals, minlength=n)
+        degree = SentenceRanker._similarity_dot(r, c, vals, shape, np.ones(n), self_sim)
+        if method == "tfidf":
+            return degree
+
+        rank = np.full(n, 1.0 / n)
+        dangling = degree <= 1e-12
+        inv_degree = np.where(dangling, 0.0, 1.0 / np.where(dangling, 1.0, degree))
+        for _ in range(max_iter):
+            spread = SentenceRanker._similarity_dot(r, c, vals, shape, rank * inv_degree, self_sim)
+            new = (1.0 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+            delta = np.abs(new - rank).sum()
+            rank = new
+            if delta < 1e-6:
+                break
+        return rank
+
+    @staticmethod
+    def top_sentences(sentences: List[str], keep_ratio: float, method: str = "textrank") -> List[int]:
+        """Indices of the best ``keep_ratio`` of sentences, in original order."""
+        n = len(sentences)
+        k = min(n, max(1, int(math.ceil(keep_ratio * n))))
+        if k >= n:
+            return list(range(n))
+        order = np.argsort(-SentenceRanker.scores(sentences, method), kind="stable")
+        return sorted(order[:k].tolist())
+
+
+class ExtractiveSummarizer(ISummarizer):
+    """
+    Model-free summariser: the most central sentences (SentenceRanker)
+    up to roughly ``max_len`` tokens, in original order. Runs in
+    milliseconds, so it can stand in while BART is still working.
+    A sentence too similar to one already chosen (repeated lines in a
+    transcript) is skipped.
+    """
+
+    WORDS_PER_TOKEN = 0.75
+    MAX_SIMILARITY = 0.8  # TF-IDF cosine to a chosen sentence
+
+    def __init__(self, method: str = EXTRACTIVE_METHOD):
+        self.method = method
+
+    def summarize_tree(
+        self,
+        text: str,
+        min_len: int = SUMMARIZER_MIN_LEN,
+        max_len: int = SUMMARIZER_MAX_LEN,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Same contract as BartSummarizer.summarize_tree."""
+        started = time.perf_counter()
+        stats: Dict[str, Any] = {
+            "backend": "extractive", "method": self.method, "sentences": 0, "selected": 0, "redundant": 0,
+        }
+
+        sentences = Chunker.split_sentences(text)
+        if not sentences:
+            return "No content provided.", stats
+        stats["sentences"] = len(sentences)
+
+        budget = max(1, int(max_len * self.WORDS_PER_TOKEN))
+        matrix = SentenceRanker.term_matrix(sentences)
+        order = np.argsort(-SentenceRanker.scores(sentences, self.method, matrix=matrix), kind="stable")
+        r, c, vals, _ = matrix
+        # Sparse TF-IDF row per sentence (rows are sorted by term_matrix)
+        bounds = np.searchsorted(r, np.arange(len(sentences) + 1))
+        vectors = [dict(zip(c[a:b].tolist(), vals[a:b].tolist())) for a, b in zip(bounds[:-1], bounds[1:])]
+        seen_texts = set()
+        chosen: List[int] = []
+        words = 0
+        for i in order.tolist():
+            key = " ".join(sentences[i].lower().split())
+            vec = vectors[i]
+            if key in seen_texts or any(
+                sum(w * vectors[j].get(t, 0.0) for t, w in vec.items()) >= self.MAX_SIMILARITY
+                for j in chosen
+            ):
+                stats["redundant"] += 1
+                continue
+            seen_texts.add(key)
+            chosen.append(i)
+            words += len(sentences[i].split())
+            if words >= budget:
+                break
+        chosen.sort()
+
+        stats["selected"] = len(chosen)
+        stats["seconds"] = round(time.perf_counter() - started, 4)
+        if progress:
+            progress("summarize", 1, 1)
+        return " ".join(sentences[i] for i in chosen), stats
+
+    def summarize(self, text: str, min_len: int = SUMMARIZER_MIN_LEN, max_len: int = SUMMARIZER_MAX_LEN) -> str:
+        summary, _ = self.summarize_tree(text, min_len=min_len, max_len=max_len)
+        return summary
+
 
 class BartSummarizer(ISummarizer):
-    def __init__(self, model: str = SUMMARIZER_MODEL_NAME):
+    def __init__(
+        self,
+        model: str = SUMMARIZER_MODEL_NAME,
+        batch_size: int = SUMMARIZER_BATCH_SIZE,
+        chunk_mode: str = CHUNK_MODE,
+        chunk_max_tokens: int = CHUNK_MAX_TOKENS,
+        chunk_cache=None,
+        batcher=None,
+        keep_ratio: float = EXTRACTIVE_KEEP_RATIO,
+        prefilter_method: str = EXTRACTIVE_METHOD,
+    ):
+        self.model_name = model
         self.pipe = pipeline("summarization", model=model)
         #self.pipe = pipeline("summarization", model=model)
         # Make tokenizer aware of sensible ceiling to avoid warnings
         self.pipe.tokenizer.model_max_length = TOKENIZER_MODEL_MAX_LENGTH
+        self.batch_size = max(1, int(batch_size))
+        self.chunk_mode = chunk_mode
+        # Leave room for BOS/EOS inside the model window
+        self.chunk_max_tokens = min(chunk_max_tokens, TOKENIZER_MODEL_MAX_LENGTH - 2)
+        # Optional memo of chunk → summary (any object with get/set),
+        # so re-submitted or lightly edited transcripts skip unchanged chunks.
+        self.chunk_cache = chunk_cache
+        # Optional MicroBatcher shared by concurrent requests: chunk jobs
+        # from different callers are coalesced into one generate call.
+        self.batcher = batcher
+        # Extractive pre-filter: share of sentences kept before BART (1.0 = off)
+        self.keep_ratio = keep_ratio
+        self.prefilter_method = prefilter_method
 
-    def summarize(self, text: str, min_len: int = SUMMARIZER_MIN_LEN, max_len: int = SUMMARIZER_MAX_LEN) -> str:
-        parts = Chunker.chunk(text)
-        if not parts:
+    def warm_up(self) -> None:
+        """One short generate call (bypassing the chunk memo)."""
+        self.pipe(
+            "The team met to review the project plan and agreed on next steps.",
+            max_length=16,
+            min_length=1,
+            do_sample=False,
+            truncation=True,
+        )
+
+    def chunk(self, text: str) -> List[str]:
+        if self.chunk_mode == "tokens":
+            return Chunker.chunk_tokens(text, self.pipe.tokenizer, self.chunk_max_tokens)
+        return Chunker.chunk(text)
+
+    def _chunk_key(self, text: str, min_len: int, max_len: int) -> str:
+        raw = "|".join([
+            hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            self.model_name,
+            str(min_len),
+            str(max_len),
+        ])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _generate(self, texts: List[str], min_len: int, max_len: int) -> List[str]:
+        """One batched generate call."""
+        outputs = self.pipe(
+            texts,
+            max_length=max_len,
+            min_length=min_len,
+            do_sample=False,
+            truncation=True,
+            batch_size=len(texts),
+        )
+        return [(out[0] if isinstance(out, list) else out)["summary_text"] for out in outputs]
+
+    def _store(self, partials: List[str], keys: List[str], i: int, summary: str) -> None:
+        partials[i] = summary
+        if self.chunk_cache is not None:
+            self.chunk_cache.set(keys[i], summary)
+
+    def _summarize_batch(
+        self,
+        parts: List[str],
+        min_len: int,
+        max_len: int,
+        progress: Optional[ProgressCallback] = None,
+        stage: str = "summarize",
+    ) -> Tuple[List[str], int]:
+        partials = [""] * len(parts)
+        todo = list(range(len(parts)))
+        keys: List[str] = []
+
+        if self.chunk_cache is not None:
+            keys = [self._chunk_key(p, min_len, max_len) for p in parts]
+            todo = []
+            for i, key in enumerate(keys):
+                hit = self.chunk_cache.get(key)
+                if hit is None:
+                    todo.append(i)
+                else:
+                    partials[i] = hit
+        cached = len(parts) - len(todo)
+        done = cached
+        if progress:
+            progress(stage, done, len(parts))
+
+        order = sorted(todo, key=lambda i: len(parts[i]), reverse=True)
+
+        if self.batcher is not None:
+            futures = self.batcher.submit(
+                (self, min_len, max_len),
+                lambda texts: self._generate(texts, min_len, max_len),
+                [parts[i] for i in order],
+            )
+            for i, future in zip(order, futures):
+                self._store(partials, keys, i, future.result())
+                done += 1
+                if progress:
+                    progress(stage, done, len(parts))
+            return partials, cached
+
+        for start in range(0, len(order), self.batch_size):
+            idxs = order[start:start + self.batch_size]
+            outputs = self._generate([parts[i] for i in idxs], min_len, max_len)
+            for i, out in zip(idxs, outputs):
+                self._store(partials, keys, i, out)
+            done += len(idxs)
+            if progress:
+                progress(stage, done, len(parts))
+
+        return partials, cached
+
+    def summarize_batch(self, parts: List[str], min_len: int = SUMMARIZER_MIN_LEN, max_len: int = SUMMARIZER_MAX_LEN) -> List[str]:
+        """
+        Map stage: summarise many chunks with batched generate calls.
+
+        Chunks found in the chunk memo are skipped; the rest are sorted by
+        length so each batch holds similarly sized inputs (less padding),
+        then results are put back in original order.
+        """
+        partials, _ = self._summarize_batch(parts, min_len, max_len)
+        return partials
+
+    def prefilter(self, text: str, keep_ratio: float) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Keep the most central ``keep_ratio`` of sentences (original order)
+        so BART only sees the informative part of long transcripts.
+        Returns the chunks of the filtered text and what was eliminated.
+
+        The text is tokenized once; both chunkings (with and without the
+        filter) are packed from those per-sentence counts.
+        """
+        started = time.perf_counter()
+        spans = Chunker.sentence_spans(text)
+        sentences = [text[a:b] for a, b in spans]
+        keep = SentenceRanker.top_sentences(sentences, keep_ratio, self.prefilter_method)
+
+        tokens = Chunker.sentence_token_counts(text, spans, self.pipe.tokenizer)
+        tokens_in = sum(tokens)
+        tokens_kept = sum(tokens[i] for i in keep)
+        if self.chunk_mode == "tokens":
+            sizes, budget = tokens, self.chunk_max_tokens
+        else:
+            sizes, budget = [len(sent) + 1 for sent in sentences], CHUNK_MAX_CHARS + 1  # as Chunker.chunk
+        chunks_in = len(Chunker.pack(sentences, sizes, budget))
+        parts = Chunker.pack([sentences[i] for i in keep], [sizes[i] for i in keep], budget)
+        chunks_kept = len(parts)
+        return parts, {
+            "method": self.prefilter_method,
+            "keep_ratio": keep_ratio,
+            "sentences_in": len(sentences),
+            "sentences_kept": len(keep),
+            "tokens_in": tokens_in,
+            "tokens_removed": tokens_in - tokens_kept,
+            "chunks_in": chunks_in,
+            "chunks_removed": chunks_in - chunks_kept,
+            "seconds": round(time.perf_counter() - started, 4),
+        }
+
+    def reduce_fan_in(self, max_len: int = SUMMARIZER_MAX_LEN) -> int:
+        """
+        How many partial summaries fit in one reduce input.
+
+        Each partial is at most ``max_len`` tokens, so the fan-in is the
+        number of those that fit in the tokenizer budget (never below 2).
+        """
+        budget = self.pipe.tokenizer.model_max_length - 2  # BOS/EOS
+        return max(2, budget // max(1, max_len + 1))
+
+    def new_stats(self, max_len: int = SUMMARIZER_MAX_LEN) -> Dict[str, Any]:
+        return {"chunks": 0, "fan_in": self.reduce_fan_in(max_len), "depth": 0, "levels": []}
+
+    def reduce_tree(
+        self,
+        partials: List[str],
+        stats: Dict[str, Any],
+        min_len: int = SUMMARIZER_MIN_LEN,
+        max_len: int = SUMMARIZER_MAX_LEN,
+        progress: Optional[ProgressCallback] = None,
+    ) -> str:
+        """
+        Reduce stage: group partials ``fan_in`` at a time and summarise
+        again until a single summary remains. Appends one entry per level
+        to ``stats["levels"]``.
+        """
+        if not partials:
             return "No content provided."
 
-        partials = [
-            self.pipe(
-                p,
-                max_length=max_len,
-                min_length=min_len,
-                do_sample=False,
-                truncation=True,
-            )[0]["summary_text"]
-            for p in parts
-        ]
+        fan_in = stats["fan_in"]
+        while len(partials) > 1:
+            started = time.perf_counter()
+            groups = [
+                " ".join(partials[i:i + fan_in])
+                for i in range(0, len(partials), fan_in)
+            ]
+            reduced, cached = self._summarize_batch(groups, min_len, max_len, progress, "reduce")
+            stats["depth"] += 1
+            stats["levels"].append({
+                "level": stats["depth"],
+                "inputs": len(partials),
+                "outputs": len(reduced),
+                "cached": cached,
+                "seconds": round(time.perf_counter() - started, 4),
+            })
+            partials = reduced
+
+        return partials[0]
+
+    def summarize_tree(
+        self,
+        text: str,
+        min_len: int = SUMMARIZER_MIN_LEN,
+        max_len: int = SUMMARIZER_MAX_LEN,
+        progress: Optional[ProgressCallback] = None,
+        keep_ratio: Optional[float] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Map-reduce summarisation with a multi-level reduce tree.
+
+        Chunks are summarised (map), then partials are grouped ``fan_in`` at
+        a time and summarised again until a single summary remains, so no
+        reduce input is ever truncated and cost stays linear in chunks.
+        Returns the summary and stats (depth, fan-in, per-level timings).
+        ``progress`` is called as chunks complete ("summarize", then "reduce").
+        ``keep_ratio`` < 1 (default: the instance's) runs the extractive
+        pre-filter first and adds ``stats["prefilter"]``.
+        """
+        stats = self.new_stats(max_len)
 
-        combined = " ".join(partials)
-        if len(parts) > 1:
-            final = self.pipe(
-                combined,
-                max_length=max_len,
-                min_length=min_len,
-                do_sample=False,
-                truncation=True,
-            )[0]["summary_text"]
-            return final
-        return combined
+        keep_ratio = self.keep_ratio if keep_ratio is None else keep_ratio
+        if 0 < keep_ratio < 1 and text.strip():
+            parts, stats["prefilter"] = self.prefilter(text, keep_ratio)
+        else:
+            parts = self.chunk(text)
+        if not parts:
+            return "No content provided.", stats
+        stats["chunks"] = len(parts)
+
+        started = time.perf_counter()
+        partials, cached = self._summarize_batch(parts, min_len, max_len, progress, "summarize")
+        stats["levels"].append({
+            "level": 0,
+            "inputs": len(parts),
+            "outputs": len(partials),
+            "cached": cached,
+            "seconds": round(time.perf_counter() - started, 4),
+        })
+
+        summary = self.reduce_tree(partials, stats, min_len, max_len, progress)
+        return summary, stats
+
+    def summarize(self, text: str, min_len: int = SUMMARIZER_MIN_LEN, max_len: int = SUMMARIZER_MAX_LEN) -> str:
+        summary, _ = self.summarize_tree(text, min_len=min_len, max_len=max_len)
+        return summary
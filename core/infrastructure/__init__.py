@@ -2,6 +2,9 @@
 Infrastructure / Persistence layer:
 
 - ASR services (local Whisper, optional HF Inference).
+- Audio I/O (streamed ffmpeg decoding, windowing).
 - Export services (PDF).
-- Future: file handling adapters, caching, remote providers, etc.
+- Result caching.
+- Model registry and inference worker pool.
+- Future: file handling adapters, remote providers, etc.
 """
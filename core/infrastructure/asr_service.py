@@ -1,12 +1,22 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 
+import numpy as np
 import torch
 from transformers import pipeline
 from huggingface_hub import InferenceClient
 
-from core.config import ASR_MODEL_NAME, HF_API_KEY
+from core.config import (
+    ASR_MODEL_NAME,
+    ASR_STREAM_CHUNK_S,
+    ASR_STREAM_STRIDE_S,
+    ASR_VAD_ENABLED,
+    ASR_VAD_THRESHOLD_DB,
+    ASR_VAD_MIN_SILENCE_S,
+    HF_API_KEY,
+)
+from core.infrastructure.audio_io import SilenceTrimmer, iter_windows, stream_pcm
 
 
 class ITranscriber(ABC):
@@ -27,7 +37,13 @@ class WhisperLocalTranscriber(ITranscriber):
     - Purpose: convert audio → text.
     """
 
-    def __init__(self, model_name: str = ASR_MODEL_NAME, device: Optional[int] = None):
+    def __init__(
+        self,
+        model_name: str = ASR_MODEL_NAME,
+        device: Optional[int] = None,
+        vad: bool = ASR_VAD_ENABLED,
+    ):
+        self.vad = vad
         if device is None:
             device = 0 if torch.cuda.is_available() else -1
 
@@ -38,14 +54,132 @@ class WhisperLocalTranscriber(ITranscriber):
             device=device,
         )
 
+    def warm_up(self) -> None:
+        """Run one second of silence through the model."""
+        sr = self.pipe.feature_extractor.sampling_rate
+        self.pipe({"raw": np.zeros(sr, dtype=np.float32), "sampling_rate": sr})
+
+    def make_trimmer(self) -> SilenceTrimmer:
+        return SilenceTrimmer(
+            sampling_rate=self.pipe.feature_extractor.sampling_rate,
+            threshold_db=ASR_VAD_THRESHOLD_DB,
+            min_silence_s=ASR_VAD_MIN_SILENCE_S,
+        )
+
     def transcribe(self, audio_path: str) -> str:
+        return self.transcribe_segments(audio_path, return_timestamps=False)[0]
+
+    def transcribe_segments(
+        self,
+        audio_path: str,
+        return_timestamps: bool = True,
+        trimmer: Optional[SilenceTrimmer] = None,
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Whole-file transcription: text plus segments {"start", "end",
+        "text"} (seconds in the original recording, also with VAD on).
+        Pass a ``trimmer`` to read its skipped-audio stats afterwards.
+        """
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError("Audio file not found: %s" % audio_path)
+
+        kwargs = {"return_timestamps": True} if return_timestamps else {}
+        to_original = lambda t: t
+        if trimmer is None and self.vad:
+            trimmer = self.make_trimmer()
+        if trimmer is not None:
+            # Decode ourselves so long silences never reach the model
+            sr = trimmer.sampling_rate
+            kept = list(trimmer.process(stream_pcm(audio_path, sampling_rate=sr)))
+            if not kept:
+                return "", []
+            result = self.pipe({"raw": np.concatenate(kept), "sampling_rate": sr}, **kwargs)
+            to_original = trimmer.time_map.to_original
+        else:
+            result = self.pipe(audio_path, **kwargs)
+        if not isinstance(result, dict):
+            return str(result), []
+
+        segments = []
+        for seg in result.get("chunks", []):
+            seg_start, seg_end = seg.get("timestamp") or (0.0, None)
+            text = seg.get("text", "").strip()
+            if text:
+                seg_start = seg_start or 0.0
+                segments.append({
+                    "start": round(to_original(seg_start), 2),
+                    "end": round(to_original(seg_end if seg_end is not None else seg_start), 2),
+                    "text": text,
+                })
+        return result.get("text", ""), segments
+
+    def transcribe_stream(
+        self,
+        audio_path: str,
+        chunk_length_s: float = ASR_STREAM_CHUNK_S,
+        stride_s: float = ASR_STREAM_STRIDE_S,
+        trimmer: Optional[SilenceTrimmer] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Decode and transcribe in overlapping windows, yielding segments
+        {"start", "end", "text"} (seconds from the start of the recording)
+        as soon as each window is done. Memory is bounded by one window.
+
+        Segments are kept only from the middle of each window's overlap,
+        so words in the overlap are not emitted twice.
+
+        With VAD on, long silences are dropped before windowing and
+        timestamps are mapped back to the original recording; pass a
+        ``trimmer`` to read its skipped-audio stats afterwards.
+        """
         if not os.path.exists(audio_path):
             raise FileNotFoundError("Audio file not found: %s" % audio_path)
 
-        result = self.pipe(audio_path)
-        if isinstance(result, dict):
-            return result.get("text", "")
-        return str(result)
+        sr = self.pipe.feature_extractor.sampling_rate
+        yield from self.transcribe_blocks(
+            stream_pcm(audio_path, sampling_rate=sr), chunk_length_s, stride_s, trimmer
+        )
+
+    def transcribe_blocks(
+        self,
+        blocks: Iterable[np.ndarray],
+        chunk_length_s: float = ASR_STREAM_CHUNK_S,
+        stride_s: float = ASR_STREAM_STRIDE_S,
+        trimmer: Optional[SilenceTrimmer] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        transcribe_stream over mono float32 PCM blocks at the model's
+        sampling rate (e.g. from a LiveDecoder while still recording).
+        """
+        sr = self.pipe.feature_extractor.sampling_rate
+        half = stride_s / 2.0
+        if trimmer is None and self.vad:
+            trimmer = self.make_trimmer()
+        if trimmer is not None:
+            blocks = trimmer.process(blocks)
+        to_original = trimmer.time_map.to_original if trimmer is not None else (lambda t: t)
+
+        for start, samples, first, last in iter_windows(blocks, sr, chunk_length_s, stride_s):
+            length = len(samples) / sr
+            lo = start + (0.0 if first else half)
+            hi = start + length - (0.0 if last else half)
+
+            result = self.pipe(
+                {"raw": samples, "sampling_rate": sr},
+                return_timestamps=True,
+            )
+            for seg in result.get("chunks", []):
+                seg_start, seg_end = seg.get("timestamp") or (0.0, None)
+                seg_start = start + (seg_start or 0.0)
+                seg_end = start + seg_end if seg_end is not None else start + length
+                mid = (seg_start + seg_end) / 2.0
+                text = seg.get("text", "").strip()
+                if text and (lo <= mid < hi or (last and mid >= hi)):
+                    yield {
+                        "start": round(to_original(seg_start), 2),
+                        "end": round(to_original(seg_end), 2),
+                        "text": text,
+                    }
 
 
 class HFAPITranscriber(ITranscriber):
@@ -0,0 +1,398 @@
+"""
+Infrastructure / Audio I/O:
+
+- Stream-decode any ffmpeg-readable file to mono float32 PCM in blocks.
+- Cut the block stream into fixed, overlapping windows for ASR.
+- Energy-based silence trimming with a trimmed → original time map.
+- Live decoding of an encoded stream fed piece by piece (recording).
+
+Peak memory is one window plus one block, independent of recording length.
+"""
+import queue
+import subprocess
+import threading
+from bisect import bisect_right
+from collections import deque
+from typing import Deque, Dict, Iterator, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+SAMPLE_BYTES = 4  # float32
+
+
+def stream_pcm(
+    audio_path: str,
+    sampling_rate: int = 16000,
+    block_s: float = 10.0,
+) -> Iterator[np.ndarray]:
+    """
+    Yield mono float32 PCM blocks of ``block_s`` seconds decoded by ffmpeg.
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-loglevel", "error",
+        "-i", audio_path,
+        "-ac", "1", "-ar", str(sampling_rate),
+        "-f", "f32le", "-",
+    ]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        raise ValueError("ffmpeg was not found but is required to decode audio files")
+
+    block_bytes = int(block_s * sampling_rate) * SAMPLE_BYTES
+    try:
+        while True:
+            data = proc.stdout.read(block_bytes)
+            if not data:
+                break
+            usable = len(data) - len(data) % SAMPLE_BYTES
+            yield np.frombuffer(data[:usable], dtype=np.float32)
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        err = proc.stderr.read().decode("utf-8", "replace").strip()
+        proc.stderr.close()
+        proc.wait()
+
+    if proc.returncode != 0:
+        raise ValueError("ffmpeg could not decode %s: %s" % (audio_path, err))
+
+
+def probe_duration(audio_path: str) -> Optional[float]:
+    """Length of an audio file in seconds from ffprobe, or None if unknown."""
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        audio_path,
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        return float(out.stdout.strip())
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+class LiveDecoder:
+    """
+    One long-running ffmpeg that decodes an encoded byte stream fed in
+    pieces, e.g. MediaRecorder chunks (only the first carries the webm
+    header, so chunks cannot be decoded on their own). ``blocks()`` yields
+    PCM as soon as ffmpeg produces it and ends after ``close()``.
+    """
+
+    def __init__(self, sampling_rate: int = 16000, block_s: float = 1.0):
+        cmd = [
+            "ffmpeg", "-loglevel", "error",
+            "-probesize", "32768", "-fflags", "nobuffer",
+            "-i", "pipe:0",
+            "-ac", "1", "-ar", str(sampling_rate),
+            "-f", "f32le", "pipe:1",
+        ]
+        try:
+            self.proc = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except FileNotFoundError:
+            raise ValueError("ffmpeg was not found but is required to decode audio files")
+
+        self.sampling_rate = sampling_rate
+        self.bytes_in = 0
+        self._block_bytes = int(block_s * sampling_rate) * SAMPLE_BYTES
+        self._queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read, name="live-decoder", daemon=True)
+        self._reader.start()
+
+    def _read(self) -> None:
+        rest = b""
+        try:
+            while True:
+                data = self.proc.stdout.read1(self._block_bytes)
+                if not data:
+                    break
+                data = rest + data
+                usable = len(data) - len(data) % SAMPLE_BYTES
+                rest = data[usable:]
+                if usable:
+                    self._queue.put(np.frombuffer(data[:usable], dtype=np.float32))
+        finally:
+            self._queue.put(None)
+
+    def feed(self, data: bytes) -> None:
+        self.bytes_in += len(data)
+        try:
+            self.proc.stdin.write(data)
+            self.proc.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            raise ValueError("Audio decoder stopped; the recording stream is not decodable")
+
+    def close(self) -> None:
+        """End of input: ffmpeg drains and ``blocks()`` finishes."""
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+
+    def kill(self) -> None:
+        if self.proc.poll() is None:
+            self.proc.kill()
+        self.close()
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        while True:
+            block = self._queue.get()
+            if block is None:
+                break
+            yield block
+        self.proc.stdout.close()
+        if self.proc.wait() != 0 and self.bytes_in:
+            raise ValueError("ffmpeg could not decode the recorded audio stream")
+
+
+def rebuffer(blocks: Iterable[np.ndarray], block_len: int) -> Iterator[np.ndarray]:
+    """Re-cut PCM blocks of any size into ``block_len`` samples (the last may be shorter)."""
+    pending: List[np.ndarray] = []
+    size = 0
+    for block in blocks:
+        pending.append(block)
+        size += len(block)
+        if size < block_len:
+            continue
+        buf = np.concatenate(pending)
+        n = len(buf) - len(buf) % block_len
+        for i in range(0, n, block_len):
+            yield buf[i:i + block_len]
+        pending = [buf[n:]] if n < len(buf) else []
+        size = len(buf) - n
+    if size:
+        yield np.concatenate(pending)
+
+
+def iter_windows(
+    blocks: Iterable[np.ndarray],
+    sampling_rate: int,
+    window_s: float,
+    overlap_s: float,
+) -> Iterator[Tuple[float, np.ndarray, bool, bool]]:
+    """
+    Re-cut PCM blocks into windows of ``window_s`` seconds that overlap by
+    ``overlap_s``. Yields (start_seconds, samples, is_first, is_last).
+
+    One window is held back so the last one can be flagged.
+    """
+    win = int(window_s * sampling_rate)
+    hop = max(1, win - int(overlap_s * sampling_rate))
+
+    buf = np.zeros(0, dtype=np.float32)
+    offset = 0  # sample index of buf[0]
+    pending = None
+    first = True
+
+    for block in blocks:
+        buf = np.concatenate([buf, block]) if len(buf) else block
+        while len(buf) >= win:
+            if pending is not None:
+                yield pending
+                first = False
+            pending = (offset / sampling_rate, buf[:win].copy(), first, False)
+            buf = buf[hop:]
+            offset += hop
+
+    # Tail: whatever follows the last full window's hop
+    tail_is_new = pending is None or len(buf) > win - hop
+    if pending is not None:
+        if tail_is_new:
+            yield pending
+            first = False
+        else:
+            start, samples, is_first, _ = pending
+            yield start, samples, is_first, True
+            return
+
+    if len(buf):
+        yield offset / sampling_rate, buf.copy(), first, True
+
+
+# ------------------------------------------------------------
+# SILENCE TRIMMING (energy VAD)
+# ------------------------------------------------------------
+class TimeMap:
+    """
+    Piecewise mapping from trimmed-audio time back to original time.
+    Each kept span starts at ``trimmed_starts[i]`` in the trimmed audio and
+    at ``orig_starts[i]`` in the original recording.
+    """
+
+    def __init__(self):
+        self.trimmed_starts: List[float] = []
+        self.orig_starts: List[float] = []
+
+    def add(self, trimmed_start: float, orig_start: float) -> None:
+        self.trimmed_starts.append(trimmed_start)
+        self.orig_starts.append(orig_start)
+
+    def to_original(self, t: float) -> float:
+        if not self.trimmed_starts:
+            return t
+        i = max(0, bisect_right(self.trimmed_starts, t) - 1)
+        return self.orig_starts[i] + (t - self.trimmed_starts[i])
+
+
+def _frame_levels_db(frames: np.ndarray) -> np.ndarray:
+    rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+def speech_mask(
+    samples: np.ndarray,
+    frame_len: int,
+    threshold_db: float,
+    min_silence_frames: int,
+    pad_frames: int,
+) -> np.ndarray:
+    """
+    Per-frame keep mask: frames whose RMS level is above ``threshold_db``
+    (dBFS), widened by ``pad_frames`` on both sides. Silent runs shorter
+    than ``min_silence_frames`` are kept so speech is not chopped.
+    SilenceTrimmer applies the same rule incrementally.
+    """
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        return np.ones(1 if len(samples) else 0, dtype=bool)
+
+    frames = samples[: n_frames * frame_len].reshape(n_frames, frame_len)
+    mask = _frame_levels_db(frames) > threshold_db
+
+    if pad_frames > 0:
+        # Sliding max over 2 * pad + 1 frames; keeps the length for any n_frames
+        width = 2 * pad_frames + 1
+        padded = np.concatenate((np.zeros(pad_frames), mask, np.zeros(pad_frames)))
+        counts = np.cumsum(np.concatenate(([0.0], padded)))
+        mask = (counts[width:] - counts[:-width]) > 0
+
+    # Re-admit short silent runs
+    edges = np.diff(np.concatenate(([1], mask.astype(np.int8), [1])))
+    starts = np.flatnonzero(edges == -1)
+    ends = np.flatnonzero(edges == 1)
+    short = (ends - starts) < min_silence_frames
+    for a, b in zip(starts[short], ends[short]):
+        mask[a:b] = True
+
+    # Trailing partial frame follows the last full frame
+    if len(samples) > n_frames * frame_len:
+        mask = np.append(mask, mask[-1])
+    return mask
+
+
+class SilenceTrimmer:
+    """
+    Streams PCM blocks through an energy VAD, dropping long silences.
+
+    Frames are judged as they arrive and the state carries over block
+    boundaries: a silent run is held back (at most ``min_silence + pad``
+    frames) until speech resumes while it is still short, or it is long
+    enough to drop. The output is the same as speech_mask over the whole
+    recording, whatever the block size. ``time_map`` maps trimmed
+    timestamps back to the original recording.
+    """
+
+    def __init__(
+        self,
+        sampling_rate: int = 16000,
+        threshold_db: float = -40.0,
+        min_silence_s: float = 0.6,
+        pad_s: float = 0.2,
+        frame_ms: float = 30.0,
+    ):
+        self.sampling_rate = sampling_rate
+        self.frame_len = max(1, int(sampling_rate * frame_ms / 1000.0))
+        self.threshold_db = threshold_db
+        self.min_silence_frames = max(1, int(min_silence_s * 1000.0 / frame_ms))
+        self.pad_frames = int(pad_s * 1000.0 / frame_ms)
+        self.time_map = TimeMap()
+        self.samples_in = 0
+        self.samples_kept = 0
+
+        self._rest = np.zeros(0, dtype=np.float32)  # partial frame, completed by the next block
+        self._frames_in = 0
+        self._after_speech = False
+        self._run = 0  # silent frames since the last loud one
+        self._held: Deque[Tuple[int, np.ndarray]] = deque()  # (original sample, frame) undecided
+        self._confirmed = False  # current silent run is long enough to drop
+        self._next_orig: Optional[int] = None  # original sample following the last kept one
+
+    def process(self, blocks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        for block in blocks:
+            self.samples_in += len(block)
+            kept = self._feed(block)
+            if kept:
+                yield np.concatenate(kept)
+        kept = self._flush()
+        if kept:
+            yield np.concatenate(kept)
+
+    def _keep(self, orig: int, samples: np.ndarray, out: List[np.ndarray]) -> None:
+        # A gap in the original timeline starts a new span in the time map
+        if orig != self._next_orig:
+            self.time_map.add(self.samples_kept / self.sampling_rate, orig / self.sampling_rate)
+        out.append(samples)
+        self.samples_kept += len(samples)
+        self._next_orig = orig + len(samples)
+
+    def _feed(self, block: np.ndarray) -> List[np.ndarray]:
+        fl = self.frame_len
+        buf = np.concatenate((self._rest, block)) if len(self._rest) else block
+        n = len(buf) // fl
+        self._rest = buf[n * fl:].copy()
+        if n == 0:
+            return []
+
+        frames = buf[: n * fl].reshape(n, fl)
+        loud = _frame_levels_db(frames) > self.threshold_db
+        base = self._frames_in * fl
+        self._frames_in += n
+        out: List[np.ndarray] = []
+        for i in range(n):
+            orig = base + i * fl
+            if loud[i]:
+                # Short pause: all of it; long pause: only the lead-in padding
+                for held_orig, held in self._held:
+                    self._keep(held_orig, held, out)
+                self._held.clear()
+                self._keep(orig, frames[i], out)
+                self._after_speech, self._run, self._confirmed = True, 0, False
+                continue
+
+            self._run += 1
+            if self._after_speech and self._run <= self.pad_frames:
+                self._keep(orig, frames[i], out)  # padding after speech
+                continue
+            self._held.append((orig, frames[i].copy()))
+            if not self._confirmed and len(self._held) - self.pad_frames >= self.min_silence_frames:
+                self._confirmed = True
+            if self._confirmed:
+                while len(self._held) > self.pad_frames:
+                    self._held.popleft()
+        return out
+
+    def _flush(self) -> List[np.ndarray]:
+        # No speech follows, so held frames need no lead-in padding
+        keep = not self._confirmed and len(self._held) < self.min_silence_frames
+        out: List[np.ndarray] = []
+        if keep:
+            for held_orig, held in self._held:
+                self._keep(held_orig, held, out)
+            if len(self._rest):
+                self._keep(self._frames_in * self.frame_len, self._rest, out)
+        self._held.clear()
+        self._rest = np.zeros(0, dtype=np.float32)
+        return out
+
+    def stats(self) -> Dict[str, float]:
+        sr = float(self.sampling_rate)
+        return {
+            "audio_seconds": round(self.samples_in / sr, 2),
+            "kept_seconds": round(self.samples_kept / sr, 2),
+            "skipped_fraction": round(1.0 - self.samples_kept / self.samples_in, 4) if self.samples_in else 0.0,
+        }
@@ -0,0 +1,273 @@
+"""
+Infrastructure / Caching adapter:
+
+Content-addressed result cache with two tiers:
+- bounded in-memory LRU (per process),
+- optional on-disk JSON records with size-based eviction.
+Rendered files (exports) go to a separate size-bounded disk LRU.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+_WS = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so cosmetic edits hit the same cache entry."""
+    return _WS.sub(" ", (text or "").strip())
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def hash_file(path: str, block_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def hash_json(value: Any) -> str:
+    """Hash of a JSON-serialisable value (key order does not matter)."""
+    raw = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def make_key(kind: str, content_hash: str, params: Iterable[Any]) -> str:
+    """
+    Cache key = kind + content hash + everything that changes the output
+    (model names, length settings, reference date, ...).
+    """
+    raw = "|".join([kind, content_hash] + [str(p) for p in params])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe two-tier cache of JSON-serialisable results.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 128,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 200 * 1024 * 1024,
+    ):
+        self.max_items = max_items
+        self.disk_dir = str(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self._mem: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    # ---------- public API ----------
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return self._mem[key]
+
+        value = self._disk_get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._mem_put(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._mem_put(key, value)
+        self._disk_put(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+        if self.disk_dir:
+            for entry in os.scandir(self.disk_dir):
+                if entry.name.endswith(".json"):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_items": len(self._mem),
+            }
+
+    # ---------- memory tier ----------
+    def _mem_put(self, key: str, value: Any) -> None:
+        self._mem[key] = value
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_items:
+            self._mem.popitem(last=False)
+
+    # ---------- disk tier ----------
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + ".json")
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)  # recency for eviction
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def _disk_put(self, key: str, value: Any) -> None:
+        if not self.disk_dir:
+            return
+        path = self._path(key)
+        tmp = _temp_path(path)
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            logger.warning("Could not write cache entry: %s", path)
+            _remove_quietly(tmp)
+            return
+        self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        _evict_lru(self.disk_dir, ".json", self.disk_max_bytes)
+
+
+def _temp_path(path: str) -> str:
+    # Unique per writer (process and thread), so concurrent writes of the
+    # same key never share a temp file; os.replace makes the last one win.
+    return "%s.%d.%d.tmp" % (path, os.getpid(), threading.get_ident())
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _evict_lru(disk_dir: str, suffix: str, max_bytes: int) -> None:
+    """Delete least recently used files (by mtime) until under max_bytes."""
+    entries = []
+    total = 0
+    for entry in os.scandir(disk_dir):
+        if not entry.name.endswith(suffix):
+            continue
+        try:
+            st = entry.stat()
+        except OSError:  # removed meanwhile (e.g. evicted by another process)
+            continue
+        entries.append((st.st_mtime, st.st_size, entry.path))
+        total += st.st_size
+
+    if total <= max_bytes:
+        return
+
+    entries.sort()  # oldest first
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+class FileCache:
+    """
+    Size-bounded disk LRU of binary files (e.g. rendered exports), keyed
+    like ResultCache. A hit opens the stored file, so serving it does no
+    work beyond the copy to the client.
+    """
+
+    def __init__(self, disk_dir: Optional[str], disk_max_bytes: int = 200 * 1024 * 1024, suffix: str = ".bin"):
+        self.disk_dir = str(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + self.suffix)
+
+    def open(self, key: str) -> Optional[BinaryIO]:
+        """Stored file opened for reading (caller closes it), or None."""
+        f = None
+        if self.disk_dir:
+            path = self._path(key)
+            try:
+                f = open(path, "rb")
+                os.utime(path)  # recency for eviction
+            except OSError:
+                pass
+        with self._lock:
+            if f is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return f
+
+    def put(self, key: str, src: BinaryIO) -> Optional[BinaryIO]:
+        """
+        Copy ``src`` (from its current position) into the cache and return
+        the stored file opened for reading, or None if it was not stored.
+        """
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        tmp = _temp_path(path)
+        try:
+            with open(tmp, "wb") as f:
+                shutil.copyfileobj(src, f)
+            os.replace(tmp, path)
+            stored = open(path, "rb")
+        except OSError:
+            logger.warning("Could not write cache file: %s", path)
+            _remove_quietly(tmp)
+            return None
+        _evict_lru(self.disk_dir, self.suffix, self.disk_max_bytes)
+        return stored
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
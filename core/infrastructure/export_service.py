@@ -1,20 +1,72 @@
 import io
-from typing import List, Dict, Optional
+import tempfile
+from typing import BinaryIO, List, Dict, Optional
 
 from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
 
-
-def export_meeting_to_pdf(
+# Part of the export cache key: bump whenever the rendered output changes
+PDF_LAYOUT_VERSION = 1
+
+
+class WordWidths:
+    """
+    Word widths for one font, cached in font units (1/1000 em). Standard
+    fonts have no kerning, so a line's width is the sum of its words and
+    spaces and can be accumulated word by word.
+    """
+
+    def __init__(self, font: str, size: float):
+        self.font = font
+        self.scale = size / 1000.0
+        self._units: Dict[str, float] = {}
+        self.space = self.units(" ")
+
+    def units(self, word: str) -> float:
+        units = self._units.get(word)
+        if units is None:
+            units = self._units[word] = stringWidth(word, self.font, 1000)
+        return units
+
+
+def wrap_words(text: str, widths: WordWidths, max_width: float) -> List[str]:
+    """
+    Wrap text into lines narrower than max_width (points). Linear in the
+    number of words: each word is measured once per font.
+    """
+    max_units = max_width / widths.scale
+    lines = []
+    current: List[str] = []
+    line_units = 0.0
+
+    for word in text.split():
+        word_units = widths.units(word)
+        test_units = line_units + widths.space + word_units if current else word_units
+        if test_units < max_units:
+            current.append(word)
+            line_units = test_units
+        else:
+            lines.append(" ".join(current))
+            current = [word]
+            line_units = word_units
+
+    if current:
+        lines.append(" ".join(current))
+
+    return lines
+
+
+def write_meeting_pdf(
+    out: BinaryIO,
     transcript: Optional[str],
     summary: str,
     actions: List[str],
     dates: List[Dict[str, str]],
-) -> bytes:
-
-    buffer = io.BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=A4)
+) -> None:
+    """Lay out the meeting report and write the PDF to ``out``."""
+    pdf = canvas.Canvas(out, pagesize=A4)
     width, height = A4
 
     LEFT = 20 * mm
@@ -26,28 +78,7 @@ def export_meeting_to_pdf(
 
     pdf.setFont("Helvetica", 10)
 
-    # ---------- WORD WRAP FUNCTION ----------
-    def wrap_text(text: str, font="Helvetica", size=10):
-        """
-        Wrap text into lines that fit within WRAP_WIDTH.
-        """
-        pdf.setFont(font, size)
-        words = text.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            if pdf.stringWidth(test_line, font, size) < WRAP_WIDTH:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word
-
-        if current_line:
-            lines.append(current_line)
-
-        return lines
+    body_widths = WordWidths("Helvetica", 10)
 
     # ---------- BLOCK WRITER (handles page breaks + wrapping) ----------
     def write_block(title: str, text: str, y: float):
@@ -68,7 +99,7 @@ def export_meeting_to_pdf(
                 y -= LINE_HEIGHT
                 continue
 
-            wrapped_lines = wrap_text(para)
+            wrapped_lines = wrap_words(para, body_widths, WRAP_WIDTH)
 
             for line in wrapped_lines:
                 if y < BOTTOM:
@@ -103,5 +134,35 @@ def export_meeting_to_pdf(
     y = write_block("Important Dates:", date_text, y)
 
     pdf.save()
-    buffer.seek(0)
+
+
+def export_meeting_to_pdf(
+    transcript: Optional[str],
+    summary: str,
+    actions: List[str],
+    dates: List[Dict[str, str]],
+) -> bytes:
+    buffer = io.BytesIO()
+    write_meeting_pdf(buffer, transcript, summary, actions, dates)
     return buffer.getvalue()
+
+
+def export_meeting_to_pdf_file(
+    transcript: Optional[str],
+    summary: str,
+    actions: List[str],
+    dates: List[Dict[str, str]],
+) -> BinaryIO:
+    """
+    PDF in an anonymous temp file, rewound, for streaming responses.
+    ReportLab still builds the whole document in memory when it saves;
+    this only avoids copying it again into a bytes object and the response.
+    """
+    out = tempfile.TemporaryFile()
+    try:
+        write_meeting_pdf(out, transcript, summary, actions, dates)
+    except Exception:
+        out.close()
+        raise
+    out.seek(0)
+    return out
@@ -0,0 +1,236 @@
+"""
+Infrastructure / Export registry:
+
+Named writers that turn a meeting result into a document. Text formats
+are generated in one pass as a stream of string pieces (the transcript
+is emitted in slices), so no complete document is ever built in memory.
+
+A meeting is a dict with "transcript", "summary", "actions", "dates"
+and optionally "segments" ([{"start", "end", "text"}], seconds) and
+"source" ("audio" / "text").
+"""
+import html
+import json
+import re
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from core.infrastructure.export_service import PDF_LAYOUT_VERSION, export_meeting_to_pdf_file
+
+Meeting = Dict[str, Any]
+Writer = Callable[[Meeting], Iterator[Any]]
+
+# Transcript slice size for the streaming writers (characters)
+_SLICE = 16 * 1024
+# Sentences end at punctuation or a line break (paragraphs without a full stop)
+_SENTENCE = re.compile(r"[^.!?\n]+[.!?]*")
+# Subtitle timing for text input, which has no ASR timestamps (typical speech rate)
+_WORDS_PER_SECOND = 2.5
+_ESTIMATED_NOTE = "Timings are estimated from word count (text input, no audio timestamps)."
+
+
+class Exporter:
+    def __init__(self, name: str, writer: Writer, content_type: str, extension: str, version: int = 1, binary: bool = False):
+        self.name = name
+        self.writer = writer
+        self.content_type = content_type
+        self.extension = extension
+        self.version = version  # part of the cache key / ETag; bump when output changes
+        self.binary = binary  # writer yields bytes instead of str
+
+
+_REGISTRY: Dict[str, Exporter] = {}
+
+
+def register_exporter(name: str, content_type: str, extension: str, version: int = 1, binary: bool = False):
+    """Decorator: register ``writer(meeting)`` as export format ``name``."""
+
+    def decorator(writer: Writer) -> Writer:
+        _REGISTRY[name] = Exporter(name, writer, content_type, extension, version, binary)
+        return writer
+
+    return decorator
+
+
+def get_exporter(name: str) -> Exporter:
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise ValueError(
+            "Unknown export format %r (expected one of %s)" % (name, ", ".join(export_formats()))
+        ) from None
+
+
+def export_formats() -> List[str]:
+    return sorted(_REGISTRY)
+
+
+# ---------- helpers ----------
+def _slices(text: str) -> Iterator[str]:
+    for i in range(0, len(text), _SLICE):
+        yield text[i:i + _SLICE]
+
+
+def _paragraphs(text: str) -> Iterator[str]:
+    """Non-empty lines, without splitting the whole text up front."""
+    start = 0
+    while start <= len(text):
+        end = text.find("\n", start)
+        if end < 0:
+            end = len(text)
+        line = text[start:end].strip()
+        if line:
+            yield line
+        start = end + 1
+
+
+def _estimated_timing(meeting: Meeting) -> bool:
+    """Text input: cues are estimated (audio results carry real segments)."""
+    return not meeting.get("segments") and meeting.get("source") == "text"
+
+
+def _cues(meeting: Meeting) -> Iterator[Tuple[float, float, str]]:
+    segments = meeting.get("segments")
+    if segments:
+        for seg in segments:
+            text = _cue_text(seg["text"])
+            if text:
+                yield seg["start"], seg["end"] if seg.get("end") is not None else seg["start"], text
+        return
+    if not _estimated_timing(meeting):
+        # Audio without stored timestamps: no cues rather than made-up times
+        return
+
+    # Text input: one cue per sentence, timed by word count
+    t = 0.0
+    for m in _SENTENCE.finditer(meeting.get("transcript") or ""):
+        text = _cue_text(m.group(0))
+        if not text:
+            continue
+        duration = max(1.0, len(text.split()) / _WORDS_PER_SECOND)
+        yield t, t + duration, text
+        t += duration
+
+
+def _cue_text(text: str) -> str:
+    # One line: a blank line would end the cue in SRT/VTT
+    return " ".join(text.split())
+
+
+def _timestamp(seconds: float, sep: str) -> str:
+    ms = int(round(seconds * 1000))
+    h, ms = divmod(ms, 3600000)
+    m, ms = divmod(ms, 60000)
+    s, ms = divmod(ms, 1000)
+    return "%02d:%02d:%02d%s%03d" % (h, m, s, sep, ms)
+
+
+def _md_cell(text: str) -> str:
+    return text.replace("|", "\\|").replace("\n", " ")
+
+
+# ---------- writers ----------
+@register_exporter("pdf", "application/pdf", "pdf", version=PDF_LAYOUT_VERSION, binary=True)
+def write_pdf(meeting: Meeting) -> Iterator[bytes]:
+    with export_meeting_to_pdf_file(
+        meeting.get("transcript"), meeting["summary"], meeting["actions"], meeting["dates"]
+    ) as f:
+        yield from iter(lambda: f.read(64 * 1024), b"")
+
+
+@register_exporter("json", "application/json", "json")
+def write_json(meeting: Meeting) -> Iterator[str]:
+    yield '{"summary": %s, "actions": %s, "dates": %s, "transcript": "' % (
+        json.dumps(meeting["summary"]),
+        json.dumps(meeting["actions"]),
+        json.dumps(meeting["dates"]),
+    )
+    for piece in _slices(meeting.get("transcript") or ""):
+        yield json.dumps(piece)[1:-1]
+    yield '", "segments": ['
+    for i, seg in enumerate(meeting.get("segments") or []):
+        yield (", " if i else "") + json.dumps(seg)
+    yield "]}\n"
+
+
+@register_exporter("md", "text/markdown; charset=utf-8", "md")
+def write_markdown(meeting: Meeting) -> Iterator[str]:
+    yield "# Meeting Summary\n\n## Summary\n\n%s\n\n## Action Items\n\n" % meeting["summary"]
+    if meeting["actions"]:
+        for action in meeting["actions"]:
+            yield "- [ ] %s\n" % action
+    else:
+        yield "_No action items found._\n"
+
+    yield "\n## Important Dates\n\n"
+    if meeting["dates"]:
+        yield "| Date | Context |\n| --- | --- |\n"
+        for d in meeting["dates"]:
+            yield "| %s | %s |\n" % (_md_cell(d["date"]), _md_cell(d["context"]))
+    else:
+        yield "_No important dates found._\n"
+
+    transcript = meeting.get("transcript") or ""
+    if transcript:
+        yield "\n## Transcript\n\n"
+        for para in _paragraphs(transcript):
+            yield para
+            yield "\n\n"
+
+
+@register_exporter("html", "text/html; charset=utf-8", "html")
+def write_html(meeting: Meeting) -> Iterator[str]:
+    esc = html.escape
+    yield (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head><meta charset=\"utf-8\">"
+        "<title>Meeting Summary</title></head>\n<body>\n"
+        "<h1>Meeting Summary</h1>\n<h2>Summary</h2>\n<p>%s</p>\n<h2>Action Items</h2>\n" % esc(meeting["summary"])
+    )
+    if meeting["actions"]:
+        yield "<ul>\n"
+        for action in meeting["actions"]:
+            yield "<li>%s</li>\n" % esc(action)
+        yield "</ul>\n"
+    else:
+        yield "<p><em>No action items found.</em></p>\n"
+
+    yield "<h2>Important Dates</h2>\n"
+    if meeting["dates"]:
+        yield "<table>\n<tr><th>Date</th><th>Context</th></tr>\n"
+        for d in meeting["dates"]:
+            yield "<tr><td>%s</td><td>%s</td></tr>\n" % (esc(d["date"]), esc(d["context"]))
+        yield "</table>\n"
+    else:
+        yield "<p><em>No important dates found.</em></p>\n"
+
+    transcript = meeting.get("transcript") or ""
+    if transcript:
+        yield "<h2>Transcript</h2>\n"
+        for para in _paragraphs(transcript):
+            yield "<p>"
+            for piece in _slices(para):
+                yield esc(piece)
+            yield "</p>\n"
+    yield "</body>\n</html>\n"
+
+
+@register_exporter("srt", "application/x-subrip; charset=utf-8", "srt", version=3)
+def write_srt(meeting: Meeting) -> Iterator[str]:
+    cues = _cues(meeting)
+    first = 1
+    if _estimated_timing(meeting):
+        # SRT has no comments, so the label is a 1-second cue before the text
+        yield "1\n%s --> %s\n[%s]\n\n" % (_timestamp(0, ","), _timestamp(1, ","), _ESTIMATED_NOTE)
+        cues = ((start + 1, end + 1, text) for start, end, text in cues)
+        first = 2
+    for i, (start, end, text) in enumerate(cues, first):
+        yield "%d\n%s --> %s\n%s\n\n" % (i, _timestamp(start, ","), _timestamp(end, ","), text)
+
+
+@register_exporter("vtt", "text/vtt; charset=utf-8", "vtt", version=3)
+def write_vtt(meeting: Meeting) -> Iterator[str]:
+    yield "WEBVTT\n\n"
+    if _estimated_timing(meeting):
+        yield "NOTE %s\n\n" % _ESTIMATED_NOTE
+    for start, end, text in _cues(meeting):
+        # &, < and > (so also "-->") must be escaped in WebVTT cue text
+        yield "%s --> %s\n%s\n\n" % (_timestamp(start, "."), _timestamp(end, "."), html.escape(text, quote=False))
@@ -0,0 +1,84 @@
+"""
+Infrastructure / CPU inference modes:
+
+Numeric precision for a loaded transformers pipeline and process-wide
+PyTorch thread settings.
+- fp32: the model as downloaded.
+- int8: dynamic int8 quantisation of all nn.Linear layers (weights int8,
+  activations quantised on the fly); CPU only.
+- bf16: bfloat16 weights and activations; only used when the CPU has
+  native bf16 instructions, otherwise falls back to fp32.
+"""
+import logging
+from typing import Any
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_MODES = ("fp32", "int8", "bf16")
+
+_threads_configured = False
+
+
+def configure_torch_threads(intra_op: int = 0, inter_op: int = 0) -> None:
+    """
+    Set PyTorch intra-/inter-op thread counts (0 = keep torch's default).
+    Only the first call in a process has an effect: inter-op threads
+    cannot be changed once torch has started parallel work.
+    """
+    global _threads_configured
+    if _threads_configured:
+        return
+    _threads_configured = True
+    if intra_op > 0:
+        torch.set_num_threads(intra_op)
+    if inter_op > 0:
+        try:
+            torch.set_num_interop_threads(inter_op)
+        except RuntimeError:
+            logger.warning("Inter-op threads already in use; keeping %d", torch.get_num_interop_threads())
+
+
+def cpu_supports_bf16() -> bool:
+    """True when the CPU advertises native bf16 (AVX512-BF16 or AMX)."""
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            flags = f.read()
+    except OSError:
+        flags = ""
+    if "avx512_bf16" in flags or "amx_bf16" in flags:
+        return True
+    capability = getattr(getattr(torch.backends, "cpu", None), "get_cpu_capability", lambda: "")()
+    return "AMX" in str(capability).upper()
+
+
+def apply_inference_mode(pipe: Any, mode: str) -> str:
+    """
+    Convert ``pipe.model`` in place to ``mode``; returns the mode actually
+    applied (requests that cannot be honoured fall back to fp32).
+    """
+    mode = (mode or "fp32").lower()
+    if mode not in INFERENCE_MODES:
+        raise ValueError("Unknown inference mode %r (expected one of %s)" % (mode, ", ".join(INFERENCE_MODES)))
+    if mode == "fp32":
+        return mode
+
+    model = pipe.model
+    if getattr(pipe, "device", torch.device("cpu")).type != "cpu":
+        logger.warning("Inference mode %s is CPU-only; model is on %s, keeping fp32", mode, pipe.device)
+        return "fp32"
+
+    if mode == "int8":
+        pipe.model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        return mode
+
+    if not cpu_supports_bf16():
+        logger.warning("CPU has no native bf16 support; keeping fp32")
+        return "fp32"
+    pipe.model = model.to(torch.bfloat16)
+    # Pipelines cast float inputs (e.g. Whisper features) to this dtype
+    pipe.torch_dtype = torch.bfloat16
+    return mode
@@ -0,0 +1,243 @@
+"""
+Infrastructure / Inference worker pool:
+
+Runs model inference in N separate processes so web threads never share
+the GIL or PyTorch thread pools with it, and a crashing model cannot take
+the web server down.
+- Each worker owns its own models and torch thread budget.
+- Backpressure: at most ``workers + max_queued`` calls in flight;
+  further callers wait up to ``acquire_timeout`` then get InferencePoolBusy.
+- A crashed worker breaks the pool; it is rebuilt automatically and only
+  the affected calls fail.
+- A call running longer than ``call_timeout`` fails; its worker is killed
+  and the pool rebuilt (calls running on the other workers fail too).
+- Progress (and any other named callback, e.g. a draft result) reported
+  inside a worker is relayed to the caller's callback.
+"""
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long a finished call waits for its relayed callbacks to be delivered
+_RELAY_TIMEOUT_S = 10.0
+
+# ---------- worker side ----------
+_progress_queue = None
+_STARTED = "__started__"  # relayed when a worker picks a call up
+_DONE = "__done__"  # relayed after the call's last callback
+
+
+def _init_worker(progress_queue, torch_threads: Optional[int], worker_init: Optional[Callable[[], None]]) -> None:
+    global _progress_queue
+    _progress_queue = progress_queue
+
+    if torch_threads:
+        import torch
+        torch.set_num_threads(torch_threads)
+
+    if worker_init is not None:
+        worker_init()
+
+
+def _call(task_id: int, fn: Callable[..., Any], args: tuple, callbacks: Tuple[str, ...]) -> Any:
+    def relay(name: str) -> Callable[..., None]:
+        def send(*cb_args: Any) -> None:
+            _progress_queue.put((task_id, name, cb_args))
+        return send
+
+    _progress_queue.put((task_id, _STARTED, ()))
+    try:
+        return fn(*args, **{name: relay(name) for name in callbacks})
+    finally:
+        _progress_queue.put((task_id, _DONE, ()))
+
+
+def _noop() -> int:
+    return os.getpid()
+
+
+# ---------- parent side ----------
+class InferencePoolBusy(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class InferencePool:
+    def __init__(
+        self,
+        workers: int,
+        max_queued: int = 0,
+        torch_threads: Optional[int] = None,
+        worker_init: Optional[Callable[[], None]] = None,
+        acquire_timeout: Optional[float] = None,
+        call_timeout: Optional[float] = None,
+    ):
+        self.workers = workers
+        self.torch_threads = torch_threads or max(1, (os.cpu_count() or 1) // workers)
+        self.worker_init = worker_init
+        self.acquire_timeout = acquire_timeout
+        self.call_timeout = call_timeout
+
+        # spawn: no forked torch/thread state, same behaviour on every OS
+        self._ctx = multiprocessing.get_context("spawn")
+        self._progress_queue = self._ctx.Queue()
+        self._slots = threading.BoundedSemaphore(workers + max_queued)
+        self._callbacks: Dict[int, Dict[str, Callable[..., None]]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+        self.busy = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+        self._executor = self._new_executor()
+        self._listener = threading.Thread(target=self._listen, name="inference-progress", daemon=True)
+        self._listener.start()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._ctx,
+            initializer=_init_worker,
+            initargs=(self._progress_queue, self.torch_threads, self.worker_init),
+        )
+
+    def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        progress: Optional[Callable[[str, int, int], None]] = None,
+        **callbacks: Optional[Callable[..., None]],
+    ) -> Any:
+        """
+        Run ``fn(*args, progress=..., **callbacks)`` in a worker and return
+        its result. ``fn`` must be a picklable module-level function. Calls
+        to ``progress`` and to each other callback given (not None) are
+        relayed back here; their arguments must be picklable. All relayed
+        calls have been delivered when run() returns.
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise InferencePoolBusy("All inference workers are busy, please retry shortly.")
+
+        task_id = next(self._ids)
+        callbacks = {name: cb for name, cb in callbacks.items() if cb is not None}
+        callbacks["progress"] = progress
+        started, relayed = threading.Event(), threading.Event()
+        self._callbacks[task_id] = dict(callbacks, **{_STARTED: started.set, _DONE: relayed.set})
+        with self._lock:
+            executor = self._executor
+            self.busy += 1
+        try:
+            future = executor.submit(_call, task_id, fn, args, tuple(callbacks))
+            try:
+                result = self._wait(future, started)
+            except (FutureTimeout, BrokenProcessPool):
+                raise
+            except Exception:
+                self._drain_callbacks(task_id, relayed)
+                raise
+            self._drain_callbacks(task_id, relayed)
+            with self._lock:
+                self.completed += 1
+            return result
+        except FutureTimeout:
+            self._callbacks.pop(task_id, None)
+            self._restart(executor, kill=True)
+            with self._lock:
+                self.failed += 1
+                self.timeouts += 1
+            raise RuntimeError(
+                "Inference took longer than %g seconds and was stopped; the worker has been restarted."
+                % self.call_timeout
+            )
+        except BrokenProcessPool:
+            self._callbacks.pop(task_id, None)
+            self._restart(executor)
+            with self._lock:
+                self.failed += 1
+            raise RuntimeError("Inference worker crashed while processing the request; it has been restarted.")
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.busy -= 1
+            self._slots.release()
+
+    def _wait(self, future: Future, started: threading.Event) -> Any:
+        if self.call_timeout is None:
+            return future.result()
+        # The clock starts when a worker picks the call up, not while it queues
+        while not started.wait(0.5):
+            if future.done():
+                break
+        return future.result(timeout=self.call_timeout)
+
+    def _drain_callbacks(self, task_id: int, relayed: threading.Event) -> None:
+        # The result can overtake the worker's last relayed callbacks;
+        # deliver them all before run() returns (_listen drops the entry)
+        if not relayed.wait(_RELAY_TIMEOUT_S):
+            logger.warning("Callbacks of inference call %d were not delivered in time", task_id)
+            self._callbacks.pop(task_id, None)
+
+    def _restart(self, broken: ProcessPoolExecutor, kill: bool = False) -> None:
+        with self._lock:
+            if self._executor is not broken:
+                return  # another caller already replaced it
+            if kill:
+                logger.error("Inference call timed out; killing the workers and restarting the pool")
+                # A hung worker never returns on its own; shutdown() does not stop it
+                for process in list((broken._processes or {}).values()):
+                    process.terminate()
+            else:
+                logger.error("Inference worker died; restarting the pool")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._new_executor()
+            self.restarts += 1
+
+    def _listen(self) -> None:
+        while True:
+            task_id, name, cb_args = self._progress_queue.get()
+            if name == _DONE:
+                callback = self._callbacks.pop(task_id, {}).get(name)
+            else:
+                callback = self._callbacks.get(task_id, {}).get(name)
+            if callback is None:
+                continue
+            try:
+                callback(*cb_args)
+            except Exception:
+                logger.exception("%s callback failed", name)
+
+    def start_workers(self) -> None:
+        """Spawn the worker processes now instead of on first request."""
+        with self._lock:
+            executor = self._executor
+        for f in [executor.submit(_noop) for _ in range(self.workers)]:
+            f.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "torch_threads": self.torch_threads,
+                "busy": self.busy,
+                "completed": self.completed,
+                "failed": self.failed,
+                "timeouts": self.timeouts,
+                "restarts": self.restarts,
+            }
@@ -0,0 +1,168 @@
+"""
+Infrastructure / Model registry:
+
+Process-wide holder for heavy ML services (Whisper, BART).
+- Lazy: a model is built on first use, not at import.
+- Warm-up: optional dummy call so the first real request is not slow.
+- Idle unload: models unused for longer than a TTL are dropped.
+- Stats: load time, resident parameter size and usage per model.
+"""
+import gc
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _resident_bytes(instance: Any) -> int:
+    """
+    Bytes held by the torch parameters and buffers behind ``instance.pipe``.
+    """
+    model = getattr(getattr(instance, "pipe", None), "model", None)
+    if model is None or not hasattr(model, "parameters"):
+        return 0
+    total = sum(p.numel() * p.element_size() for p in model.parameters())
+    total += sum(b.numel() * b.element_size() for b in model.buffers())
+    return total
+
+
+class _Entry:
+    def __init__(self, factory: Callable[[], Any], warmup: Optional[Callable[[Any], None]]):
+        self.factory = factory
+        self.warmup = warmup
+        self.instance: Any = None
+        self.lock = threading.Lock()
+        self.active = 0
+        self.uses = 0
+        self.loads = 0
+        self.load_seconds = 0.0
+        self.warmup_seconds = 0.0
+        self.resident_bytes = 0
+        self.last_used = 0.0
+
+
+class ModelRegistry:
+    def __init__(self, idle_ttl_s: float = 0):
+        self.idle_ttl_s = idle_ttl_s
+        self._entries: Dict[str, _Entry] = {}
+        self._reaper: Optional[threading.Thread] = None
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        warmup: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self._entries[name] = _Entry(factory, warmup)
+
+    # ---------- loading ----------
+    def _load(self, name: str, entry: _Entry) -> Any:
+        # Caller holds entry.lock
+        if entry.instance is None:
+            started = time.perf_counter()
+            entry.instance = entry.factory()
+            entry.load_seconds = time.perf_counter() - started
+            entry.resident_bytes = _resident_bytes(entry.instance)
+            entry.loads += 1
+            logger.info(
+                "Loaded model %s in %.1fs (%.0f MB)",
+                name, entry.load_seconds, entry.resident_bytes / 1e6,
+            )
+            self._ensure_reaper()
+        return entry.instance
+
+    def get(self, name: str) -> Any:
+        entry = self._entries[name]
+        with entry.lock:
+            entry.uses += 1
+            entry.last_used = time.monotonic()
+            return self._load(name, entry)
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[Any]:
+        """
+        Borrow a model; it will not be unloaded while borrowed.
+        """
+        entry = self._entries[name]
+        with entry.lock:
+            entry.active += 1
+            entry.uses += 1
+            instance = self._load(name, entry)
+        try:
+            yield instance
+        finally:
+            with entry.lock:
+                entry.active -= 1
+                entry.last_used = time.monotonic()
+
+    def warm_up(self, names: Optional[List[str]] = None) -> None:
+        """
+        Load the given (default: all) models and run their warm-up hooks.
+        """
+        for name in names or list(self._entries):
+            entry = self._entries[name]
+            with self.use(name) as instance:
+                if entry.warmup is not None:
+                    started = time.perf_counter()
+                    entry.warmup(instance)
+                    entry.warmup_seconds = time.perf_counter() - started
+                    logger.info("Warmed up model %s in %.1fs", name, entry.warmup_seconds)
+
+    # ---------- unloading ----------
+    def unload(self, name: str) -> bool:
+        entry = self._entries[name]
+        with entry.lock:
+            if entry.instance is None or entry.active:
+                return False
+            entry.instance = None
+            entry.resident_bytes = 0
+        gc.collect()
+        logger.info("Unloaded model %s", name)
+        return True
+
+    def unload_idle(self, ttl_s: Optional[float] = None) -> List[str]:
+        ttl_s = self.idle_ttl_s if ttl_s is None else ttl_s
+        now = time.monotonic()
+        unloaded = []
+        for name, entry in self._entries.items():
+            if entry.instance is not None and not entry.active and now - entry.last_used > ttl_s:
+                if self.unload(name):
+                    unloaded.append(name)
+        return unloaded
+
+    def _ensure_reaper(self) -> None:
+        if self.idle_ttl_s <= 0 or self._reaper is not None:
+            return
+
+        interval = max(1.0, min(60.0, self.idle_ttl_s / 2.0))
+
+        def reap() -> None:
+            while True:
+                time.sleep(interval)
+                try:
+                    self.unload_idle()
+                except Exception:
+                    logger.exception("Idle model unload failed")
+
+        self._reaper = threading.Thread(target=reap, name="model-reaper", daemon=True)
+        self._reaper.start()
+
+    # ---------- reporting ----------
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        report = {}
+        for name, entry in self._entries.items():
+            report[name] = {
+                "loaded": entry.instance is not None,
+                "loads": entry.loads,
+                "uses": entry.uses,
+                "active": entry.active,
+                "load_seconds": round(entry.load_seconds, 3),
+                "warmup_seconds": round(entry.warmup_seconds, 3),
+                "resident_mb": round(entry.resident_bytes / 1e6, 1),
+                "idle_seconds": round(now - entry.last_used, 1) if entry.last_used else None,
+            }
+        return report
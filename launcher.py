@@ -1,91 +1,124 @@
 import os
 import sys
+import threading
 import traceback
 import signal
+import multiprocessing
 
 def debug(msg):
     print("[LAUNCHER]", msg, flush=True)
 
 # --- GLOBAL SHUTDOWN FLAG ---
-stop_server = False
+stop_server = threading.Event()
 
 def handle_interrupt(sig, frame):
-    global stop_server
-    debug("Ctrl+C detected. Shutting down server...")
-    stop_server = True
+    # Only flag it here: the main loop drains the server outside the handler
+    debug("Shutdown requested. Finishing in-flight requests...")
+    stop_server.set()
+
+def main():
+    # Attach Ctrl+C / SIGTERM handlers (WORKS IN .EXE)
+    signal.signal(signal.SIGINT, handle_interrupt)
+    signal.signal(signal.SIGTERM, handle_interrupt)
+    if hasattr(signal, "SIGBREAK"):  # Windows console Ctrl+Break / close
+        signal.signal(signal.SIGBREAK, handle_interrupt)
+
     try:
-        if httpd:
-            httpd.shutdown()
-    except:
-        pass
-    sys.exit(0)
-
-# Attach Ctrl+C handler (WORKS IN .EXE)
-signal.signal(signal.SIGINT, handle_interrupt)
-signal.signal(signal.SIGTERM, handle_interrupt)
-
-try:
-    debug("Starting launcher...")
-
-    base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
-    debug(f"Base dir = {base_dir}")
-
-    # -------------------------------
-    # FFMPEG PATH SETUP
-    # -------------------------------
-    ffmpeg_dir = os.path.join(base_dir, "ffmpeg", "bin")
-    debug(f"Adding ffmpeg path: {ffmpeg_dir}")
-    os.environ["PATH"] = ffmpeg_dir + os.pathsep + os.environ.get("PATH", "")
+        debug("Starting launcher...")
+
+        base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+        debug(f"Base dir = {base_dir}")
+
+        # -------------------------------
+        # FFMPEG PATH SETUP
+        # -------------------------------
+        ffmpeg_dir = os.path.join(base_dir, "ffmpeg", "bin")
+        debug(f"Adding ffmpeg path: {ffmpeg_dir}")
+        os.environ["PATH"] = ffmpeg_dir + os.pathsep + os.environ.get("PATH", "")
     
-    sys.path.insert(0, base_dir)
-    debug("Added base_dir to sys.path")
-
-    # -------------------------------
-    # DJANGO SETUP
-    # -------------------------------
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "meeting_summarizer.settings")
-    debug("Django settings set.")
-
-    import django
-    debug(f"Django imported OK — version {django.get_version()}")
-
-    from django.core.wsgi import get_wsgi_application
-    application = get_wsgi_application()
-    debug("WSGI application created successfully")
-
-    # -------------------------------
-    # START INTERNAL WSGI SERVER
-    # -------------------------------
-    from wsgiref.simple_server import make_server
-
-    debug("Starting server...")
-    global httpd
-    httpd = make_server("127.0.0.1", 8000, application)
-    debug("Server running at http://127.0.0.1:8000")
-
-    # -------------------------------
-    # OPEN BROWSER
-    # -------------------------------
-    import webbrowser
-    try:
-        webbrowser.open("http://127.0.0.1:8000")
-        debug("Browser opened.")
-    except:
-        debug("Browser failed to open.")
-
-    # -------------------------------
-    # SERVE WITH INTERRUPT SUPPORT
-    # -------------------------------
-    while not stop_server:
-        httpd.handle_request()   # allows graceful exit instead of blocking
-
-    debug("Server stopped gracefully.")
-
-except KeyboardInterrupt:
-    handle_interrupt(None, None)
-
-except Exception as e:
-    debug("FATAL ERROR:")
-    debug(str(e))
-    debug(traceback.format_exc())
-    input("\nPress Enter to exit...")
+        sys.path.insert(0, base_dir)
+        debug("Added base_dir to sys.path")
+
+        # -------------------------------
+        # DJANGO SETUP
+        # -------------------------------
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "meeting_summarizer.settings")
+        debug("Django settings set.")
+
+        import django
+        debug(f"Django imported OK — version {django.get_version()}")
+
+        from django.core.wsgi import get_wsgi_application
+        application = get_wsgi_application()
+        debug("WSGI application created successfully")
+
+        # Resume background jobs left by a previous run
+        from webapp import jobs
+        jobs.start()
+        debug("Background jobs started.")
+
+        # -------------------------------
+        # MODEL WARM-UP (background)
+        # -------------------------------
+        from django.conf import settings
+        if settings.MODEL_WARMUP_ON_START:
+            from core.application.orchestrator import warm_up_models
+            threading.Thread(target=warm_up_models, name="model-warmup", daemon=True).start()
+            debug("Model warm-up started in background.")
+
+        # -------------------------------
+        # START INTERNAL WSGI SERVER
+        # -------------------------------
+        from meeting_summarizer.server import LaneWSGIServer
+
+        debug("Starting server...")
+        httpd = LaneWSGIServer(
+            (settings.SERVER_HOST, settings.SERVER_PORT),
+            application,
+            threads=settings.SERVER_THREADS,
+            fast_threads=settings.SERVER_FAST_LANE_THREADS,
+            fast_paths=settings.SERVER_FAST_LANE_PATHS,
+            request_timeout=settings.SERVER_REQUEST_TIMEOUT_S,
+        )
+        url = f"http://{settings.SERVER_HOST}:{settings.SERVER_PORT}"
+        threading.Thread(target=httpd.serve_forever, name="http-accept", daemon=True).start()
+        debug(f"Server running at {url} "
+              f"({settings.SERVER_THREADS} threads + {settings.SERVER_FAST_LANE_THREADS} fast lane)")
+
+        # -------------------------------
+        # OPEN BROWSER
+        # -------------------------------
+        import webbrowser
+        try:
+            webbrowser.open(url)
+            debug("Browser opened.")
+        except:
+            debug("Browser failed to open.")
+
+        # -------------------------------
+        # SERVE WITH INTERRUPT SUPPORT
+        # -------------------------------
+        while not stop_server.wait(0.5):   # short waits keep Ctrl+C responsive on Windows
+            pass
+
+        if httpd.drain(settings.SERVER_DRAIN_TIMEOUT_S):
+            debug("Server stopped gracefully.")
+        else:
+            debug("Drain timeout reached; abandoning unfinished requests.")
+
+    except KeyboardInterrupt:
+        handle_interrupt(None, None)
+
+    except Exception as e:
+        debug("FATAL ERROR:")
+        debug(str(e))
+        debug(traceback.format_exc())
+        input("\nPress Enter to exit...")
+
+
+if __name__ == "__main__":
+    # Inference worker processes are spawned from this executable; in the
+    # PyInstaller bundle freeze_support() turns those children into workers
+    # instead of starting a second server.
+    multiprocessing.freeze_support()
+    main()
@@ -21,7 +21,11 @@ a = Analysis(
         'django',
         'django.contrib',
         'django.contrib.staticfiles',
-        'django.template'
+        'django.template',
+        # imported lazily by launcher.py (threaded server)
+        'meeting_summarizer.server',
+        'wsgiref.simple_server',
+        'concurrent.futures'
     ],
     hookspath=[],
     hooksconfig={},
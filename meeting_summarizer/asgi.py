@@ -3,3 +3,8 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "meeting_summarizer.settings")
 application = get_asgi_application()
+
+# Resume background jobs left by a previous server process
+from webapp import jobs  # noqa: E402
+
+jobs.start()
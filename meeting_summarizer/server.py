@@ -0,0 +1,192 @@
+"""
+Threaded WSGI server for the desktop launcher (standard library only, so
+it runs unchanged inside the PyInstaller bundle).
+
+- Requests are served by a bounded thread pool (main lane).
+- Paths matching ``fast_paths`` (PDF export, status polling) have their
+  own small pool (fast lane) and never queue behind a transcription.
+- A router thread waits for each request line and picks the lane, so
+  idle connections hold no pool thread.
+- Sockets idle for ``request_timeout`` seconds (stalled or slow clients)
+  are closed; the timeout does not limit processing time.
+- drain() stops accepting connections and lets in-flight requests finish;
+  requests still waiting for a pool thread when it gives up get a 503.
+"""
+import logging
+import queue
+import selectors
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+logger = logging.getLogger(__name__)
+
+_UNAVAILABLE = (
+    b"HTTP/1.0 503 Service Unavailable\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"Connection: close\r\n"
+    b"Retry-After: 5\r\n"
+    b"\r\n"
+    b"Server is shutting down, please retry.\n"
+)
+
+
+class LaneWSGIServer(WSGIServer):
+    request_queue_size = 64
+
+    def __init__(
+        self,
+        address,
+        app,
+        threads: int = 8,
+        fast_threads: int = 2,
+        fast_paths: Iterable[str] = (),
+        request_timeout: float = 60,
+    ):
+        super().__init__(address, WSGIRequestHandler)
+        self.set_app(app)
+        self.request_timeout = request_timeout
+        self.fast_paths = tuple(fast_paths)
+        self._main = ThreadPoolExecutor(max(1, threads), thread_name_prefix="http-main")
+        self._fast = ThreadPoolExecutor(max(1, fast_threads), thread_name_prefix="http-fast")
+
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._draining = False
+        self._closed = False
+        self._queued: Dict[Any, Future] = {}  # request socket -> pool job not yet started
+        self.served = {"main": 0, "fast": 0}
+
+        # Accepted connections wait here (not on a pool thread) until the
+        # request line has arrived, so idle keep-open sockets cost nothing
+        self._accepted: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._router = threading.Thread(target=self._route_loop, name="http-router", daemon=True)
+        self._router.start()
+
+    # ---------- dispatch ----------
+    def process_request(self, request, client_address):
+        request.settimeout(self.request_timeout)
+        with self._cond:
+            self._inflight += 1
+        self._accepted.put((request, client_address, time.monotonic()))
+
+    def _route_loop(self) -> None:
+        selector = selectors.DefaultSelector()
+        while not self._closed:
+            while True:
+                try:
+                    request, client_address, accepted = self._accepted.get_nowait()
+                except queue.Empty:
+                    break
+                selector.register(request, selectors.EVENT_READ, (client_address, accepted))
+
+            for key, _ in selector.select(0.1):
+                selector.unregister(key.fileobj)
+                self._dispatch(key.fileobj, key.data[0])
+
+            # When draining, connections that have sent nothing are dropped
+            expired = float("inf") if self._draining else time.monotonic() - self.request_timeout
+            for key in list(selector.get_map().values()):
+                if key.data[1] < expired:
+                    selector.unregister(key.fileobj)
+                    self._done(key.fileobj)
+
+        for key in list(selector.get_map().values()):
+            self._done(key.fileobj)
+        while True:
+            try:
+                self._done(self._accepted.get_nowait()[0])
+            except queue.Empty:
+                break
+        selector.close()
+
+    def _is_fast(self, request) -> bool:
+        try:
+            head = request.recv(2048, socket.MSG_PEEK)
+        except OSError:
+            return False
+        parts = head.split(b"\r\n", 1)[0].split()
+        if len(parts) < 2:
+            return False
+        path = parts[1].decode("latin-1").split("?", 1)[0]
+        return path.startswith(self.fast_paths)
+
+    def _dispatch(self, request, client_address) -> None:
+        lane = "fast" if self.fast_paths and self._is_fast(request) else "main"
+        pool = self._fast if lane == "fast" else self._main
+        with self._cond:
+            try:
+                self._queued[request] = pool.submit(self._serve, request, client_address, lane)
+            except RuntimeError:  # pools already shut down
+                self._queued.pop(request, None)
+                self._unavailable(request)
+
+    def _serve(self, request, client_address, lane: str) -> None:
+        with self._cond:
+            self._queued.pop(request, None)
+        try:
+            self.finish_request(request, client_address)
+            with self._cond:
+                self.served[lane] += 1
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self._done(request)
+
+    def _done(self, request) -> None:
+        self.shutdown_request(request)
+        with self._cond:
+            self._inflight -= 1
+            self._cond.notify_all()
+
+    def _unavailable(self, request) -> None:
+        try:
+            request.sendall(_UNAVAILABLE)
+        except OSError:
+            pass
+        self._done(request)
+
+    def handle_error(self, request, client_address):
+        error = sys.exc_info()[1]
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            logger.info("Dropped connection from %s: %s", client_address[0], error)
+            return
+        super().handle_error(request, client_address)
+
+    # ---------- lifecycle ----------
+    def drain(self, timeout: float) -> bool:
+        """
+        Stop accepting, wait up to ``timeout`` seconds for accepted requests
+        to finish and close the listening socket. Requests that never got a
+        pool thread are answered with 503 and closed. Returns False if some
+        were still running. Call from a thread other than serve_forever's.
+        """
+        self.shutdown()
+        self.server_close()
+        self._draining = True
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._inflight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            finished = not self._inflight
+        self._closed = True
+        with self._cond:
+            self._fast.shutdown(wait=False, cancel_futures=True)
+            self._main.shutdown(wait=False, cancel_futures=True)
+            cancelled = [r for r, f in self._queued.items() if f.cancelled()]
+            for request in cancelled:
+                del self._queued[request]
+        for request in cancelled:
+            self._unavailable(request)
+        return finished
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {"inflight": self._inflight, "served": dict(self.served)}
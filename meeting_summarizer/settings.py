@@ -78,19 +78,102 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 ASR_MODEL_NAME = "openai/whisper-small"           # ASR Service (Whisper)
 SUMMARIZER_MODEL_NAME = "facebook/bart-large-cnn"  # BART summarizer
 
+# Model registry: models load on first use; optionally warm up at launch
+# and unload after MODEL_IDLE_TTL_S seconds without use (0 = never unload)
+MODEL_WARMUP_ON_START = True
+MODEL_IDLE_TTL_S = 0
+
+# CPU inference mode per model: "fp32", "int8" (dynamic quantised linear
+# layers) or "bf16" (needs native CPU bf16, else falls back to fp32).
+# Compare quality/speed with `python manage.py bench_inference`.
+ASR_INFERENCE_MODE = "fp32"
+SUMMARIZER_INFERENCE_MODE = "fp32"
+# PyTorch threads in the web process (0 = torch default). Inference
+# workers use INFERENCE_TORCH_THREADS instead of TORCH_INTRA_OP_THREADS.
+TORCH_INTRA_OP_THREADS = 0
+TORCH_INTER_OP_THREADS = 0
+
+# Streaming ASR: window length and overlap between consecutive windows (seconds)
+ASR_STREAM_CHUNK_S = 30
+ASR_STREAM_STRIDE_S = 5
+# Energy VAD before Whisper: drop silences longer than MIN_SILENCE below THRESHOLD (dBFS)
+ASR_VAD_ENABLED = True
+ASR_VAD_THRESHOLD_DB = -40.0
+ASR_VAD_MIN_SILENCE_S = 0.6
+AUDIO_PIPELINED = True  # overlap streaming ASR with chunk summarisation in process_audio
+
 # Date parsing preferences
 DATE_ORDER = "MDY"  # change to "DMY" for day-first dates
 
 # Summariser / chunker constraints
 SUMMARIZER_MAX_LEN = 150
 SUMMARIZER_MIN_LEN = 1
+CHUNK_MODE = "tokens"  # "tokens" packs to the tokenizer budget, "chars" uses CHUNK_MAX_CHARS
 CHUNK_MAX_CHARS = 1200
+CHUNK_MAX_TOKENS = 1000  # per-chunk token target (below TOKENIZER_MODEL_MAX_LENGTH)
 TOKENIZER_MODEL_MAX_LENGTH = 1024
+SUMMARIZER_BATCH_SIZE = 4  # chunks per batched generate call (map stage)
+# Micro-batching: chunk jobs from concurrent requests are coalesced into one
+# generate call of up to SUMMARIZER_BATCH_SIZE, waiting at most this long.
+# Only in-process: ignored when INFERENCE_WORKERS > 0 (one call per worker).
+SUMMARIZER_MICRO_BATCHING = True
+SUMMARIZER_BATCH_WAIT_MS = 5
+# Summary backend: "bart" (abstractive) or "extractive" (model-free, instant).
+# Can be overridden per request; with "bart", background jobs show the
+# extractive summary as a draft until BART finishes.
+SUMMARIZER_BACKEND = "bart"
+# Extractive pre-filter: keep only this share of the most central sentences
+# ("tfidf" or "textrank" scoring) before BART sees the text; 1.0 = off.
+# Applies to text input and to audio when AUDIO_PIPELINED is False.
+EXTRACTIVE_KEEP_RATIO = 1.0
+EXTRACTIVE_METHOD = "textrank"
 
 # Application/business constraints
-MAX_TEXT_LENGTH = 20000  # characters
+MAX_TEXT_LENGTH = 250000  # characters (long meetings go through the reduce tree)
 MAX_AUDIO_FILE_SIZE_MB = 25
 
+# Background job queue (webapp/jobs.py)
+JOB_WORKERS = 2  # concurrent processing jobs
+JOB_MAX_PENDING = 16  # queued + running before new submissions are refused
+JOB_HEARTBEAT_S = 30  # how often a process refreshes the jobs it owns
+JOB_STALE_S = 120  # unrefreshed queued/running jobs are re-run by another process
+JOB_TTL_S = 24 * 3600  # finished jobs are deleted this long after completing
+
+# Desktop launcher HTTP server (launcher.py, threaded)
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8000
+SERVER_THREADS = 8  # concurrent requests (uploads, processing)
+SERVER_FAST_LANE_THREADS = 2  # reserved for the path prefixes below
+SERVER_FAST_LANE_PATHS = ["/export_pdf/", "/export/", "/status/", "/jobs/"]
+SERVER_REQUEST_TIMEOUT_S = 60  # idle socket time before a client is dropped (not processing time)
+SERVER_DRAIN_TIMEOUT_S = 30  # on Ctrl+C / SIGTERM, wait this long for in-flight requests
+
+# Live recording sessions (audio chunks uploaded while recording)
+LIVE_MAX_SESSIONS = 4
+LIVE_SESSION_IDLE_TIMEOUT_S = 600  # abandoned sessions are dropped after this
+LIVE_MAX_AUDIO_S = 4 * 3600  # longer recordings fail (so does a transcript over MAX_TEXT_LENGTH)
+
+# Inference worker processes (0 = run models in the web process).
+# Each worker loads its own Whisper + BART copy (~2 GB RAM per worker).
+INFERENCE_WORKERS = 0
+INFERENCE_TORCH_THREADS = 0  # torch threads per worker (0 = CPU count / workers)
+INFERENCE_MAX_QUEUED = 4  # calls allowed to wait when every worker is busy
+INFERENCE_QUEUE_TIMEOUT_S = 30  # wait for a free slot before refusing
+INFERENCE_CALL_TIMEOUT_S = 1800  # a running call is killed after this (0 = no limit)
+
+# Result cache (content-addressed: audio bytes / normalised text + model settings)
+RESULT_CACHE_SIZE = 128  # in-memory LRU entries
+RESULT_CACHE_DIR = MEDIA_ROOT / "cache" / "results"  # set to None to disable the disk tier
+RESULT_CACHE_DISK_MAX_MB = 200
+SUMMARY_CHUNK_CACHE_SIZE = 4096  # memoised chunk summaries (in-memory LRU)
+EXPORT_CACHE_DIR = MEDIA_ROOT / "cache" / "exports"  # rendered PDFs; None disables
+EXPORT_CACHE_MAX_MB = 200
+
+# Meeting result store (webapp/results.py): sessions only hold the result ID
+RESULT_STORE_TTL_S = 7 * 24 * 3600  # results are deleted this long after processing
+RESULT_STORE_COMPRESS_MIN_CHARS = 2048  # zlib-compress transcripts from this length
+RESULT_STORE_PURGE_INTERVAL_S = 3600  # how often expired results are cleaned up
+
 # HF Inference API (optional model serving)
 HF_API_KEY = os.getenv("HF_API_KEY", "")
 
@@ -3,3 +3,8 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "meeting_summarizer.settings")
 application = get_wsgi_application()
+
+# Resume background jobs left by a previous server process
+from webapp import jobs  # noqa: E402
+
+jobs.start()
@@ -1,4 +1,10 @@
 from django import forms
+from django.conf import settings
+
+BACKEND_CHOICES = [
+    ("bart", "Abstractive (BART, slower)"),
+    ("extractive", "Extractive (instant)"),
+]
 
 
 class MeetingForm(forms.Form):
@@ -12,6 +18,13 @@ class MeetingForm(forms.Form):
         required=False,
         help_text="Upload an audio file (e.g., WAV, MP3)",
     )
+    summary_backend = forms.ChoiceField(
+        label="Summary Mode",
+        required=False,
+        choices=BACKEND_CHOICES,
+        initial=settings.SUMMARIZER_BACKEND,
+        widget=forms.Select(attrs={"class": "form-select"}),
+    )
 
     def clean(self):
         cleaned = super(MeetingForm, self).clean()
@@ -0,0 +1,235 @@
+"""
+Background job runner for audio/text processing.
+
+Jobs are persisted in SQLite (ProcessingJob) and executed by a bounded
+thread pool, so views return a job ID immediately and clients poll
+for status, progress and results.
+
+Each process tags the jobs it runs with its worker ID and refreshes
+their updated_at every JOB_HEARTBEAT_S. Queued/running jobs whose owner
+has gone quiet for JOB_STALE_S (the process died) are claimed and re-run
+by a live process; call start() when a server process comes up.
+Finished jobs are deleted JOB_TTL_S after they last changed (the results
+themselves live in MeetingResult).
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from core.application.orchestrator import (
+    process_audio_with_stats,
+    summarize_from_text_with_stats,
+)
+from .models import ProcessingJob
+from .results import save_result
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_started = False
+
+_ACTIVE = [ProcessingJob.STATUS_QUEUED, ProcessingJob.STATUS_RUNNING]
+_FINISHED = [ProcessingJob.STATUS_DONE, ProcessingJob.STATUS_FAILED]
+
+# Identifies this process's jobs (a restarted process gets a new ID)
+WORKER_ID = uuid.uuid4().hex
+
+
+class QueueFullError(Exception):
+    """Raised when JOB_MAX_PENDING jobs are already queued or running."""
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.JOB_WORKERS,
+                thread_name_prefix="job-worker",
+            )
+            threading.Thread(target=_maintenance_loop, name="job-maintenance", daemon=True).start()
+        return _executor
+
+
+def start() -> None:
+    """
+    Start the worker pool and re-run jobs orphaned by a stopped process.
+    Called once by each server entry point (wsgi/asgi, launcher); safe
+    to call again.
+    """
+    global _started
+    with _executor_lock:
+        if _started:
+            return
+        _started = True
+    try:
+        _recover(_get_executor())
+        purge_finished()
+    except DatabaseError as e:
+        # e.g. migrations not applied yet; the maintenance loop retries
+        logger.warning("Job recovery skipped: %s", e)
+    finally:
+        close_old_connections()
+
+
+def _update(job_id: str, **fields) -> None:
+    # QuerySet.update() skips auto_now, so stamp updated_at here
+    ProcessingJob.objects.filter(pk=job_id).update(updated_at=timezone.now(), **fields)
+
+
+def _recover(executor: ThreadPoolExecutor) -> int:
+    """
+    Claim queued/running jobs whose owner stopped refreshing them and
+    re-queue them here. Audio jobs whose temp file is gone fail. Each
+    claim is a conditional update, so concurrent processes never run
+    the same job twice. Returns how many jobs were re-queued.
+    """
+    stale = timezone.now() - timedelta(seconds=settings.JOB_STALE_S)
+    recovered = 0
+    for job in ProcessingJob.objects.filter(status__in=_ACTIVE, updated_at__lt=stale).exclude(worker=WORKER_ID):
+        claim = ProcessingJob.objects.filter(pk=job.pk, worker=job.worker, updated_at=job.updated_at)
+        if job.kind == ProcessingJob.KIND_AUDIO and not os.path.exists(job.input_path):
+            claim.update(
+                status=ProcessingJob.STATUS_FAILED,
+                error="Input audio no longer available after restart.",
+                worker=WORKER_ID,
+                updated_at=timezone.now(),
+            )
+            continue
+        if claim.update(status=ProcessingJob.STATUS_QUEUED, worker=WORKER_ID, updated_at=timezone.now()):
+            logger.info("Recovered job %s from worker %s", job.pk, job.worker or "?")
+            executor.submit(_run, job.pk)
+            recovered += 1
+    return recovered
+
+
+def purge_finished() -> int:
+    """Delete done/failed jobs older than JOB_TTL_S; returns how many."""
+    cutoff = timezone.now() - timedelta(seconds=settings.JOB_TTL_S)
+    deleted, _ = ProcessingJob.objects.filter(status__in=_FINISHED, updated_at__lt=cutoff).delete()
+    if deleted:
+        logger.info("Purged %d finished jobs", deleted)
+    return deleted
+
+
+def _maintenance_loop() -> None:
+    """Heartbeat for this process's jobs; recovery and cleanup when started."""
+    ticks_per_purge = max(1, int(settings.RESULT_STORE_PURGE_INTERVAL_S // settings.JOB_HEARTBEAT_S))
+    tick = 0
+    while True:
+        time.sleep(settings.JOB_HEARTBEAT_S)
+        tick += 1
+        try:
+            ProcessingJob.objects.filter(worker=WORKER_ID, status__in=_ACTIVE).update(updated_at=timezone.now())
+            if _started:
+                _recover(_get_executor())
+                if tick % ticks_per_purge == 0:
+                    purge_finished()
+        except Exception as e:
+            logger.warning("Job maintenance failed: %s", e)
+        finally:
+            close_old_connections()
+
+
+def _admit(job: ProcessingJob) -> None:
+    """
+    Enforce JOB_MAX_PENDING after the insert: the job is refused (and
+    removed) if more than the limit of active jobs were created before
+    or with it. Concurrent submitters therefore cannot both squeeze in
+    past the limit, whichever process they run in.
+    """
+    ahead = ProcessingJob.objects.filter(status__in=_ACTIVE).filter(
+        Q(created_at__lt=job.created_at) | Q(created_at=job.created_at, pk__lte=job.pk)
+    ).count()
+    if ahead > settings.JOB_MAX_PENDING:
+        ProcessingJob.objects.filter(pk=job.pk).delete()
+        raise QueueFullError("Too many jobs in progress, please retry shortly.")
+
+
+def _submit(**fields) -> ProcessingJob:
+    executor = _get_executor()
+    job = ProcessingJob.objects.create(worker=WORKER_ID, **fields)
+    _admit(job)
+    executor.submit(_run, job.pk)
+    return job
+
+
+def submit_audio(audio_path: str, backend: str = "") -> ProcessingJob:
+    return _submit(kind=ProcessingJob.KIND_AUDIO, input_path=audio_path, backend=backend)
+
+
+def submit_text(text: str, backend: str = "") -> ProcessingJob:
+    return _submit(kind=ProcessingJob.KIND_TEXT, input_text=text, backend=backend)
+
+
+def _run(job_id: str) -> None:
+    try:
+        job = ProcessingJob.objects.get(pk=job_id)
+        _update(job_id, status=ProcessingJob.STATUS_RUNNING)
+
+        def progress(stage: str, done: int, total: int) -> None:
+            _update(job_id, stage=stage, progress_done=done, progress_total=total)
+
+        def draft(transcript, summary, actions, dates, stats) -> None:
+            # Instant extractive summary, replaced when BART finishes; only
+            # while running, so it can never overwrite the final result
+            ProcessingJob.objects.filter(
+                pk=job_id, status=ProcessingJob.STATUS_RUNNING
+            ).update(updated_at=timezone.now(), result={
+                "draft": True,
+                "transcript": transcript,
+                "summary": summary,
+                "actions": actions,
+                "dates": dates,
+                "summary_stats": stats,
+            })
+
+        try:
+            if job.kind == ProcessingJob.KIND_AUDIO:
+                transcript, summary, actions, dates, stats, segments = process_audio_with_stats(
+                    job.input_path, progress, backend=job.backend or None, on_draft=draft
+                )
+            else:
+                transcript = job.input_text
+                summary, actions, dates, stats = summarize_from_text_with_stats(
+                    transcript, progress, backend=job.backend or None, on_draft=draft
+                )
+                segments = []
+
+            stored = save_result(transcript, summary, actions, dates, segments, source=job.kind)
+            _update(
+                job_id,
+                status=ProcessingJob.STATUS_DONE,
+                stage="done",
+                input_text="",  # the transcript is kept in the result
+                result={
+                    "result_id": stored.pk,
+                    "transcript": transcript,
+                    "summary": summary,
+                    "actions": actions,
+                    "dates": dates,
+                    "summary_stats": stats,
+                },
+            )
+        except Exception as e:
+            logger.exception("Job %s failed: %s", job_id, e)
+            _update(job_id, status=ProcessingJob.STATUS_FAILED, error=str(e))
+        finally:
+            if job.kind == ProcessingJob.KIND_AUDIO:
+                try:
+                    os.remove(job.input_path)
+                except Exception:
+                    logger.warning("Could not delete temp file: %s", job.input_path)
+    finally:
+        close_old_connections()
@@ -0,0 +1,140 @@
+"""
+Tiny randomly initialised BART and Whisper checkpoints, built locally so
+bench_suite can run the real pipelines offline. Their output is noise;
+only latency, throughput and memory are meaningful.
+"""
+import json
+import os
+from typing import Dict, List, Tuple
+
+_BART_SPECIALS = ["<s>", "<pad>", "</s>", "<unk>"]
+_WHISPER_SPECIALS = [
+    "<|endoftext|>",
+    "<|startoftranscript|>",
+    "<|en|>",
+    "<|translate|>",
+    "<|transcribe|>",
+    "<|startoflm|>",
+    "<|startofprev|>",
+    "<|nocaptions|>",
+    "<|notimestamps|>",
+]
+
+
+def _byte_alphabet() -> List[str]:
+    """Base vocabulary of byte-level BPE (GPT-2 byte → unicode table)."""
+    bs = list(range(ord("!"), ord("~") + 1)) + list(range(ord("¡"), ord("¬") + 1)) + list(range(ord("®"), ord("ÿ") + 1))
+    cs = bs[:]
+    n = 0
+    for b in range(256):
+        if b not in bs:
+            bs.append(b)
+            cs.append(256 + n)
+            n += 1
+    return [chr(c) for c in cs]
+
+
+def _write_bpe(path: str, tokens: List[str]) -> Tuple[str, str, Dict[str, int]]:
+    """vocab.json / merges.txt without merges: every byte is one token."""
+    os.makedirs(path, exist_ok=True)
+    ids = {tok: i for i, tok in enumerate(tokens)}
+    vocab_file = os.path.join(path, "vocab.json")
+    merges_file = os.path.join(path, "merges.txt")
+    with open(vocab_file, "w", encoding="utf-8") as f:
+        json.dump(ids, f, ensure_ascii=False)
+    with open(merges_file, "w", encoding="utf-8") as f:
+        f.write("#version: 0.2\n")
+    return vocab_file, merges_file, ids
+
+
+def _built(path: str) -> bool:
+    return os.path.exists(os.path.join(path, "config.json"))
+
+
+def build_tiny_bart(path: str) -> str:
+    """One-layer encoder/decoder, 32-dim BART summariser at ``path`` (reused if present)."""
+    if _built(path):
+        return path
+    from transformers import BartConfig, BartForConditionalGeneration, BartTokenizer
+
+    tokens = _BART_SPECIALS + _byte_alphabet() + ["<mask>"]
+    vocab_file, merges_file, ids = _write_bpe(path, tokens)
+    tokenizer = BartTokenizer(vocab_file, merges_file)
+
+    config = BartConfig(
+        vocab_size=len(tokens),
+        d_model=32,
+        encoder_layers=1,
+        decoder_layers=1,
+        encoder_attention_heads=2,
+        decoder_attention_heads=2,
+        encoder_ffn_dim=64,
+        decoder_ffn_dim=64,
+        max_position_embeddings=1024,
+        bos_token_id=ids["<s>"],
+        pad_token_id=ids["<pad>"],
+        eos_token_id=ids["</s>"],
+        decoder_start_token_id=ids["</s>"],
+        forced_bos_token_id=ids["<s>"],
+        forced_eos_token_id=ids["</s>"],
+    )
+    BartForConditionalGeneration(config).save_pretrained(path)
+    tokenizer.save_pretrained(path)
+    return path
+
+
+def build_tiny_whisper(path: str) -> str:
+    """One-layer encoder/decoder, 32-dim Whisper (80 mel bins, timestamp tokens) at ``path``."""
+    if _built(path):
+        return path
+    from transformers import (
+        GenerationConfig,
+        WhisperConfig,
+        WhisperFeatureExtractor,
+        WhisperForConditionalGeneration,
+        WhisperTokenizer,
+    )
+
+    # Timestamp tokens must directly follow <|notimestamps|>
+    timestamps = ["<|%.2f|>" % (i * 0.02) for i in range(1501)]
+    tokens = _byte_alphabet() + _WHISPER_SPECIALS + timestamps
+    vocab_file, merges_file, ids = _write_bpe(path, tokens)
+    eot = ids["<|endoftext|>"]
+    tokenizer = WhisperTokenizer(vocab_file, merges_file, pad_token="<|endoftext|>")
+    tokenizer.add_special_tokens({"additional_special_tokens": _WHISPER_SPECIALS[1:]})
+
+    config = WhisperConfig(
+        vocab_size=len(tokens),
+        num_mel_bins=80,
+        d_model=32,
+        encoder_layers=1,
+        decoder_layers=1,
+        encoder_attention_heads=2,
+        decoder_attention_heads=2,
+        encoder_ffn_dim=64,
+        decoder_ffn_dim=64,
+        max_source_positions=1500,  # 30 s windows of 10 ms frames, downsampled x2
+        max_target_positions=64,
+        bos_token_id=eot,
+        eos_token_id=eot,
+        pad_token_id=eot,
+        decoder_start_token_id=ids["<|startoftranscript|>"],
+        suppress_tokens=[],
+        begin_suppress_tokens=[eot],
+    )
+    model = WhisperForConditionalGeneration(config)
+
+    generation = GenerationConfig.from_model_config(config)
+    generation.max_length = config.max_target_positions
+    generation.is_multilingual = True
+    generation.lang_to_id = {"<|en|>": ids["<|en|>"]}
+    generation.task_to_id = {"transcribe": ids["<|transcribe|>"], "translate": ids["<|translate|>"]}
+    generation.no_timestamps_token_id = ids["<|notimestamps|>"]
+    generation.prev_sot_token_id = ids["<|startofprev|>"]
+    generation.max_initial_timestamp_index = 50
+    model.generation_config = generation
+
+    model.save_pretrained(path)
+    tokenizer.save_pretrained(path)
+    WhisperFeatureExtractor(feature_size=80).save_pretrained(path)
+    return path
@@ -0,0 +1,65 @@
+import random
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from core.domain.extraction_service import RuleDateExtractor, extract_per_sentence
+
+_SENTENCES = [
+    "We should send the revised budget to finance by next Friday.",
+    "Alice will review the onboarding document before 12th March.",
+    "The demo went well and the client liked the new dashboard.",
+    "Let's schedule a follow up call this Tuesday.",
+    "Um, I think we covered most of it, right?",
+    "Submit the final report on June 30 2026!",
+    "Bob mentioned the vendor contract expires on 5 May.",
+    "Thanks everyone for joining today.",
+    "Please email the slides to the whole team.",
+    "Nothing else to add from my side.",
+]
+
+
+def synthetic_transcript(size_chars: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = []
+    total = 0
+    while total < size_chars:
+        s = rng.choice(_SENTENCES)
+        parts.append(s)
+        total += len(s) + 1
+    return " ".join(parts)
+
+
+class Command(BaseCommand):
+    help = "Micro-benchmark: single-pass RuleDateExtractor vs the per-sentence reference."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size-kb", type=int, default=1024, help="Transcript size (KB).")
+        parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best is reported).")
+
+    def handle(self, *args, **opts):
+        text = synthetic_transcript(opts["size_kb"] * 1024)
+        today = date(2026, 1, 15)
+        extractor = RuleDateExtractor()
+
+        def best_of(fn):
+            best = float("inf")
+            result = None
+            for _ in range(opts["repeat"]):
+                started = time.perf_counter()
+                result = fn()
+                best = min(best, time.perf_counter() - started)
+            return best, result
+
+        ref_s, ref = best_of(lambda: extract_per_sentence(text, today))
+        new_s, new = best_of(lambda: extractor.extract(text, today))
+
+        self.stdout.write("Transcript: %d chars" % len(text))
+        self.stdout.write("per-sentence : %.3fs (%.1f MB/s)" % (ref_s, len(text) / ref_s / 1e6))
+        self.stdout.write("single-pass  : %.3fs (%.1f MB/s)" % (new_s, len(text) / new_s / 1e6))
+        self.stdout.write("speed-up     : %.1fx" % (ref_s / new_s))
+        if new == ref:
+            self.stdout.write(self.style.SUCCESS("Outputs identical (%d actions, %d dated sentences)" % (len(new[0]), len(new[1]))))
+        else:
+            self.stdout.write(self.style.ERROR("Outputs differ!"))
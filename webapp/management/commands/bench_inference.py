@@ -0,0 +1,163 @@
+import gc
+import json
+import os
+import re
+import time
+from collections import Counter
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.config import ASR_MODEL_NAME, SUMMARIZER_MODEL_NAME, SUMMARIZER_MIN_LEN, SUMMARIZER_MAX_LEN
+from core.infrastructure.inference_modes import INFERENCE_MODES, apply_inference_mode, configure_torch_threads
+
+from .bench_extraction import synthetic_transcript
+
+_WORD = re.compile(r"\w+")
+_AUDIO_EXT = (".wav", ".mp3", ".m4a", ".flac", ".ogg", ".webm")
+
+
+def _tokens(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _f1(overlap: int, n_ref: int, n_hyp: int) -> float:
+    if not overlap:
+        return 0.0
+    p, r = overlap / n_hyp, overlap / n_ref
+    return 2 * p * r / (p + r)
+
+
+def rouge_n(reference: str, hypothesis: str, n: int = 1) -> float:
+    """ROUGE-N F1 over lower-cased word n-grams."""
+    ref, hyp = _tokens(reference), _tokens(hypothesis)
+    ref_grams = Counter(tuple(ref[i:i + n]) for i in range(len(ref) - n + 1))
+    hyp_grams = Counter(tuple(hyp[i:i + n]) for i in range(len(hyp) - n + 1))
+    overlap = sum((ref_grams & hyp_grams).values())
+    return _f1(overlap, sum(ref_grams.values()), sum(hyp_grams.values()))
+
+
+def rouge_l(reference: str, hypothesis: str) -> float:
+    """ROUGE-L F1 (longest common subsequence of words)."""
+    ref, hyp = _tokens(reference), _tokens(hypothesis)
+    if not ref or not hyp:
+        return 0.0
+    prev = [0] * (len(hyp) + 1)
+    for r in ref:
+        cur = [0]
+        for j, h in enumerate(hyp):
+            cur.append(prev[j] + 1 if r == h else max(prev[j + 1], cur[j]))
+        prev = cur
+    return _f1(prev[-1], len(ref), len(hyp))
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare CPU inference modes (fp32 / int8 / bf16) of the summariser "
+        "or Whisper: wall time, speed-up and ROUGE overlap against fp32."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", choices=["summarizer", "asr"], default="summarizer")
+        parser.add_argument("--model-name", help="Override the model from settings (e.g. a tiny local checkpoint).")
+        parser.add_argument("--modes", default=",".join(INFERENCE_MODES), help="Comma-separated modes to compare.")
+        parser.add_argument(
+            "--corpus",
+            help="Directory of .txt transcripts (summarizer) or audio files (asr). "
+                 "Summarizer default: fixed synthetic transcripts.",
+        )
+        parser.add_argument("--docs", type=int, default=4, help="Synthetic transcripts to generate.")
+        parser.add_argument("--size-kb", type=int, default=6, help="Size of each synthetic transcript (KB).")
+        parser.add_argument("--intra-op-threads", type=int, default=0, help="torch intra-op threads (0 = default).")
+        parser.add_argument("--inter-op-threads", type=int, default=0, help="torch inter-op threads (0 = default).")
+        parser.add_argument("--json", dest="json_path", help="Also write the report to this JSON file.")
+
+    def _corpus(self, opts):
+        path = opts["corpus"]
+        if path:
+            if not os.path.isdir(path):
+                raise CommandError("Corpus directory not found: %s" % path)
+            ext = (".txt",) if opts["model"] == "summarizer" else _AUDIO_EXT
+            files = sorted(os.path.join(path, n) for n in os.listdir(path) if n.lower().endswith(ext))
+            if not files:
+                raise CommandError("No %s files in %s" % ("/".join(ext), path))
+            if opts["model"] == "asr":
+                return files
+            docs = []
+            for name in files:
+                with open(name, encoding="utf-8") as f:
+                    docs.append(f.read())
+            return docs
+
+        if opts["model"] == "asr":
+            raise CommandError("--corpus with audio files is required for --model asr")
+        return [synthetic_transcript(opts["size_kb"] * 1024, seed=i) for i in range(opts["docs"])]
+
+    def _build(self, opts, mode):
+        if opts["model"] == "summarizer":
+            from core.domain.summarisation_service import BartSummarizer
+
+            instance = BartSummarizer(model=opts["model_name"] or SUMMARIZER_MODEL_NAME)
+            run = lambda doc: instance.summarize_tree(doc, SUMMARIZER_MIN_LEN, SUMMARIZER_MAX_LEN)[0]
+        else:
+            from core.infrastructure.asr_service import WhisperLocalTranscriber
+
+            instance = WhisperLocalTranscriber(model_name=opts["model_name"] or ASR_MODEL_NAME, vad=False)
+            run = instance.transcribe
+        applied = apply_inference_mode(instance.pipe, mode)
+        return instance, run, applied
+
+    def handle(self, *args, **opts):
+        modes = [m.strip().lower() for m in opts["modes"].split(",") if m.strip()]
+        unknown = [m for m in modes if m not in INFERENCE_MODES]
+        if unknown:
+            raise CommandError("Unknown mode(s): %s" % ", ".join(unknown))
+        if "fp32" in modes:
+            modes.remove("fp32")
+        modes.insert(0, "fp32")  # reference for quality and speed-up
+
+        configure_torch_threads(opts["intra_op_threads"], opts["inter_op_threads"])
+        corpus = self._corpus(opts)
+        self.stdout.write("Corpus: %d %s, model: %s" % (
+            len(corpus),
+            "documents" if opts["model"] == "summarizer" else "audio files",
+            opts["model_name"] or (SUMMARIZER_MODEL_NAME if opts["model"] == "summarizer" else ASR_MODEL_NAME),
+        ))
+
+        reference = None
+        base_seconds = None
+        report = []
+        for mode in modes:
+            instance, run, applied = self._build(opts, mode)
+            instance.warm_up()
+
+            started = time.perf_counter()
+            outputs = [run(doc) for doc in corpus]
+            seconds = time.perf_counter() - started
+
+            if reference is None:
+                reference, base_seconds = outputs, seconds
+            row = {
+                "mode": mode,
+                "applied": applied,
+                "seconds": round(seconds, 3),
+                "speedup": round(base_seconds / seconds, 2) if seconds else 0.0,
+                "rouge1": round(sum(rouge_n(r, o, 1) for r, o in zip(reference, outputs)) / len(corpus), 4),
+                "rouge2": round(sum(rouge_n(r, o, 2) for r, o in zip(reference, outputs)) / len(corpus), 4),
+                "rougeL": round(sum(rouge_l(r, o) for r, o in zip(reference, outputs)) / len(corpus), 4),
+            }
+            report.append(row)
+            self.stdout.write(
+                "%-5s (applied %-4s) %8.2fs  x%-5.2f  R1 %.3f  R2 %.3f  RL %.3f" % (
+                    row["mode"], row["applied"], row["seconds"], row["speedup"],
+                    row["rouge1"], row["rouge2"], row["rougeL"],
+                )
+            )
+
+            del instance, run
+            gc.collect()
+
+        if opts["json_path"]:
+            with open(opts["json_path"], "w", encoding="utf-8") as f:
+                json.dump({"model": opts["model"], "results": report}, f, indent=2)
+            self.stdout.write(self.style.SUCCESS("Report written to %s" % opts["json_path"]))
@@ -0,0 +1,108 @@
+import time
+import tracemalloc
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandError
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from core.infrastructure.export_service import (
+    WordWidths,
+    export_meeting_to_pdf,
+    export_meeting_to_pdf_file,
+    wrap_words,
+)
+
+from .bench_extraction import synthetic_transcript
+
+# Layout constants of export_service (A4, 20 mm margins, 14 pt lines, 10 pt Helvetica)
+_WRAP_WIDTH = A4[0] - 40 * mm
+_LINES_PER_PAGE = int((A4[1] - 40 * mm) // 14) + 1
+_CHARS_PER_LINE = 105
+
+
+def legacy_wrap(text: str, max_width: float, font: str = "Helvetica", size: float = 10) -> List[str]:
+    """Previous wrap_text: re-measures the whole candidate line for every word."""
+    lines = []
+    current_line = ""
+    for word in text.split():
+        test_line = current_line + " " + word if current_line else word
+        if stringWidth(test_line, font, size) < max_width:
+            current_line = test_line
+        else:
+            lines.append(current_line)
+            current_line = word
+    if current_line:
+        lines.append(current_line)
+    return lines
+
+
+def _best(fn, repeat: int):
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark PDF export on a long transcript (default ~200 pages): "
+        "cached word-width wrapping vs the previous per-word stringWidth, "
+        "and in-memory vs temp-file (streaming) export."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", type=int, default=200, help="Approximate transcript length in PDF pages.")
+        parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported).")
+
+    def handle(self, *args, **opts):
+        if opts["pages"] < 1:
+            raise CommandError("--pages must be positive")
+        transcript = synthetic_transcript(opts["pages"] * _LINES_PER_PAGE * _CHARS_PER_LINE)
+        repeat = max(1, opts["repeat"])
+        self.stdout.write("Transcript: %d chars, %d words" % (len(transcript), len(transcript.split())))
+
+        # ---------- wrapping ----------
+        legacy_s, legacy_lines = _best(lambda: legacy_wrap(transcript, _WRAP_WIDTH), repeat)
+        cached_s, cached_lines = _best(
+            lambda: wrap_words(transcript, WordWidths("Helvetica", 10), _WRAP_WIDTH), repeat
+        )
+        if cached_lines != legacy_lines:
+            raise CommandError("Wrapped lines differ from the previous implementation")
+        self.stdout.write(
+            "Wrap:   legacy %.3fs  cached %.3fs  x%.1f  (%d lines, ~%d pages)" % (
+                legacy_s, cached_s, legacy_s / cached_s if cached_s else 0.0,
+                len(cached_lines), len(cached_lines) // _LINES_PER_PAGE + 1,
+            )
+        )
+
+        # ---------- export ----------
+        args = (transcript, "Summary of the meeting.", ["Send the slides"], [])
+        for name, export in (("bytes", self._export_bytes), ("stream", self._export_file)):
+            seconds, size = _best(lambda: export(*args), repeat)
+            # Separate run: tracing slows the export down several times
+            tracemalloc.start()
+            export(*args)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.stdout.write(
+                "Export %-6s %.3fs  %.1f KB PDF  peak Python memory %.1f MB" % (
+                    name, seconds, size / 1e3, peak / 1e6,
+                )
+            )
+
+    @staticmethod
+    def _export_bytes(*args) -> int:
+        return len(export_meeting_to_pdf(*args))
+
+    @staticmethod
+    def _export_file(*args) -> int:
+        size = 0
+        with export_meeting_to_pdf_file(*args) as f:
+            for block in iter(lambda: f.read(64 * 1024), b""):
+                size += len(block)
+        return size
@@ -0,0 +1,320 @@
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import wave
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.config import (
+    ASR_MODEL_NAME,
+    AUDIO_PIPELINED,
+    SUMMARIZER_MAX_LEN,
+    SUMMARIZER_MIN_LEN,
+    SUMMARIZER_MODEL_NAME,
+)
+
+from ._tiny_models import build_tiny_bart, build_tiny_whisper
+from .bench_extraction import synthetic_transcript
+
+COMPONENTS = ("chunker", "dates", "summarizer", "asr", "pdf")
+_MODEL_COMPONENTS = ("summarizer", "asr")
+
+
+# ---------- measurement ----------
+def _current_rss() -> int:
+    """Resident set size in bytes (Linux /proc; 0 where unavailable)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError, IndexError):
+        return 0
+
+
+def _max_rss() -> int:
+    """Process-lifetime peak RSS in bytes, where the OS reports it."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RssSampler:
+    """Peak RSS while the block runs, sampled every ``interval`` seconds."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+
+    def _sample(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _current_rss())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "RssSampler":
+        self.peak = _current_rss()
+        self._thread = threading.Thread(target=self._sample, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss()) or _max_rss()
+
+
+def _percentile(values: List[float], p: float) -> float:
+    # Nearest rank: p50 of two runs is the faster one, p95 the slower
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered), math.ceil(p * len(ordered))) - 1)]
+
+
+def measure(fn: Callable[[], Any], work: float, repeat: int) -> Dict[str, Any]:
+    """
+    Run ``fn`` ``repeat`` times; ``work`` is the input size per run (chars
+    or audio seconds) used for throughput.
+    """
+    latencies = []
+    with RssSampler() as rss:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            latencies.append(time.perf_counter() - started)
+    p50 = _percentile(latencies, 0.5)
+    return {
+        "runs": repeat,
+        "p50_ms": round(p50 * 1000.0, 3),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000.0, 3),
+        "throughput": round(work / p50, 2) if p50 else 0.0,
+        "peak_rss_mb": round(rss.peak / 1e6, 1),
+    }
+
+
+# ---------- inputs ----------
+def make_audio(path: str, seconds: float, source: Optional[str] = None) -> str:
+    """
+    WAV of ``seconds`` made by looping ``source`` (16-bit PCM WAV), or a
+    synthetic speech-like signal when there is no source file.
+    """
+    if source and os.path.exists(source):
+        with wave.open(source, "rb") as src:
+            params = src.getparams()
+            frames = src.readframes(src.getnframes())
+        if params.sampwidth == 2:
+            pcm = np.frombuffer(frames, dtype=np.int16)
+            rate, channels = params.framerate, params.nchannels
+            n = int(seconds * rate) * channels
+            data = np.resize(pcm, n)
+            _write_wav(path, data, rate, channels)
+            return path
+
+    rate = 16000
+    t = np.arange(int(seconds * rate)) / rate
+    # Syllable-rate amplitude modulation over a few formant-like tones
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4 * t))
+    signal = sum(np.sin(2 * np.pi * f * t) for f in (220, 710, 1220)) / 3
+    data = (envelope * signal * 0.3 * 32767).astype(np.int16)
+    _write_wav(path, data, rate, 1)
+    return path
+
+
+def _write_wav(path: str, data: np.ndarray, rate: int, channels: int) -> None:
+    with wave.open(path, "wb") as out:
+        out.setnchannels(channels)
+        out.setsampwidth(2)
+        out.setframerate(rate)
+        out.writeframes(data.astype(np.int16).tobytes())
+
+
+# ---------- baseline comparison ----------
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_latency: float, max_rss: float) -> List[str]:
+    """
+    Regressions of ``current`` against ``baseline`` results: p50/p95
+    slower or throughput lower by more than ``max_latency`` (fraction),
+    or peak RSS higher by more than ``max_rss``.
+    """
+    problems = []
+    for case, new in current["results"].items():
+        old = baseline.get("results", {}).get(case)
+        if old is None:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            if old[metric] and new[metric] > old[metric] * (1 + max_latency):
+                problems.append("%s %s %.2f -> %.2f (+%.0f%%)" % (
+                    case, metric, old[metric], new[metric], (new[metric] / old[metric] - 1) * 100))
+        if old["throughput"] and new["throughput"] < old["throughput"] * (1 - max_latency):
+            problems.append("%s throughput %.1f -> %.1f (-%.0f%%)" % (
+                case, old["throughput"], new["throughput"], (1 - new["throughput"] / old["throughput"]) * 100))
+        if old["peak_rss_mb"] and new["peak_rss_mb"] > old["peak_rss_mb"] * (1 + max_rss):
+            problems.append("%s peak_rss_mb %.1f -> %.1f (+%.0f%%)" % (
+                case, old["peak_rss_mb"], new["peak_rss_mb"], (new["peak_rss_mb"] / old["peak_rss_mb"] - 1) * 100))
+    return problems
+
+
+def _int_list(value: str) -> List[int]:
+    try:
+        items = [int(v) for v in value.split(",") if v.strip()]
+    except ValueError:
+        raise CommandError("Expected a comma-separated list of integers: %r" % value)
+    if not items or min(items) <= 0:
+        raise CommandError("Sizes must be positive: %r" % value)
+    return items
+
+
+class Command(BaseCommand):
+    help = (
+        "End-to-end benchmark of Chunker, RuleDateExtractor, BartSummarizer, "
+        "WhisperLocalTranscriber and PDF export over growing inputs. Records "
+        "p50/p95 latency, throughput and peak RSS to JSON and can fail on "
+        "regressions against a previous run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--components", default=",".join(COMPONENTS), help="Comma-separated subset of: %s." % ", ".join(COMPONENTS))
+        parser.add_argument("--sizes-kb", default="4,16,64", help="Synthetic transcript sizes (KB).")
+        parser.add_argument("--audio-seconds", default="10,30,60", help="Synthetic audio lengths (seconds).")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per case for chunker, dates and pdf.")
+        parser.add_argument("--model-repeat", type=int, default=2, help="Runs per case for summarizer and asr.")
+        parser.add_argument("--summarizer-model", help="Summariser checkpoint (default: SUMMARIZER_MODEL_NAME).")
+        parser.add_argument("--asr-model", help="Whisper checkpoint (default: ASR_MODEL_NAME).")
+        parser.add_argument(
+            "--tiny-models",
+            nargs="?",
+            const=os.path.join(tempfile.gettempdir(), "meeting-summarizer-tiny-models"),
+            help="Build (once) and use tiny random BART/Whisper models in this directory; no downloads.",
+        )
+        parser.add_argument("--output", default="bench_results.json", help="Where to write this run's results.")
+        parser.add_argument("--baseline", help="Previous results file to compare against.")
+        parser.add_argument("--max-regression", type=float, default=0.20, help="Allowed latency/throughput regression (fraction).")
+        parser.add_argument("--max-rss-regression", type=float, default=0.20, help="Allowed peak RSS growth (fraction).")
+
+    def _models(self, opts) -> Dict[str, str]:
+        summarizer = opts["summarizer_model"] or SUMMARIZER_MODEL_NAME
+        asr = opts["asr_model"] or ASR_MODEL_NAME
+        if opts["tiny_models"]:
+            summarizer = opts["summarizer_model"] or build_tiny_bart(os.path.join(opts["tiny_models"], "bart"))
+            asr = opts["asr_model"] or build_tiny_whisper(os.path.join(opts["tiny_models"], "whisper"))
+        return {"summarizer": summarizer, "asr": asr}
+
+    def handle(self, *args, **opts):
+        components = [c.strip() for c in opts["components"].split(",") if c.strip()]
+        unknown = [c for c in components if c not in COMPONENTS]
+        if unknown:
+            raise CommandError("Unknown component(s): %s" % ", ".join(unknown))
+        sizes = _int_list(opts["sizes_kb"])
+        durations = _int_list(opts["audio_seconds"])
+        repeat = max(1, opts["repeat"])
+        model_repeat = max(1, opts["model_repeat"])
+
+        baseline = None
+        if opts["baseline"]:
+            try:
+                with open(opts["baseline"], encoding="utf-8") as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError("Cannot read baseline %s: %s" % (opts["baseline"], e))
+
+        models = self._models(opts) if any(c in _MODEL_COMPONENTS for c in components) else {}
+        texts = {kb: synthetic_transcript(kb * 1024, seed=kb) for kb in sizes}
+        results: Dict[str, Dict[str, Any]] = {}
+
+        def record(case: str, fn: Callable[[], Any], work: float, unit: str, runs: int) -> None:
+            fn()  # warm-up (lazy imports, caches, first-call allocations)
+            row = measure(fn, work, runs)
+            row["unit"] = unit
+            results[case] = row
+            self.stdout.write("%-22s p50 %10.2f ms  p95 %10.2f ms  %12.1f %-9s  RSS %7.1f MB" % (
+                case, row["p50_ms"], row["p95_ms"], row["throughput"], unit, row["peak_rss_mb"]))
+
+        if "chunker" in components:
+            from core.domain.summarisation_service import Chunker
+
+            for kb, text in texts.items():
+                record("chunker/%dkb" % kb, lambda: Chunker.chunk(text), len(text), "chars/s", repeat)
+
+        if "dates" in components:
+            from core.domain.extraction_service import RuleDateExtractor
+
+            extractor = RuleDateExtractor()
+            today = date(2026, 1, 15)  # fixed, so relative dates resolve the same way every run
+            for kb, text in texts.items():
+                record("dates/%dkb" % kb, lambda: extractor.extract(text, today), len(text), "chars/s", repeat)
+
+        if "summarizer" in components:
+            from core.domain.summarisation_service import BartSummarizer
+
+            # No chunk memo or micro-batcher: every run does the full work
+            summarizer = BartSummarizer(model=models["summarizer"])
+            for kb, text in texts.items():
+                record(
+                    "summarizer/%dkb" % kb,
+                    lambda: summarizer.summarize_tree(text, SUMMARIZER_MIN_LEN, SUMMARIZER_MAX_LEN),
+                    len(text), "chars/s", model_repeat,
+                )
+            del summarizer
+
+        if "asr" in components:
+            from core.infrastructure.asr_service import WhisperLocalTranscriber
+
+            transcriber = WhisperLocalTranscriber(model_name=models["asr"], vad=False)
+            if AUDIO_PIPELINED:
+                run = lambda path: list(transcriber.transcribe_stream(path))
+            else:
+                run = transcriber.transcribe
+            source = os.path.join(settings.BASE_DIR, "english.wav")
+            with tempfile.TemporaryDirectory() as tmp:
+                for seconds in durations:
+                    path = make_audio(os.path.join(tmp, "audio_%ds.wav" % seconds), seconds, source)
+                    record("asr/%ds" % seconds, lambda: run(path), seconds, "audio s/s", model_repeat)
+            del transcriber
+
+        if "pdf" in components:
+            from core.infrastructure.export_service import export_meeting_to_pdf
+
+            actions = ["Send the revised budget to finance"] * 5
+            dates = [{"date": "2026-01-23", "context": "Submit the final report"}] * 5
+            for kb, text in texts.items():
+                record(
+                    "pdf/%dkb" % kb,
+                    lambda: export_meeting_to_pdf(text, "Summary of the meeting.", actions, dates),
+                    len(text), "chars/s", repeat,
+                )
+
+        report = {
+            "meta": {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "models": models,
+                "audio_pipelined": AUDIO_PIPELINED,
+                "repeat": repeat,
+                "model_repeat": model_repeat,
+            },
+            "results": results,
+        }
+        with open(opts["output"], "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        self.stdout.write(self.style.SUCCESS("Results written to %s" % opts["output"]))
+
+        if baseline is None:
+            return
+        if baseline.get("meta", {}).get("models", {}) != models:
+            self.stdout.write(self.style.WARNING("Baseline used different models: %s" % baseline.get("meta", {}).get("models")))
+        problems = compare(report, baseline, opts["max_regression"], opts["max_rss_regression"])
+        if problems:
+            for problem in problems:
+                self.stdout.write(self.style.ERROR("REGRESSION " + problem))
+            raise CommandError("%d regression(s) against %s" % (len(problems), opts["baseline"]))
+        self.stdout.write(self.style.SUCCESS("No regressions against %s" % opts["baseline"]))
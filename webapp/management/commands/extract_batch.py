@@ -0,0 +1,97 @@
+import json
+import os
+import sys
+import time
+from collections import deque
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.application.batch_extraction import extract_batch
+
+
+def _read_documents(path):
+    """
+    Yield (doc_id, text) from a JSONL file ({"id", "text"} per line) or,
+    for a directory, from its *.txt files in sorted order.
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".txt"):
+                with open(os.path.join(path, name), encoding="utf-8") as f:
+                    yield name, f.read()
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                doc = json.loads(line)
+            except ValueError as e:
+                raise CommandError("Line %d is not valid JSON: %s" % (line_no, e))
+            if not isinstance(doc, dict):
+                raise CommandError("Line %d: expected a JSON object, got %s" % (line_no, type(doc).__name__))
+            text = doc.get("text", "")
+            if not isinstance(text, str):
+                raise CommandError("Line %d: \"text\" must be a string, got %s" % (line_no, type(text).__name__))
+            yield doc.get("id", line_no), text
+
+
+class Command(BaseCommand):
+    help = (
+        "Extract action items and dates from many transcripts in parallel "
+        "and write one JSON result per line, in input order."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", help="JSONL file of {\"id\", \"text\"} or a directory of .txt files.")
+        parser.add_argument("-o", "--output", help="Output JSONL file (default: stdout).")
+        parser.add_argument(
+            "--reference-date",
+            help="YYYY-MM-DD used to resolve relative dates (default: today). Fix it for reproducible runs.",
+        )
+        parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+        parser.add_argument("--chunksize", type=int, default=32, help="Documents per task sent to a worker.")
+
+    def handle(self, *args, **opts):
+        if not os.path.exists(opts["input"]):
+            raise CommandError("Input not found: %s" % opts["input"])
+
+        if opts["reference_date"]:
+            try:
+                reference_date = date.fromisoformat(opts["reference_date"])
+            except ValueError:
+                raise CommandError("--reference-date must be YYYY-MM-DD")
+        else:
+            reference_date = date.today()
+
+        ids = deque()  # ids of documents handed out but not yet written
+
+        def texts():
+            for doc_id, text in _read_documents(opts["input"]):
+                ids.append(doc_id)
+                yield text
+
+        out = open(opts["output"], "w", encoding="utf-8") if opts["output"] else sys.stdout
+        started = time.perf_counter()
+        count = 0
+        try:
+            results = extract_batch(
+                texts(),
+                reference_date,
+                workers=opts["workers"],
+                chunksize=opts["chunksize"],
+            )
+            for count, (actions, dates) in enumerate(results, 1):
+                out.write(json.dumps({"id": ids.popleft(), "actions": actions, "dates": dates}) + "\n")
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+        elapsed = time.perf_counter() - started
+        self.stderr.write(
+            "Processed %d documents in %.2fs (%.1f docs/sec), reference date %s"
+            % (count, elapsed, count / elapsed if elapsed else 0.0, reference_date.isoformat())
+        )
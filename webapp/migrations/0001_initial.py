@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+import webapp.models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ProcessingJob",
+            fields=[
+                ("id", models.CharField(default=webapp.models._new_job_id, editable=False, max_length=32, primary_key=True, serialize=False)),
+                ("kind", models.CharField(choices=[("audio", "Audio"), ("text", "Text")], max_length=8)),
+                ("status", models.CharField(choices=[("queued", "Queued"), ("running", "Running"), ("done", "Done"), ("failed", "Failed")], db_index=True, default="queued", max_length=8)),
+                ("input_path", models.CharField(blank=True, default="", max_length=512)),
+                ("input_text", models.TextField(blank=True, default="")),
+                ("stage", models.CharField(blank=True, default="", max_length=32)),
+                ("progress_done", models.PositiveIntegerField(default=0)),
+                ("progress_total", models.PositiveIntegerField(default=0)),
+                ("result", models.JSONField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["created_at"],
+            },
+        ),
+    ]
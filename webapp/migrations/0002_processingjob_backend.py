@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("webapp", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="processingjob",
+            name="backend",
+            field=models.CharField(blank=True, default="", max_length=16),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+import webapp.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("webapp", "0002_processingjob_backend"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MeetingResult",
+            fields=[
+                ("id", models.CharField(default=webapp.models._new_result_id, editable=False, max_length=12, primary_key=True, serialize=False)),
+                ("summary", models.TextField(blank=True, default="")),
+                ("actions", models.JSONField(default=list)),
+                ("dates", models.JSONField(default=list)),
+                ("transcript_data", models.BinaryField(default=b"")),
+                ("transcript_compressed", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("expires_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "ordering": ["created_at"],
+            },
+        ),
+    ]
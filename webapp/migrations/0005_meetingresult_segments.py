@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("webapp", "0004_meetingresult_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="meetingresult",
+            name="segments",
+            field=models.JSONField(default=list),
+        ),
+    ]
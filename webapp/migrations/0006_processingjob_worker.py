@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("webapp", "0005_meetingresult_segments"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="processingjob",
+            name="worker",
+            field=models.CharField(blank=True, db_index=True, default="", max_length=32),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("webapp", "0006_processingjob_worker"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="meetingresult",
+            name="source",
+            field=models.CharField(blank=True, default="", max_length=8),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+def reset_content_hash(apps, schema_editor):
+    # The hash now covers segments and source; stored values are
+    # recomputed on the next export (webapp.results.content_hash).
+    apps.get_model("webapp", "MeetingResult").objects.update(content_hash="")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("webapp", "0007_meetingresult_source"),
+    ]
+
+    operations = [
+        migrations.RunPython(reset_content_hash, migrations.RunPython.noop),
+    ]
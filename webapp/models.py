@@ -0,0 +1,112 @@
+import secrets
+import uuid
+import zlib
+
+from django.db import models
+
+
+def _new_job_id() -> str:
+    return uuid.uuid4().hex
+
+
+class ProcessingJob(models.Model):
+    """
+    A queued transcription/summarisation request (see webapp/jobs.py).
+    """
+
+    KIND_AUDIO = "audio"
+    KIND_TEXT = "text"
+    KIND_CHOICES = [(KIND_AUDIO, "Audio"), (KIND_TEXT, "Text")]
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    id = models.CharField(primary_key=True, max_length=32, default=_new_job_id, editable=False)
+    kind = models.CharField(max_length=8, choices=KIND_CHOICES)
+    status = models.CharField(max_length=8, choices=STATUS_CHOICES, default=STATUS_QUEUED, db_index=True)
+
+    # Input: temp audio path or raw text
+    input_path = models.CharField(max_length=512, blank=True, default="")
+    input_text = models.TextField(blank=True, default="")
+    backend = models.CharField(max_length=16, blank=True, default="")  # "" = SUMMARIZER_BACKEND
+
+    # Progress: stage + "chunk i of n"
+    stage = models.CharField(max_length=32, blank=True, default="")
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(default=0)
+
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    worker = models.CharField(max_length=32, blank=True, default="", db_index=True)  # owning process (jobs.WORKER_ID)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["created_at"]
+
+    def as_dict(self) -> dict:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": {"done": self.progress_done, "total": self.progress_total},
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+        if self.status == self.STATUS_DONE or (self.status == self.STATUS_RUNNING and self.result):
+            # While running, result may hold a draft ({"draft": true, ...})
+            data["result"] = self.result
+        if self.status == self.STATUS_FAILED:
+            data["error"] = self.error
+        return data
+
+
+def _new_result_id() -> str:
+    return secrets.token_hex(6)
+
+
+class MeetingResult(models.Model):
+    """
+    Processed meeting (see webapp/results.py). Sessions keep only the ID;
+    the transcript is stored zlib-compressed once it exceeds
+    RESULT_STORE_COMPRESS_MIN_CHARS and is only read when accessed.
+    """
+
+    id = models.CharField(primary_key=True, max_length=12, default=_new_result_id, editable=False)
+    summary = models.TextField(blank=True, default="")
+    actions = models.JSONField(default=list)
+    dates = models.JSONField(default=list)
+    segments = models.JSONField(default=list)  # [{"start", "end", "text"}] when timestamps are known
+    source = models.CharField(max_length=8, blank=True, default="")  # "audio" / "text" ("" = unknown)
+
+    transcript_data = models.BinaryField(default=b"")
+    transcript_compressed = models.BooleanField(default=False)
+    content_hash = models.CharField(max_length=64, blank=True, default="")  # keys cached exports
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ["created_at"]
+
+    @property
+    def transcript(self) -> str:
+        data = bytes(self.transcript_data)
+        if self.transcript_compressed:
+            data = zlib.decompress(data)
+        return data.decode("utf-8")
+
+    def set_transcript(self, text: str, compress_min_chars: int) -> None:
+        data = text.encode("utf-8")
+        self.transcript_compressed = len(text) >= compress_min_chars
+        self.transcript_data = zlib.compress(data, 6) if self.transcript_compressed else data
@@ -0,0 +1,101 @@
+"""
+Server-side store for processed meetings.
+
+Results are saved once as MeetingResult rows and the session only keeps
+the short result ID, so session reads/writes stay constant-size however
+long the meeting was. Expired results (RESULT_STORE_TTL_S) are deleted
+opportunistically, at most once per RESULT_STORE_PURGE_INTERVAL_S.
+"""
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.http import HttpRequest
+from django.utils import timezone
+
+from core.application.orchestrator import meeting_content_hash
+from .models import MeetingResult
+
+logger = logging.getLogger(__name__)
+
+SESSION_KEY = "result_id"
+
+_purge_lock = threading.Lock()
+_last_purge = 0.0
+
+
+def purge_expired() -> int:
+    """Delete expired results; returns how many were removed."""
+    deleted, _ = MeetingResult.objects.filter(expires_at__lt=timezone.now()).delete()
+    if deleted:
+        logger.info("Purged %d expired meeting results", deleted)
+    return deleted
+
+
+def _maybe_purge() -> None:
+    global _last_purge
+    now = time.monotonic()
+    with _purge_lock:
+        if now - _last_purge < settings.RESULT_STORE_PURGE_INTERVAL_S:
+            return
+        _last_purge = now
+    purge_expired()
+
+
+def save_result(
+    transcript: str,
+    summary: str,
+    actions: List[str],
+    dates: List[Dict[str, str]],
+    segments: Optional[List[Dict[str, Any]]] = None,
+    source: str = "",
+) -> MeetingResult:
+    _maybe_purge()
+    result = MeetingResult(
+        summary=summary,
+        actions=actions,
+        dates=dates,
+        segments=segments or [],
+        source=source,
+        expires_at=timezone.now() + timedelta(seconds=settings.RESULT_STORE_TTL_S),
+    )
+    result.set_transcript(transcript, settings.RESULT_STORE_COMPRESS_MIN_CHARS)
+    result.content_hash = meeting_content_hash(transcript, summary, actions, dates, result.segments, source)
+    result.save()
+    return result
+
+
+def content_hash(result: MeetingResult) -> str:
+    """Stored content hash; computed (and saved) for rows that predate it."""
+    if not result.content_hash:
+        result.content_hash = meeting_content_hash(
+            result.transcript, result.summary, result.actions, result.dates, result.segments, result.source
+        )
+        MeetingResult.objects.filter(pk=result.pk).update(content_hash=result.content_hash)
+    return result.content_hash
+
+
+def get_result(result_id: str) -> Optional[MeetingResult]:
+    """
+    Unexpired result or None. The transcript is not read here; it is
+    loaded on first access to ``result.transcript``.
+    """
+    return (
+        MeetingResult.objects.defer("transcript_data")
+        .filter(pk=result_id, expires_at__gte=timezone.now())
+        .first()
+    )
+
+
+def remember(request: HttpRequest, result_id: str) -> None:
+    """Point the session at a stored result (for PDF export)."""
+    if request.session.get(SESSION_KEY) != result_id:
+        request.session[SESSION_KEY] = result_id
+
+
+def session_result(request: HttpRequest) -> Optional[MeetingResult]:
+    result_id = request.session.get(SESSION_KEY)
+    return get_result(result_id) if result_id else None
@@ -4,5 +4,15 @@ from . import views
 urlpatterns = [
     path("", views.index, name="index"),
     path("export_pdf/", views.export_pdf, name="export_pdf"),
+    path("export/", views.export_pdf, name="export"),  # ?format=pdf|json|md|html|srt|vtt
     path("record/", views.record_audio, name="record_audio"),  # live recording API
+    path("jobs/", views.job_submit, name="job_submit"),  # background processing
+    path("jobs/<str:job_id>/", views.job_status, name="job_status"),
+    path("status/models/", views.model_status, name="model_status"),
+    path("live/", views.live_start, name="live_start"),  # incremental live recording
+    path("live/upload/", views.live_upload, name="live_upload"),
+    path("live/<str:session_id>/", views.live_status, name="live_status"),
+    path("live/<str:session_id>/events/", views.live_events, name="live_events"),  # SSE (ASGI)
+    path("live/<str:session_id>/chunk/", views.live_chunk, name="live_chunk"),
+    path("live/<str:session_id>/stop/", views.live_stop, name="live_stop"),
 ]
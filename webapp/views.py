@@ -1,76 +1,104 @@
+import asyncio
+import json
 import logging
 import os
 import tempfile
-from typing import List, Dict
+from typing import Dict
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.views.decorators.csrf import csrf_exempt
 
-from .forms import MeetingForm
+from .forms import BACKEND_CHOICES, MeetingForm
+from .jobs import QueueFullError, submit_audio, submit_text
+from .models import ProcessingJob
+from .results import content_hash, remember, save_result, session_result
 from core.application.orchestrator import (
-    summarize_from_text,
-    process_audio,
-    generate_pdf_bytes,
+    cached_pdf_file,
+    export_cache_stats,
+    export_format,
+    export_key,
+    meeting_content_hash,
+    stream_export,
+    model_stats,
+    cache_stats,
+    batching_stats,
+    start_live_session,
+    add_live_chunk,
+    live_session_state,
+    stop_live_session,
+    start_live_upload,
+    subscribe_live_session,
+    unsubscribe_live_session,
 )
+from core.application.live_session import SessionLimitError
 
 logger = logging.getLogger(__name__)
 
 
+def _queue_audio(audio_file, backend: str, default_suffix: str) -> ProcessingJob:
+    """Copy an upload to a temp file (removed by the job) and queue it."""
+    # Use default OS temp folder (fix for OneDrive)
+    tmp_suffix = os.path.splitext(audio_file.name)[1] or default_suffix
+    with tempfile.NamedTemporaryFile(suffix=tmp_suffix, delete=False) as tmp:
+        for chunk in audio_file.chunks():
+            tmp.write(chunk)
+        tmp_path = tmp.name
+
+    try:
+        return submit_audio(tmp_path, backend)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+
+def _wants_json(request: HttpRequest) -> bool:
+    return "application/json" in request.headers.get("Accept", "")
+
+
 def index(request: HttpRequest) -> HttpResponse:
     """
     Main UI:
     - Upload audio or provide text
-    - ASR + summarization + extraction
+    - Queued as a background job (ASR + summarization + extraction);
+      the page polls job_status for progress and results
     """
-    transcript = ""
-    summary = ""
-    actions: List[str] = []
-    dates: List[Dict[str, str]] = []
+    job_id = ""
 
     if request.method == "POST":
         form = MeetingForm(request.POST, request.FILES)
         if form.is_valid():
             text = form.cleaned_data.get("text_input") or ""
             audio_file = form.cleaned_data.get("audio_file")
+            backend = form.cleaned_data.get("summary_backend") or ""
 
             try:
                 if audio_file:
-                    # Use default OS temp folder (fix for OneDrive)
-                    tmp_suffix = os.path.splitext(audio_file.name)[1] or ".tmp"
-                    with tempfile.NamedTemporaryFile(
-                        suffix=tmp_suffix, delete=False
-                    ) as tmp:
-                        for chunk in audio_file.chunks():
-                            tmp.write(chunk)
-                        tmp_path = tmp.name
-
-                    logger.info("Processing uploaded audio: %s", tmp_path)
-                    transcript, summary, actions, dates = process_audio(tmp_path)
-
-                    # Remove temp file after processing
-                    try:
-                        os.remove(tmp_path)
-                    except Exception:
-                        logger.warning("Could not delete temp file: %s", tmp_path)
-
+                    job = _queue_audio(audio_file, backend, ".tmp")
                 else:
-                    # Text-only mode
-                    transcript = text
-                    summary, actions, dates = summarize_from_text(text)
-
-                # Save results to session for PDF download
-                request.session["transcript"] = transcript
-                request.session["summary"] = summary
-                request.session["actions"] = actions
-                request.session["dates"] = dates
+                    job = submit_text(text, backend)
+                logger.info("Queued %s job %s", job.kind, job.pk)
+                if _wants_json(request):
+                    return JsonResponse({"job_id": job.pk, "status": job.status}, status=202)
+                job_id = job.pk
 
+            except QueueFullError as e:
+                if _wants_json(request):
+                    return JsonResponse({"error": str(e)}, status=503)
+                form.add_error(None, str(e))
             except Exception as e:
-                logger.exception("Error during processing: %s", e)
+                logger.exception("Error queueing job: %s", e)
+                if _wants_json(request):
+                    return JsonResponse({"error": str(e)}, status=500)
                 form.add_error(None, f"Error during processing: {e}")
-        else:
-            pass
+        elif _wants_json(request):
+            errors = [e for field_errors in form.errors.values() for e in field_errors]
+            return JsonResponse({"error": " ".join(errors)}, status=400)
     else:
         form = MeetingForm()
 
@@ -79,32 +107,72 @@ def index(request: HttpRequest) -> HttpResponse:
         "webapp/index.html",
         {
             "form": form,
-            "transcript": transcript,
-            "summary": summary,
-            "actions": actions,
-            "dates": dates,
+            "job_id": job_id,  # after a plain (non-fetch) POST the page polls it on load
+            # Server-sent events only stream under ASGI (uvicorn)
+            "live_events": isinstance(request, ASGIRequest),
         },
     )
 
 
 def export_pdf(request: HttpRequest) -> HttpResponse:
-    """Generate PDF from session data"""
-    transcript = request.session.get("transcript", "")
-    summary = request.session.get("summary", "")
-    actions = request.session.get("actions", [])
-    dates = request.session.get("dates", [])
+    """
+    Export the session's stored result; ``?format=`` pdf (default), json,
+    md, html, srt or vtt. PDFs are rendered once per content and layout
+    version, then served from the export cache; other formats are
+    generated while streaming. The export key is also the ETag, so
+    unchanged downloads are answered with 304.
+    """
+    fmt = request.GET.get("format", "pdf").lower()
+    try:
+        exporter = export_format(fmt)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    result = session_result(request)
+    if result is None:
+        key = meeting_content_hash("", "", [], [])
+        load = lambda: ("", "", [], [])
+    else:
+        key = content_hash(result)
+        load = lambda: (result.transcript, result.summary, result.actions, result.dates)
 
-    pdf_bytes = generate_pdf_bytes(transcript, summary, actions, dates)
+    etag = quote_etag(export_key(key, fmt))
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        return not_modified
 
-    response = HttpResponse(pdf_bytes, content_type="application/pdf")
-    response["Content-Disposition"] = 'attachment; filename="meeting_summary.pdf"'
+    filename = "meeting_summary.%s" % exporter.extension
+    if fmt == "pdf":
+        # Streamed from the cache file (closed by the response), not held in memory
+        response = FileResponse(
+            cached_pdf_file(key, load),
+            as_attachment=True,
+            filename=filename,
+            content_type=exporter.content_type,
+        )
+    else:
+        transcript, summary, actions, dates = load()
+        meeting = {
+            "transcript": transcript,
+            "summary": summary,
+            "actions": actions,
+            "dates": dates,
+            "segments": result.segments if result is not None else [],
+            "source": result.source if result is not None else "",
+        }
+        response = StreamingHttpResponse(stream_export(fmt, meeting), content_type=exporter.content_type)
+        response["Content-Disposition"] = 'attachment; filename="%s"' % filename
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"  # always revalidate
     return response
 
 
 @csrf_exempt
 def record_audio(request: HttpRequest) -> HttpResponse:
     """
-    Endpoint for live audio recording via JS fetch() POST
+    Endpoint for live audio recording via JS fetch() POST. The recording
+    is queued as a background job; poll job_status with the returned ID.
     """
     if request.method != "POST":
         return JsonResponse({"error": "POST required"}, status=405)
@@ -112,32 +180,233 @@ def record_audio(request: HttpRequest) -> HttpResponse:
     if "audio" not in request.FILES:
         return JsonResponse({"error": "No audio file provided"}, status=400)
 
-    audio_file = request.FILES["audio"]
+    try:
+        job = _queue_audio(request.FILES["audio"], request.POST.get("backend", ""), ".webm")
+    except QueueFullError as e:
+        return JsonResponse({"error": str(e)}, status=503)
+    except Exception as e:
+        logger.exception("Error during live recording processing: %s", e)
+        return JsonResponse({"error": str(e)}, status=500)
+
+    logger.info("Queued live-recorded audio as job %s", job.pk)
+    return JsonResponse({"job_id": job.pk, "status": job.status}, status=202)
+
+
+@csrf_exempt
+def job_submit(request: HttpRequest) -> HttpResponse:
+    """
+    Queue audio ("audio" file) or text ("text" field) for background
+    processing. Returns the job ID immediately; poll job_status for
+    progress and results. Optional "backend": "bart" or "extractive".
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "POST required"}, status=405)
+
+    audio_file = request.FILES.get("audio")
+    text = request.POST.get("text", "")
+    backend = request.POST.get("backend", "")
+
+    if backend and backend not in dict(BACKEND_CHOICES):
+        return JsonResponse({"error": "Unknown backend: %s" % backend}, status=400)
+
+    if not audio_file and not text.strip():
+        return JsonResponse({"error": "No audio file or text provided"}, status=400)
+
+    if audio_file and audio_file.size > settings.MAX_AUDIO_FILE_SIZE_MB * 1024 * 1024:
+        return JsonResponse(
+            {"error": "Audio file is too large (max %d MB)." % settings.MAX_AUDIO_FILE_SIZE_MB},
+            status=400,
+        )
 
     try:
-        # Save to system TEMP (fix)
-        with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as tmp:
-            for chunk in audio_file.chunks():
-                tmp.write(chunk)
-            tmp_path = tmp.name
+        if audio_file:
+            job = _queue_audio(audio_file, backend, ".webm")
+        else:
+            job = submit_text(text, backend)
 
-        logger.info("Processing live-recorded audio: %s", tmp_path)
-        transcript, summary, actions, dates = process_audio(tmp_path)
+    except QueueFullError as e:
+        return JsonResponse({"error": str(e)}, status=503)
+
+    logger.info("Queued %s job %s", job.kind, job.pk)
+    return JsonResponse({"job_id": job.pk, "status": job.status}, status=202)
+
+
+def job_status(request: HttpRequest, job_id: str) -> HttpResponse:
+    """Status, progress (stage, i of n) and, once done, the results."""
+    try:
+        job = ProcessingJob.objects.get(pk=job_id)
+    except ProcessingJob.DoesNotExist:
+        return JsonResponse({"error": "Unknown job"}, status=404)
+
+    data = job.as_dict()
+    if job.status == ProcessingJob.STATUS_DONE and job.result and job.result.get("result_id"):
+        # Keep PDF export working for results delivered via jobs
+        remember(request, job.result["result_id"])
+    return JsonResponse(data)
+
+
+def model_status(request: HttpRequest) -> HttpResponse:
+    """Loaded models (load time, resident size, usage), cache and batching counters."""
+    return JsonResponse({
+        "models": model_stats(),
+        "result_cache": cache_stats(),
+        "export_cache": export_cache_stats(),
+        "summarizer_batching": batching_stats(),
+    })
+
+
+@csrf_exempt
+def live_start(request: HttpRequest) -> HttpResponse:
+    """Open a live recording session; audio chunks follow via live_chunk."""
+    if request.method != "POST":
+        return JsonResponse({"error": "POST required"}, status=405)
+    try:
+        session_id = start_live_session()
+    except SessionLimitError as e:
+        return JsonResponse({"error": str(e)}, status=503)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=500)
+    return JsonResponse({"session_id": session_id}, status=201)
+
+
+# The live endpoints below are async so that, under ASGI, slow calls run on
+# worker threads instead of the single thread shared by sync views.
+# (csrf_exempt cannot wrap async views before Django 5.0, hence the attribute.)
+
+async def live_chunk(request: HttpRequest, session_id: str) -> HttpResponse:
+    """
+    Next recorder chunk ("audio" file, "seq" = 0, 1, 2, ...). Returns the
+    running transcript, actions, dates and partial summaries.
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "POST required"}, status=405)
+    if "audio" not in request.FILES:
+        return JsonResponse({"error": "No audio chunk provided"}, status=400)
+    try:
+        seq = int(request.POST.get("seq", ""))
+    except ValueError:
+        return JsonResponse({"error": "seq must be an integer"}, status=400)
+
+    try:
+        state = await sync_to_async(add_live_chunk, thread_sensitive=False)(
+            session_id, seq, request.FILES["audio"].read()
+        )
+    except KeyError:
+        return JsonResponse({"error": "Unknown session"}, status=404)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=409)
+    return JsonResponse(state)
+
+
+live_chunk.csrf_exempt = True
+
+
+def live_status(request: HttpRequest, session_id: str) -> HttpResponse:
+    """Running state of a live session."""
+    try:
+        return JsonResponse(live_session_state(session_id))
+    except KeyError:
+        return JsonResponse({"error": "Unknown session"}, status=404)
+
+
+async def live_stop(request: HttpRequest, session_id: str) -> HttpResponse:
+    """Stop recording and return the final results."""
+    if request.method != "POST":
+        return JsonResponse({"error": "POST required"}, status=405)
+    try:
+        state = await sync_to_async(stop_live_session, thread_sensitive=False)(session_id)
+    except KeyError:
+        return JsonResponse({"error": "Unknown session"}, status=404)
+
+    result = state.get("result")
+    if result:
+        # Keep PDF export working for live recordings
+        result_id = await sync_to_async(_store_result_in_session)(request, result)
+        state["result"] = dict(result, result_id=result_id)
+    return JsonResponse(state)
 
-        try:
-            os.remove(tmp_path)
-        except Exception:
-            logger.warning("Could not delete temp file: %s", tmp_path)
 
+live_stop.csrf_exempt = True
+
+
+def _store_result_in_session(request: HttpRequest, result: Dict) -> str:
+    result_id = save_result(
+        result["transcript"], result["summary"], result["actions"], result["dates"], result.get("segments"),
+        source="audio",
+    ).pk
+    remember(request, result_id)
+    return result_id
+
+
+async def live_upload(request: HttpRequest) -> HttpResponse:
+    """
+    Process an uploaded recording ("audio" file) as a live session.
+    Returns the session ID at once; follow live_events for the results.
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "POST required"}, status=405)
+    audio_file = request.FILES.get("audio")
+    if not audio_file:
+        return JsonResponse({"error": "No audio file provided"}, status=400)
+    if audio_file.size > settings.MAX_AUDIO_FILE_SIZE_MB * 1024 * 1024:
         return JsonResponse(
-            {
-                "transcript": transcript,
-                "summary": summary,
-                "actions": actions,
-                "dates": dates,
-            }
+            {"error": "Audio file is too large (max %d MB)." % settings.MAX_AUDIO_FILE_SIZE_MB},
+            status=400,
         )
 
-    except Exception as e:
-        logger.exception("Error during live recording processing: %s", e)
+    try:
+        session_id = await sync_to_async(start_live_upload, thread_sensitive=False)(audio_file.read())
+    except SessionLimitError as e:
+        return JsonResponse({"error": str(e)}, status=503)
+    except ValueError as e:
         return JsonResponse({"error": str(e)}, status=500)
+    return JsonResponse({"session_id": session_id}, status=202)
+
+
+live_upload.csrf_exempt = True
+
+
+def _sse(event: str, data: Dict) -> str:
+    return "event: %s\ndata: %s\n\n" % (event, json.dumps(data))
+
+
+async def live_events(request: HttpRequest, session_id: str) -> HttpResponse:
+    """
+    Server-sent events for a live session: "snapshot" (state so far),
+    then "segment", "extraction", "partial_summary" and finally "done"
+    or "failed". Model work stays on the session's worker thread; this
+    coroutine only waits on a queue, so one ASGI server can hold many
+    open streams.
+    """
+    loop = asyncio.get_running_loop()
+    events: "asyncio.Queue" = asyncio.Queue()
+
+    def listener(kind: str, data: Dict) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, (kind, data))
+
+    try:
+        snapshot = subscribe_live_session(session_id, listener)
+    except KeyError:
+        return JsonResponse({"error": "Unknown session"}, status=404)
+
+    async def stream():
+        try:
+            yield _sse("snapshot", snapshot)
+            if snapshot["status"] in ("done", "failed"):
+                return
+            while True:
+                try:
+                    kind, data = await asyncio.wait_for(events.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse(kind, data)
+                if kind in ("done", "failed"):
+                    return
+        finally:
+            unsubscribe_live_session(session_id, listener)
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response